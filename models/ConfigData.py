@@ -1,7 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
+import math
+import os
+from typing import Callable
 
 from .utils import update_dataclass_from_dict
+from .crs_registry import find_invalid_resource_crs
+from .LazyResourcesDict import LazyResourcesDict
+from .hashing import hash_yaml_data
+from .tracing import traced
+from .yaml_events import iter_yaml_config
+from .yaml_splice import ConfigLayout, scan_config_layout, splice_config_data
 from .top_level import (
     ServerConfig,
     LoggingConfig,
@@ -12,6 +22,106 @@ from .top_level.utils import InlineList, bbox_from_list
 from .top_level.providers import ProviderTemplate
 from .top_level.providers.records import ProviderTypes
 
+# number of resources from which the parallel decoding is worth the process pool overhead
+PARALLEL_DECODE_THRESHOLD = 2000
+
+
+def decode_resource(
+    resource_instance_name: str, resource_data: dict
+) -> tuple[ResourceConfigTemplate, tuple[list[str], list[str], list[str]]]:
+    """Deserialize a single resource entry.
+    Return the new ResourceConfigTemplate and the lists of defaults used, wrong types and all missing properties.
+    """
+
+    # Create a new ResourceConfigTemplate instance and update with available values
+    new_resource_item = ResourceConfigTemplate(instance_name=resource_instance_name)
+    defaults_resource, wrong_types_resource, all_missing_props_resource = (
+        update_dataclass_from_dict(
+            new_resource_item,
+            resource_data,
+            f"resources.{resource_instance_name}",
+        )
+    )
+
+    # Exceptional check: verify that all list items of BBox are integers, and len(list)=4 or 6
+    if not new_resource_item.validate_reassign_bbox():
+        wrong_types_resource.append(
+            f"resources.{resource_instance_name}.extents.spatial.bbox"
+        )
+
+    # reorder providers to move read-only to the end of the list (as shown in the Resource UI)
+    new_resource_item.providers.sort(key=lambda x: isinstance(x, dict))
+
+    return new_resource_item, (
+        defaults_resource,
+        wrong_types_resource,
+        all_missing_props_resource,
+    )
+
+
+def _decode_resources_chunk(chunk: list[tuple[str, dict]]) -> list[tuple]:
+    """Process pool worker: deserialize a chunk of (name, raw data) resource entries."""
+    return [
+        (
+            resource_instance_name,
+            *decode_resource(resource_instance_name, resource_data),
+        )
+        for resource_instance_name, resource_data in chunk
+    ]
+
+
+def decode_resources_parallel(
+    raw_items: list[tuple[str, dict]], max_workers: int | None = None
+) -> list[tuple[str, ResourceConfigTemplate, tuple[list[str], list[str], list[str]]]]:
+    """Deserialize resource entries in a process pool, return (name, resource, report) in the original order.
+    Note: not usable where the child processes cannot re-import the plugin (e.g. 'spawn' from a QGIS executable).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    # several chunks per worker to balance the load, but not too small to limit pickling overhead
+    chunk_size = max(1, math.ceil(len(raw_items) / (max_workers * 4)))
+    chunks = [
+        raw_items[i : i + chunk_size] for i in range(0, len(raw_items), chunk_size)
+    ]
+
+    decoded_items = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # executor.map returns the results in the order of submitted chunks
+        for decoded_chunk in executor.map(_decode_resources_chunk, chunks):
+            decoded_items.extend(decoded_chunk)
+    return decoded_items
+
+
+def _provider_index(providers: list, provider) -> int:
+    # by identity: providers with the same type and name (or equal values) are different entries
+    for i, res_provider in enumerate(providers):
+        if res_provider is provider:
+            return i
+    return -1
+
+
+TOP_LEVEL_SECTIONS = ("server", "logging", "metadata")
+
+
+@dataclass
+class ReloadChanges:
+    """Parts of ConfigData replaced on reload: names of top level properties and resources."""
+
+    sections: list[str] = field(default_factory=list)
+    added_resources: list[str] = field(default_factory=list)
+    changed_resources: list[str] = field(default_factory=list)
+    removed_resources: list[str] = field(default_factory=list)
+    # any resource added, removed or reordered
+    resources_list_changed: bool = False
+
+    def is_empty(self) -> bool:
+        return not (
+            self.sections
+            or self.added_resources
+            or self.changed_resources
+            or self.removed_resources
+            or self.resources_list_changed
+        )
+
 
 @dataclass(kw_only=True)
 class ConfigData:
@@ -23,111 +133,379 @@ class ConfigData:
     server: ServerConfig = field(default_factory=lambda: ServerConfig())
     logging: LoggingConfig = field(default_factory=lambda: LoggingConfig())
     metadata: MetadataConfig = field(default_factory=lambda: MetadataConfig())
-    resources: dict[str, ResourceConfigTemplate] = field(default_factory=lambda: {})
+    resources: LazyResourcesDict[str, ResourceConfigTemplate] = field(
+        default_factory=lambda: LazyResourcesDict()
+    )
 
-    def set_data_from_yaml(self, dict_content: dict):
-        """Parse YAML file content and overwride .config_data properties where available."""
+    @traced()
+    def set_data_from_yaml(self, dict_content: dict, parallel: bool = False):
+        """Parse YAML file content and overwride .config_data properties where available.
+        Resources are deserialized on first access, unless parallel=True: then they are all
+        decoded right away, in a process pool if the config is large enough.
+        """
 
-        # Read the content of the YAML file for each of the top level properties
-        server_config = dict_content.get("server", {})
-        logging_config = dict_content.get("logging", {})
-        metadata_config = dict_content.get("metadata", {})
-        resources_config = dict_content.get("resources", {})
-        resources_dict_list = [{k: v} for k, v in resources_config.items()]
+        # add dynamic properties, so that they are not included in asdict()
+        # ideally, we should overwrite the __init__ method, but it is not so important property
+        self._section_reports = {}
+        self._section_hashes = {}
+        # no source text to splice into when saving
+        self._set_source_text(None)
 
         # Update the dataclass properties with the new values
         # keep track of missing values of wrong types (replaced with defaults)
-        default_fields = []
-        wrong_types = []
-        all_missing_props = []
+        for section_name in TOP_LEVEL_SECTIONS:
+            self._decode_section(section_name, dict_content.get(section_name, {}))
 
-        defaults_server, wrong_types_server, all_missing_props_server = (
-            update_dataclass_from_dict(self.server, server_config, "server")
-        )
+        # store raw resource data, it is only deserialized when accessed (preview, editing, validation, saving)
+        resources_config = dict_content.get("resources", {})
+        self.resources = LazyResourcesDict(self._decode_resource)
+        self._resource_reports = {}
+        self._resource_hashes = {}
+        for resource_instance_name, resource_data in resources_config.items():
+            self._set_raw_resource(resource_instance_name, resource_data)
 
-        defaults_logging, wrong_types_logging, all_missing_props_logging = (
-            update_dataclass_from_dict(self.logging, logging_config, "logging")
-        )
+        if parallel:
+            self.decode_resources(parallel=True)
+
+    @traced()
+    def set_data_from_yaml_stream(
+        self,
+        stream,
+        decode_resources: bool = True,
+        progress: Callable[[int, int], None] | None = None,
+    ):
+        """Parse YAML (file object or string) and overwride .config_data properties where available.
+        The file is read one top level property / resource at a time: with decode_resources=True,
+        each resource is deserialized as soon as it is read and its raw data is released,
+        so that the raw data tree of the whole file is never kept in memory.
+        progress(position, length) is called after each entry (see iter_yaml_config).
+        """
+
+        # add dynamic properties, so that they are not included in asdict()
+        self._section_reports = {}
+        self._section_hashes = {}
+        # text read from a string is kept: entries not modified are copied from it when saving
+        self._set_source_text(stream if isinstance(stream, str) else None)
+        self.resources = LazyResourcesDict(self._decode_resource)
+        self._resource_reports = {}
+        self._resource_hashes = {}
+
+        for path, value in iter_yaml_config(stream, progress=progress):
+            if path[0] in TOP_LEVEL_SECTIONS:
+                self._decode_section(path[0], value)
+            elif path[0] == "resources":
+                # resources yielded one by one, or as a whole if they could not be streamed
+                resources_config = {path[1]: value} if len(path) == 2 else value
+                for resource_instance_name, resource_data in resources_config.items():
+                    self._set_raw_resource(resource_instance_name, resource_data)
+                    if decode_resources:
+                        self.resources[resource_instance_name]
+
+        # top level properties missing in the file: all values replaced by defaults
+        for section_name in TOP_LEVEL_SECTIONS:
+            if section_name not in self._section_reports:
+                self._decode_section(section_name, {})
 
-        defaults_metadata, wrong_types_metadata, all_missing_props_metadata = (
-            update_dataclass_from_dict(self.metadata, metadata_config, "metadata")
+    def _decode_section(self, section_name: str, section_data: dict):
+        """Update the top level property (e.g. 'server') from the YAML data, record its report and hash."""
+        report = update_dataclass_from_dict(
+            getattr(self, section_name), section_data, section_name
         )
+        self._section_reports[section_name] = report
+        self._section_hashes[section_name] = hash_yaml_data(section_data)
+        self._record_source_hash((section_name,), getattr(self, section_name), report)
 
-        default_fields.extend(defaults_server)
-        default_fields.extend(defaults_logging)
-        default_fields.extend(defaults_metadata)
-        wrong_types.extend(wrong_types_server)
-        wrong_types.extend(wrong_types_logging)
-        wrong_types.extend(wrong_types_metadata)
-        all_missing_props.extend(all_missing_props_server)
-        all_missing_props.extend(all_missing_props_logging)
-        all_missing_props.extend(all_missing_props_metadata)
-
-        self.resources = {}
-        for res_config in resources_dict_list:
-            if isinstance(res_config, dict):
-                resource_instance_name = next(iter(res_config))
-                resource_data = res_config[resource_instance_name]
-
-                # Create a new ResourceConfigTemplate instance and update with available values
-                new_resource_item = ResourceConfigTemplate(
-                    instance_name=resource_instance_name
-                )
-                defaults_resource, wrong_types_resource, all_missing_props_resource = (
-                    update_dataclass_from_dict(
-                        new_resource_item,
-                        resource_data,
-                        f"resources.{resource_instance_name}",
-                    )
-                )
-                default_fields.extend(defaults_resource)
-                wrong_types.extend(wrong_types_resource)
-                all_missing_props.extend(all_missing_props_resource)
+    def _set_raw_resource(self, resource_instance_name: str, resource_data: dict):
+        """Store the resource YAML data to be deserialized on first access, record its hash."""
+
+        # reserve the report slot to keep the messages in the file order
+        self._resource_reports[resource_instance_name] = None
+        self._resource_hashes[resource_instance_name] = hash_yaml_data(resource_data)
+        self._source_hashes.pop(("resources", resource_instance_name), None)
+        if isinstance(resource_data, dict):
+            self.resources.set_raw(resource_instance_name, resource_data)
+        else:
+            # not decodable lazily: fail (or report) immediately, like the rest of the file
+            self.resources[resource_instance_name] = self._decode_resource(
+                resource_instance_name, resource_data
+            )
+
+    def reload_from_yaml(
+        self, dict_content: dict, source_text: str | None = None
+    ) -> "ReloadChanges":
+        """Update ConfigData from the changed YAML file content (e.g. modified by another program).
+        Only the top level properties and resources which changed since the last read/save are replaced,
+        the others are kept as they are (including the changes not saved yet).
+        source_text is the new file content, to splice into when saving.
+        """
+        if not hasattr(self, "_section_hashes"):
+            self.set_data_from_yaml(dict_content)
+            self._set_source_text(source_text)
+            return ReloadChanges(
+                sections=list(TOP_LEVEL_SECTIONS),
+                added_resources=list(self.resources),
+                resources_list_changed=True,
+            )
 
-                # Exceptional check: verify that all list items of BBox are integers, and len(list)=4 or 6
-                if not new_resource_item.validate_reassign_bbox():
-                    wrong_types.append(
-                        f"resources.{resource_instance_name}.extents.spatial.bbox"
-                    )
+        # unchanged entries keep their hashes: their data is the same in the new text
+        self._set_source_text(source_text, keep_hashes=source_text is not None)
 
-                # reorder providers to move read-only to the end of the list
-                # this is needed to not accidentally match read-only providers when deleting a provider
-                new_resource_item.providers.sort(key=lambda x: isinstance(x, dict))
+        changes = ReloadChanges()
+        for section_name in TOP_LEVEL_SECTIONS:
+            section_data = dict_content.get(section_name, {})
+            if hash_yaml_data(section_data) != self._section_hashes.get(section_name):
+                # start from a new instance to not keep the values removed from the file
+                setattr(self, section_name, type(getattr(self, section_name))())
+                self._decode_section(section_name, section_data)
+                changes.sections.append(section_name)
 
-                self.resources[resource_instance_name] = new_resource_item
+        resources_config = dict_content.get("resources", {})
+        old_resource_names = list(self.resources)
+        # resources added or renamed in the UI and not saved yet: not in the file, kept as they are
+        unsaved_names = {
+            name for name in old_resource_names if name not in self._resource_hashes
+        }
+        for resource_instance_name in old_resource_names:
+            if (
+                resource_instance_name not in resources_config
+                and resource_instance_name not in unsaved_names
+            ):
+                del self.resources[resource_instance_name]
+                self._source_hashes.pop(("resources", resource_instance_name), None)
+                changes.removed_resources.append(resource_instance_name)
 
+        for resource_instance_name, resource_data in resources_config.items():
+            resource_hash = hash_yaml_data(resource_data)
+            if self._resource_hashes.get(resource_instance_name) == resource_hash:
+                # unchanged, or deleted (renamed) in the UI and not saved yet
+                continue
+            if resource_instance_name in self.resources:
+                changes.changed_resources.append(resource_instance_name)
             else:
-                wrong_types.append(
-                    [f"Skipping invalid resource entry: {str(res_config)[:40]}"]
+                changes.added_resources.append(resource_instance_name)
+            self._set_raw_resource(resource_instance_name, resource_data)
+            unsaved_names.discard(resource_instance_name)
+
+        # follow the order of the file, the unsaved resources stay after the same resource as before
+        order = [name for name in resources_config if name in self.resources]
+        previous_name = None
+        for name in old_resource_names:
+            if name in unsaved_names:
+                order.insert(
+                    order.index(previous_name) + 1 if previous_name else 0, name
                 )
-                all_missing_props.append(str(res_config)[:40])
+            if name in self.resources:
+                previous_name = name
+        self.resources.reorder(order)
+        self._resource_reports = {
+            name: self._resource_reports.get(name) for name in order
+        }
+        self._resource_hashes = {
+            name: self._resource_hashes[name]
+            for name in resources_config
+            if name in self._resource_hashes
+        }
+        changes.resources_list_changed = old_resource_names != list(self.resources)
 
-        # add dynamic property, so that it is not included in asdict()
-        # ideally, we should overwrite the __init__ method, but it is not so important property
-        self._defaults_used = default_fields
-        self._wrong_types = wrong_types
-        self._all_missing_props = all_missing_props
+        return changes
+
+    def rebase_hashes(self):
+        """Make the text last written by write_yaml the reference of the next reload (e.g. after saving it to file),
+        so that the next reload only detects the changes made after saving.
+        Serialized entries get the hashes of their data,
+        copied entries keep the hashes of their text."""
+        if not hasattr(self, "_section_hashes"):
+            self._section_hashes = {}
+            self._resource_hashes = {}
+        if not hasattr(self, "_section_reports"):
+            self._section_reports = {}
+            self._resource_reports = {}
+
+        for path, written_hash in getattr(self, "_written_hashes", {}).items():
+            if path[0] != "resources":
+                self._section_hashes[path[0]] = written_hash
+            elif len(path) == 2:
+                self._resource_hashes[path[1]] = written_hash
+        # drop the deleted resources (by name only: the resources not accessed yet stay undecoded)
+        self._resource_hashes = {
+            name: self._resource_hashes[name]
+            for name in self.resources
+            if name in self._resource_hashes
+        }
+
+    def _set_source_text(self, source_text: str | None, keep_hashes: bool = False):
+        """Set the YAML text the data was read from (None if unknown)."""
+        self._source_text = source_text
+        # entries positions are only found when saving
+        self._source_layout: ConfigLayout | None = None
+        # hashes of the entries as deserialized from the source text: to detect the modified ones
+        if not keep_hashes or not hasattr(self, "_source_hashes"):
+            self._source_hashes: dict[tuple, str] = {}
+
+    def _record_source_hash(self, path: tuple, value, report: tuple):
+        # entries with wrong types are always written again: their values were replaced
+        if getattr(self, "_source_text", None) is not None and not report[1]:
+            self._source_hashes[path] = hash_yaml_data(value)
+
+    def _model_hash(self, path: tuple, model_hashes: dict) -> str | None:
+        """Hash of the entry (('server',) or ('resources', name)), None for resources not deserialized (not modified).
+        ('resources',) is only written as a whole when there are no resources."""
+        if path not in model_hashes:
+            if len(path) == 1:
+                value = getattr(self, path[0])
+                model_hashes[path] = hash_yaml_data(
+                    dict(value) if path[0] == "resources" else value
+                )
+            elif isinstance(
+                self.resources, LazyResourcesDict
+            ) and not self.resources.is_decoded(path[1]):
+                model_hashes[path] = None
+            else:
+                model_hashes[path] = hash_yaml_data(self.resources[path[1]])
+        return model_hashes[path]
+
+    @traced()
+    def write_yaml(self, stream, progress: Callable[[int, int], None] | None = None):
+        """Write the config YAML to the stream. If the data was read from text (or written before),
+        the entries not modified since then are copied from that text, keeping their formatting and comments;
+        the others are serialized from the data classes.
+        progress(written, count) is called after each resource.
+        """
+        if not hasattr(self, "_source_text"):
+            self._set_source_text(None)
+
+        if self._source_text is not None and self._source_layout is None:
+            self._source_layout = scan_config_layout(self._source_text)
+
+        # without (spliceable) source text, all entries are new: the whole config is serialized
+        model_hashes = {}
+        copied_paths = set()
+
+        def is_modified(path: tuple) -> bool:
+            if self._model_hash(path, model_hashes) in (
+                None,
+                self._source_hashes.get(path),
+            ):
+                copied_paths.add(path)
+                return False
+            return True
+
+        self._source_layout = splice_config_data(
+            self,
+            self._source_layout or ConfigLayout(""),
+            stream,
+            is_modified,
+            progress,
+        )
+        # written text is the source of the next save
+        self._source_text = self._source_layout.text
+
+        # written entries are the new reference for modifications
+        paths = [(section_name,) for section_name in TOP_LEVEL_SECTIONS]
+        paths += [("resources", name) for name in self.resources] or [("resources",)]
+        self._source_hashes = {
+            path: model_hash
+            for path in paths
+            if (model_hash := self._model_hash(path, model_hashes)) is not None
+        }
+        # serialized entries have the hashes of their data: reference of the next reload, see rebase_hashes
+        self._written_hashes = {
+            path: self._source_hashes[path]
+            for path in paths
+            if path not in copied_paths and path in self._source_hashes
+        }
+
+    def _decode_resource(
+        self, resource_instance_name: str, resource_data: dict
+    ) -> ResourceConfigTemplate:
+        """Deserialize a single resource entry and record its missing/mistyped properties."""
+        new_resource_item, report = decode_resource(
+            resource_instance_name, resource_data
+        )
+        self._resource_reports[resource_instance_name] = report
+        self._record_source_hash(
+            ("resources", resource_instance_name), new_resource_item, report
+        )
+        return new_resource_item
+
+    @traced()
+    def decode_resources(self, parallel: bool = False, max_workers: int | None = None):
+        """Deserialize all resources not accessed yet (e.g. before validation or saving).
+        With parallel=True, large configs (PARALLEL_DECODE_THRESHOLD resources or more)
+        are decoded in chunks in a process pool.
+        """
+        if not isinstance(self.resources, LazyResourcesDict):
+            return
+
+        raw_items = self.resources.raw_items()
+        max_workers = max_workers or os.cpu_count() or 1
+        if (
+            not parallel
+            or len(raw_items) < PARALLEL_DECODE_THRESHOLD
+            or max_workers < 2
+        ):
+            self.resources.decode_all()
+            return
+
+        for (
+            resource_instance_name,
+            new_resource_item,
+            report,
+        ) in decode_resources_parallel(raw_items, max_workers):
+            self.resources[resource_instance_name] = new_resource_item
+            self._resource_reports[resource_instance_name] = report
+            self._record_source_hash(
+                ("resources", resource_instance_name), new_resource_item, report
+            )
+
+    def get_deserialization_messages(
+        self, decode_resources: bool = True
+    ) -> tuple[list[str], list[str], list[str]]:
+        """Return default values used, wrong types and all missing properties from the last YAML read.
+        If decode_resources=False, only the resources deserialized so far are included.
+        """
+
+        # taking precaution here because the properties were not explicitly defined in the __init__ method
+        if not hasattr(self, "_resource_reports"):
+            return [], [], []
+
+        if decode_resources:
+            self.decode_resources()
+
+        default_fields = []
+        wrong_types = []
+        all_missing_props = []
+        # top level properties in a fixed order, resources in the file order
+        for report in [
+            *(self._section_reports.get(name) for name in TOP_LEVEL_SECTIONS),
+            *self._resource_reports.values(),
+        ]:
+            if report is not None:
+                default_fields.extend(report[0])
+                wrong_types.extend(report[1])
+                all_missing_props.extend(report[2])
+
+        return default_fields, wrong_types, all_missing_props
+
+    def get_resource_messages(
+        self, resource_instance_name: str
+    ) -> tuple[list[str], list[str], list[str]]:
+        """Return default values used, wrong types and all missing properties of a single deserialized resource."""
+        if not hasattr(self, "_resource_reports"):
+            return [], [], []
+        return self._resource_reports.get(resource_instance_name) or ([], [], [])
 
     @property
     def defaults_message(self):
-        # taking precaution here because the property was not explicitly defined in the __init__ method
-        if hasattr(self, "_defaults_used"):
-            return self._defaults_used
-        return []
+        return self.get_deserialization_messages()[0]
 
     @property
     def error_message(self):
-        # taking precaution here because the property was not explicitly defined in the __init__ method
-        if hasattr(self, "_wrong_types"):
-            return self._wrong_types
-        return []
+        return self.get_deserialization_messages()[1]
 
     @property
     def all_missing_props(self):
-        # taking precaution here because the property was not explicitly defined in the __init__ method
-        if hasattr(self, "_all_missing_props"):
-            return self._all_missing_props
-        return []
+        return self.get_deserialization_messages()[2]
 
     def asdict_enum_safe(self, obj):
         """Overwriting dataclass 'asdict' fuction to replace Enums with strings."""
@@ -144,7 +522,7 @@ class ConfigData:
             return obj
         elif isinstance(obj, list):
             return [self.asdict_enum_safe(v) for v in obj]
-        elif isinstance(obj, dict):
+        elif isinstance(obj, (dict, LazyResourcesDict)):
             return {
                 self.asdict_enum_safe(k): self.asdict_enum_safe(v)
                 for k, v in obj.items()
@@ -167,9 +545,11 @@ class ConfigData:
         values: dict[str, str | list | int],
         res_name: str,
         provider_type: ProviderTypes,
-        provider_index: int | None = None,
-    ):
-        """Adds a provider data to the resource. Called on Save click from New Providere window."""
+        replaced_provider: ProviderTemplate | None = None,
+    ) -> tuple[list[str], ProviderTemplate]:
+        """Adds a provider data to the resource, or replaces the replaced_provider (same instance) with it.
+        Called on Save click from New Providere window. Returns the invalid properties and the new provider.
+        """
 
         # initialize provider; assign ui_dict data to the provider instance
         new_provider = ProviderTemplate.init_provider_from_type(provider_type)
@@ -178,23 +558,42 @@ class ConfigData:
         # if incomplete data, remove Provider from ConfigData and show Warning
         invalid_props = new_provider.get_invalid_properties()
         if len(invalid_props) == 0:
-            if provider_index is None:
-                self.resources[res_name].providers.append(new_provider)
+            providers = self.resources[res_name].providers
+            provider_index = _provider_index(providers, replaced_provider)
+            if provider_index < 0:
+                providers.append(new_provider)
             else:
-                self.resources[res_name].providers[provider_index] = new_provider
+                providers[provider_index] = new_provider
 
-        return invalid_props
+        return invalid_props, new_provider
+
+    def delete_provider(self, res_name: str, provider: ProviderTemplate | dict) -> bool:
+        """Remove the provider (same instance, e.g. from the providers list widget) from the resource."""
+        providers = self.resources[res_name].providers
+        provider_index = _provider_index(providers, provider)
+        if provider_index < 0:
+            return False
+        del providers[provider_index]
+        return True
 
-    def validate_config_data(self) -> int:
-        """Validate mandatory fields (e.g. before saving to file)."""
+    @traced()
+    def validate_config_data(
+        self, progress: Callable[[int, int], None] | None = None
+    ) -> int:
+        """Validate mandatory fields and CRS URIs (locally, see crs_registry), e.g. before saving to file.
+        progress(validated, count) is called after each resource."""
 
         invalid_props = []
         invalid_props.extend(self.server.get_invalid_properties())
         invalid_props.extend(self.metadata.get_invalid_properties())
-        for key, resource in self.resources.items():
+        resources_count = len(self.resources)
+        for index, (key, resource) in enumerate(self.resources.items()):
             invalid_res_props = [
                 f"resources.{key}.{prop}" for prop in resource.get_invalid_properties()
             ]
             invalid_props.extend(invalid_res_props)
+            invalid_props.extend(find_invalid_resource_crs(key, resource))
+            if progress is not None:
+                progress(index + 1, resources_count)
 
         return invalid_props
@@ -0,0 +1,108 @@
+from collections.abc import MutableMapping
+from typing import Any, Callable, Iterator
+
+
+class _RawResource:
+    """Wrapper for a resource entry which is not deserialized yet."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+
+class LazyResourcesDict(MutableMapping):
+    """Ordered mapping of resource names to ResourceConfigTemplate instances.
+    Entries can be stored as raw YAML data: they are only deserialized when accessed for the first time.
+    """
+
+    def __init__(self, decode_resource: Callable[[str, Any], Any] | None = None):
+        # decoded and raw entries share one dict, so the original order is kept on rename/insert
+        self._entries: dict[str, Any] = {}
+        self._decode_resource = decode_resource
+        # key: position, built on first index() call and dropped when keys are added, removed or moved
+        self._positions: dict[str, int] | None = None
+
+    def set_raw(self, key: str, raw_data: Any):
+        """Store the raw YAML data of the resource, to be decoded on first access."""
+        self[key] = _RawResource(raw_data)
+
+    def get_raw(self, key: str) -> Any | None:
+        """Return the raw YAML data of the resource, or None if it is already decoded."""
+        entry = self._entries[key]
+        if isinstance(entry, _RawResource):
+            return entry.data
+        return None
+
+    def raw_items(self) -> list[tuple[str, Any]]:
+        """Return (key, raw YAML data) of all the entries not decoded yet, in order."""
+        return [
+            (k, v.data) for k, v in self._entries.items() if isinstance(v, _RawResource)
+        ]
+
+    def is_decoded(self, key: str) -> bool:
+        return not isinstance(self._entries[key], _RawResource)
+
+    def decode_all(self):
+        """Deserialize all remaining raw entries (e.g. before validation or saving)."""
+        for key, _ in self.raw_items():
+            self[key]
+
+    def rename(self, key: str, new_key: str):
+        """Change the key of the entry, keeping its position (an entry with the new key is replaced)."""
+        if new_key == key:
+            return
+        self._entries = {
+            (new_key if k == key else k): v
+            for k, v in self._entries.items()
+            if k != new_key
+        }
+        self._positions = None
+
+    def insert(self, index: int, key: str, value):
+        """Add the entry at the position (an entry with the same key is replaced)."""
+        items = [(k, v) for k, v in self._entries.items() if k != key]
+        items.insert(index, (key, value))
+        self._entries = dict(items)
+        self._positions = None
+
+    def reorder(self, keys: list[str]):
+        """Change the order of the entries (keys missing in the list are removed), without decoding them."""
+        self._entries = {key: self._entries[key] for key in keys}
+        self._positions = None
+
+    def index(self, key: str) -> int:
+        """Position of the entry in the order of the entries (constant time while no entry is added or removed)."""
+        if self._positions is None:
+            self._positions = {k: position for position, k in enumerate(self._entries)}
+        return self._positions[key]
+
+    def __getitem__(self, key: str):
+        entry = self._entries[key]
+        if isinstance(entry, _RawResource):
+            entry = self._decode_resource(key, entry.data)
+            self._entries[key] = entry
+        return entry
+
+    def __setitem__(self, key: str, value):
+        if key not in self._entries:
+            self._positions = None
+        self._entries[key] = value
+
+    def __delitem__(self, key: str):
+        del self._entries[key]
+        self._positions = None
+
+    def __contains__(self, key) -> bool:
+        # avoid decoding the entry (default implementation calls __getitem__)
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        decoded = sum(1 for key in self._entries if self.is_decoded(key))
+        return f"{type(self).__name__}({len(self)} resources, {decoded} decoded)"
@@ -0,0 +1,3 @@
+# import the model classes first: models.utils and top_level providers import each other,
+# this makes any models submodule (e.g. ConfigData, cli) importable on its own
+from . import top_level
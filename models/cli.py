@@ -0,0 +1,169 @@
+"""Headless validation and normalization of pygeoapi config files (no Qt/QGIS imports).
+
+Usage:
+    python -m pygeoapi_config.models.cli config1.yml config2.yml [--jobs 4] [--output-dir normalized/] [--report report.json]
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import sys
+
+from .ConfigData import ConfigData
+from .tracing import add_spans, clear_spans, export_chrome_trace, get_spans, span
+from .config_file import hash_config_data, save_config_data
+from .yaml_backend import load_yaml
+
+
+def check_config_file(
+    file_path: str, output_path: str | None = None, parallel: bool = False
+) -> dict:
+    """Read, validate and (optionally) write the normalized config file.
+    Return the report of missing, wrong type and invalid properties,
+    with the content hash of the normalized config (same for configs saving to the same file).
+    """
+    report = {
+        "path": file_path,
+        "error": None,
+        "missing": [],
+        "defaults": [],
+        "wrong_types": [],
+        "invalid": [],
+        "normalized": None,
+        "hash": None,
+    }
+
+    try:
+        config_data = ConfigData()
+        with open(file_path, "r", encoding="utf-8") as file:
+            if parallel:
+                # whole file needed to split the resources between processes
+                with span("load_yaml", file=file_path):
+                    dict_content = load_yaml(file.read())
+                config_data.set_data_from_yaml(dict_content, parallel=True)
+            else:
+                # resources are decoded as they are read, without keeping the raw data
+                config_data.set_data_from_yaml_stream(file)
+        defaults, wrong_types, all_missing_props = (
+            config_data.get_deserialization_messages()
+        )
+        report["missing"] = all_missing_props
+        report["defaults"] = defaults
+        report["wrong_types"] = wrong_types
+        report["invalid"] = config_data.validate_config_data()
+
+        # same output as saving the file from the plugin (not rewritten if unchanged)
+        if output_path:
+            with span("save_config_data", file=output_path):
+                _, report["hash"] = save_config_data(config_data, output_path)
+            report["normalized"] = output_path
+        else:
+            report["hash"] = hash_config_data(config_data)
+
+    except Exception as e:
+        report["error"] = f"{type(e).__name__}: {e}"
+
+    return report
+
+
+def _check_config_file_args(args: tuple) -> tuple[dict, list[dict]]:
+    # process pool worker: unpack the arguments of check_config_file,
+    # return the timing spans too, as they are recorded in the worker process
+    clear_spans()
+    report = check_config_file(*args)
+    return report, get_spans()
+
+
+def check_config_files(
+    file_paths: list[str],
+    output_dir: str | None = None,
+    in_place: bool = False,
+    jobs: int | None = None,
+) -> list[dict]:
+    """Check multiple config files in a process pool, return the reports in the order of file_paths."""
+
+    tasks = []
+    for file_path in file_paths:
+        output_path = None
+        if in_place:
+            output_path = file_path
+        elif output_dir:
+            output_path = os.path.join(output_dir, os.path.basename(file_path))
+        tasks.append((file_path, output_path))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs < 2 or len(tasks) < 2:
+        # a single big file is still worth decoding in parallel
+        return [
+            check_config_file(file_path, output_path, parallel=jobs > 1)
+            for file_path, output_path in tasks
+        ]
+
+    reports = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        for report, spans in executor.map(_check_config_file_args, tasks):
+            reports.append(report)
+            add_spans(spans)
+    return reports
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate (and normalize) pygeoapi config files, print a JSON report per file."
+    )
+    parser.add_argument("files", nargs="+", help="YAML config files")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "-o",
+        "--output-dir",
+        help="write normalized files (as saved by the plugin) to this folder",
+    )
+    output_group.add_argument(
+        "--in-place",
+        action="store_true",
+        help="overwrite the files with their normalized version",
+    )
+    parser.add_argument(
+        "-r", "--report", help="write the JSON report to this file instead of stdout"
+    )
+    parser.add_argument(
+        "--trace",
+        help="write the timing spans to this file (Chrome trace-event JSON)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    reports = check_config_files(
+        args.files, args.output_dir, in_place=args.in_place, jobs=args.jobs
+    )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as file:
+            json.dump(reports, file, indent=2, ensure_ascii=False)
+    else:
+        json.dump(reports, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+    if args.trace:
+        export_chrome_trace(args.trace)
+
+    # non-zero exit code if any file could not be read or has missing/invalid properties
+    failed = any(
+        report["error"] or report["wrong_types"] or report["invalid"]
+        for report in reports
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
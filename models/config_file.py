@@ -0,0 +1,147 @@
+"""Change-aware writing of config files: the serialized content is hashed while it is written,
+unchanged files are not touched and changed files are replaced atomically
+(services watching the config file only see complete files, and only real changes).
+"""
+
+import hashlib
+import os
+import stat
+import tempfile
+from typing import Callable
+
+from .ConfigData import ConfigData
+from .tracing import traced
+from .yaml_backend import dump_config_data
+
+# read size when hashing files on disk
+_CHUNK_SIZE = 1 << 20
+
+
+class _HashingWriter:
+    """File-like object hashing the text written through it (and forwarding it to the file, if any)."""
+
+    def __init__(self, file=None):
+        self._file = file
+        self._hash = hashlib.sha256()
+
+    def write(self, text: str):
+        self._hash.update(text.encode("utf-8"))
+        if self._file is not None:
+            self._file.write(text)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def hash_config_text(text: str) -> str:
+    """Content hash of the config text: sha256 of its UTF-8 bytes, with '\\n' line endings."""
+    writer = _HashingWriter()
+    writer.write(text.replace("\r\n", "\n"))
+    return writer.hexdigest()
+
+
+def hash_config_file(file_path: str) -> str | None:
+    """Content hash of the file on disk (same as hash_config_text of its content), None if it does not exist.
+    Files which are not UTF-8 text get the hash of their bytes: it differs from the hash of any config text.
+    """
+    writer = _HashingWriter()
+    try:
+        # text mode: line endings are normalized, same hash on all platforms
+        with open(file_path, "r", encoding="utf-8") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                writer.write(chunk)
+    except FileNotFoundError:
+        return None
+    except UnicodeDecodeError:
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+    return writer.hexdigest()
+
+
+def hash_config_data(config_data) -> str:
+    """Content hash of the config as it would be saved, without writing it."""
+    writer = _HashingWriter()
+    dump_config_data(config_data, writer)
+    return writer.hexdigest()
+
+
+def _new_file_mode(probe_path: str) -> int:
+    # permissions a regular 'open(path, "w")' would give to a new file, read from a probe file
+    # (the umask is process-wide: it is not changed, saving runs in a worker thread)
+    fd = os.open(probe_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        return stat.S_IMODE(os.fstat(fd).st_mode)
+    finally:
+        os.close(fd)
+        os.remove(probe_path)
+
+
+@traced()
+def read_config_file(
+    file_path: str,
+    decode_resources: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> ConfigData:
+    """Read the config file into a new ConfigData, keeping its text for the next save (see ConfigData.write_yaml).
+    progress(position, length) is called after each top level property and resource.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        file_content = file.read()
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml_stream(
+        file_content, decode_resources=decode_resources, progress=progress
+    )
+    return config_data
+
+
+@traced()
+def save_config_data(
+    config_data,
+    file_path: str,
+    progress: Callable[[int, int], None] | None = None,
+) -> tuple[bool, str]:
+    """Save the config to file_path, unless the file already has the same content.
+    The content is written to a temporary file in the same folder, which then replaces the target.
+    progress(written, count) is called after each resource, an exception raised from it cancels the save.
+    Return (written, content hash).
+    """
+    # replace the target of a symlink, not the link itself
+    file_path = os.path.realpath(file_path)
+    folder, file_name = os.path.split(file_path)
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".tmp", dir=folder)
+    try:
+        with open(fd, "w", encoding="utf-8") as file:
+            writer = _HashingWriter(file)
+            # entries not modified since the file was read are copied from its text
+            config_data.write_yaml(writer, progress)
+            file.flush()
+            os.fsync(file.fileno())
+        content_hash = writer.hexdigest()
+
+        if hash_config_file(file_path) == content_hash:
+            os.remove(temp_path)
+            return False, content_hash
+
+        # keep the permissions of the replaced file (mkstemp creates files readable by the owner only)
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            mode = _new_file_mode(f"{temp_path}.mode")
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return True, content_hash
@@ -0,0 +1,181 @@
+"""Undo/redo history of the ConfigData edits. Each step keeps frozen copies of the entries
+(top level properties and resources) it changed, before and after the edit; the other entries are
+not copied, and consecutive steps share the copies of the entries they both touch.
+Recording an edit costs time proportional to the edited entries, not to the config size.
+"""
+
+from contextlib import contextmanager
+import copy
+from dataclasses import dataclass, field
+
+from .ConfigData import ReloadChanges
+
+# maximum number of steps kept for undo
+HISTORY_LIMIT = 100
+
+# entry absent before or after the edit (e.g. resource added or deleted)
+_MISSING = object()
+
+
+@dataclass
+class HistoryStep:
+    label: str
+    # path ('server',) or ('resources', name): frozen copy of the entry
+    before: dict[tuple, object] = field(default_factory=dict)
+    after: dict[tuple, object] = field(default_factory=dict)
+    # positions of the changed resources (when present), to restore them at the same place
+    # (e.g. renamed resource: the old name is inserted back where the new one is)
+    positions_before: dict[str, int] = field(default_factory=dict)
+    positions_after: dict[str, int] = field(default_factory=dict)
+
+
+class ConfigHistory:
+    """Undo and redo stacks of the edits of a ConfigData, recorded with edit()."""
+
+    def __init__(self, limit: int = HISTORY_LIMIT):
+        self.limit = limit
+        self._undo_steps: list[HistoryStep] = []
+        self._redo_steps: list[HistoryStep] = []
+        # frozen copy of each entry, as of the last recorded step: shared by the next step
+        self._frozen: dict[tuple, object] = {}
+
+    def clear(self):
+        """Forget all steps (e.g. another file is opened)."""
+        self._undo_steps = []
+        self._redo_steps = []
+        self._frozen = {}
+
+    def can_undo(self) -> bool:
+        return len(self._undo_steps) > 0
+
+    def can_redo(self) -> bool:
+        return len(self._redo_steps) > 0
+
+    @property
+    def undo_label(self) -> str | None:
+        return self._undo_steps[-1].label if self._undo_steps else None
+
+    @property
+    def redo_label(self) -> str | None:
+        return self._redo_steps[-1].label if self._redo_steps else None
+
+    @contextmanager
+    def edit(self, config_data, paths: list[tuple], label: str):
+        """Record the changes of the entries at paths made inside the 'with' block as one step.
+        Nothing is recorded if the block raises or does not change the entries.
+        """
+        paths = list(dict.fromkeys(paths))
+        before = {path: self._frozen_entry(config_data, path) for path in paths}
+        resource_names = {path[1] for path in paths if path[0] == "resources"}
+        positions_before = _positions(config_data, resource_names)
+
+        yield
+
+        step = HistoryStep(label)
+        for path in paths:
+            entry = _get_entry(config_data, path)
+            if entry == before[path]:
+                continue
+            step.before[path] = before[path]
+            step.after[path] = _freeze(entry)
+        if not step.after:
+            return
+
+        changed_names = {path[1] for path in step.after if path[0] == "resources"}
+        step.positions_before = {
+            name: position
+            for name, position in positions_before.items()
+            if name in changed_names
+        }
+        step.positions_after = _positions(config_data, changed_names)
+
+        # next steps share these copies
+        self._frozen.update(step.after)
+        self._undo_steps.append(step)
+        del self._undo_steps[: -self.limit]
+        self._redo_steps = []
+
+    def _frozen_entry(self, config_data, path: tuple):
+        entry = _get_entry(config_data, path)
+        # copy recorded by the previous step, unless the entry was changed outside of the history
+        frozen = self._frozen.get(path)
+        if frozen is not None and frozen == entry:
+            return frozen
+        return _freeze(entry)
+
+    def undo(self, config_data) -> ReloadChanges | None:
+        """Restore the entries changed by the last step. Return the changes (to refresh the UI)."""
+        if not self._undo_steps:
+            return None
+        step = self._undo_steps.pop()
+        self._redo_steps.append(step)
+        return self._apply(config_data, step.before, step.positions_before)
+
+    def redo(self, config_data) -> ReloadChanges | None:
+        """Apply again the last undone step. Return the changes (to refresh the UI)."""
+        if not self._redo_steps:
+            return None
+        step = self._redo_steps.pop()
+        self._undo_steps.append(step)
+        return self._apply(config_data, step.after, step.positions_after)
+
+    def _apply(self, config_data, entries: dict, positions: dict) -> ReloadChanges:
+        changes = ReloadChanges()
+        restored = []
+        for path, entry in entries.items():
+            self._frozen[path] = entry
+            if path[0] != "resources":
+                setattr(config_data, path[0], _thaw(entry))
+                changes.sections.append(path[0])
+                continue
+
+            name = path[1]
+            if entry is _MISSING:
+                if name in config_data.resources:
+                    del config_data.resources[name]
+                changes.removed_resources.append(name)
+                continue
+
+            if name in config_data.resources:
+                # same position: replaced in place
+                config_data.resources[name] = _thaw(entry)
+                changes.changed_resources.append(name)
+            else:
+                changes.added_resources.append(name)
+                restored.append((positions[name], name, entry))
+
+        # in the order of the positions: the resources before are at their place when inserting
+        for position, name, entry in sorted(restored, key=lambda item: item[0]):
+            config_data.resources.insert(position, name, _thaw(entry))
+
+        changes.resources_list_changed = bool(
+            changes.added_resources or changes.removed_resources
+        )
+        return changes
+
+
+def _positions(config_data, names: set[str]) -> dict[str, int]:
+    """Positions of the resources (the ones present) in the resources order."""
+    resources = config_data.resources
+    return {name: resources.index(name) for name in names if name in resources}
+
+
+def _get_entry(config_data, path: tuple):
+    if path[0] != "resources":
+        return getattr(config_data, path[0])
+    if path[1] not in config_data.resources:
+        return _MISSING
+    # resources not deserialized yet are decoded: the edit accesses them anyway
+    return config_data.resources[path[1]]
+
+
+def _freeze(entry):
+    # values are edited in place: copy them; the copy is never modified
+    if entry is _MISSING:
+        return _MISSING
+    return copy.deepcopy(entry)
+
+
+def _thaw(entry):
+    # the frozen copy stays in the history (redo/undo again): restore a copy of it
+    return copy.deepcopy(entry)
@@ -0,0 +1,150 @@
+"""Offline validation of CRS URIs (http://www.opengis.net/def/crs/{authority}/{version}/{code}):
+against QGIS CRS database when available, otherwise against the bundled code table (crs_codes.json).
+URIs which cannot be decided locally (e.g. newer EPSG codes) are reported as UNKNOWN,
+for an optional online check.
+"""
+
+from bisect import bisect_right
+from enum import Enum
+from functools import lru_cache
+import json
+import os
+from urllib.parse import urlparse
+
+from .top_level.providers.records import CrsAuthorities
+
+# make imports optional for pytests and the command line
+try:
+    from qgis.core import QgsCoordinateReferenceSystem
+
+except ImportError:
+    pass
+
+CRS_URI_PREFIX = "http://www.opengis.net/def/crs/"
+
+# EPSG dataset codes range, codes outside of it are invalid
+EPSG_CODES_RANGE = (1024, 32767)
+
+_CRS_CODES_PATH = os.path.join(os.path.dirname(__file__), "crs_codes.json")
+
+
+class CrsStatus(Enum):
+    VALID = "valid"
+    INVALID = "invalid"
+    UNKNOWN = "unknown"  # well-formed, but not found in the local registry
+
+
+@lru_cache(maxsize=1)
+def _crs_codes() -> dict:
+    with open(_CRS_CODES_PATH, "r", encoding="utf-8") as file:
+        crs_codes = json.load(file)
+    # EPSG codes stored as sorted [first, last] ranges
+    crs_codes["EPSG"] = [tuple(code_range) for code_range in crs_codes["EPSG"]]
+    return crs_codes
+
+
+def _is_known_epsg_code(code: int) -> bool:
+    ranges = _crs_codes()["EPSG"]
+    index = bisect_right(ranges, (code, EPSG_CODES_RANGE[1]))
+    return index > 0 and ranges[index - 1][0] <= code <= ranges[index - 1][1]
+
+
+def parse_crs_uri(uri: str) -> tuple[str, str, str] | None:
+    """Split the OGC CRS URI into (authority, version, code), None if it is not an OGC CRS URI."""
+    uri = uri.strip()
+    for prefix in (CRS_URI_PREFIX, CRS_URI_PREFIX.replace("http:", "https:", 1)):
+        if uri.startswith(prefix):
+            parts = uri[len(prefix) :].split("/")
+            if len(parts) == 3 and all(parts):
+                return parts[0], parts[1], parts[2]
+            return None
+    return None
+
+
+def _qgis_crs_status(authority: str, code: str) -> CrsStatus | None:
+    # QGIS CRS database (PROJ), if running in QGIS
+    try:
+        if authority == "EPSG":
+            crs = QgsCoordinateReferenceSystem(f"EPSG:{code}")
+        elif authority == "OGC" and code.startswith("CRS"):
+            crs = QgsCoordinateReferenceSystem(f"OGC:{code}")
+        else:
+            return None
+    except NameError:
+        return None
+    return CrsStatus.VALID if crs.isValid() else CrsStatus.INVALID
+
+
+@lru_cache(maxsize=4096)
+def validate_crs_uri(uri: str) -> tuple[CrsStatus, str]:
+    """Validate the CRS URI locally (no network requests). Return the status and a message for the user."""
+
+    parsed_url = urlparse(uri.strip())
+    if not all([parsed_url.scheme, parsed_url.netloc]):
+        return CrsStatus.INVALID, "Invalid URL"
+
+    parts = parse_crs_uri(uri)
+    if parts is None:
+        if uri.strip().startswith(CRS_URI_PREFIX):
+            return (
+                CrsStatus.INVALID,
+                "Invalid CRS URI: expected .../{authority}/{version}/{code}",
+            )
+        return CrsStatus.UNKNOWN, "Not an OGC CRS URI"
+
+    authority, version, code = parts
+    authority_version = f"{authority}/{version}"
+    if authority_version not in {auth.value for auth in CrsAuthorities}:
+        return CrsStatus.UNKNOWN, f"Unknown CRS authority: {authority_version}"
+
+    # codes format of the numeric registries
+    if authority in ("EPSG", "IAU", "AUTO") and not code.isdigit():
+        return CrsStatus.INVALID, f"Invalid {authority} code: {code}"
+    if authority == "EPSG" and not (
+        EPSG_CODES_RANGE[0] <= int(code) <= EPSG_CODES_RANGE[1]
+    ):
+        return CrsStatus.INVALID, f"Invalid EPSG code: {code}"
+
+    qgis_status = _qgis_crs_status(authority, code)
+    if qgis_status is CrsStatus.VALID:
+        return CrsStatus.VALID, "Valid CRS URI"
+    if qgis_status is CrsStatus.INVALID:
+        return CrsStatus.INVALID, f"Unknown {authority} code: {code}"
+
+    if authority == "EPSG":
+        known = _is_known_epsg_code(int(code))
+    else:
+        known = code in _crs_codes().get(authority_version, [])
+    if known:
+        return CrsStatus.VALID, "Valid CRS URI"
+    return (
+        CrsStatus.UNKNOWN,
+        f"{authority} code not found in the local registry: {code}",
+    )
+
+
+def find_invalid_resource_crs(resource_name: str, resource) -> list[str]:
+    """Validate the CRS URIs of the resource (extents and providers) locally.
+    Return the properties with invalid CRS (e.g. 'resources.lakes.providers[0].crs').
+    Empty values are not checked: missing mandatory values are reported by get_invalid_properties.
+    """
+    invalid_props = []
+
+    def check(prop: str, uri):
+        if (
+            isinstance(uri, str)
+            and uri.strip()
+            and validate_crs_uri(uri)[0] is CrsStatus.INVALID
+        ):
+            invalid_props.append(f"resources.{resource_name}.{prop}")
+
+    check("extents.spatial.crs", resource.extents.spatial.crs)
+    for index, provider in enumerate(resource.providers):
+        # read-only providers are kept as dictionaries
+        values = provider if isinstance(provider, dict) else vars(provider)
+        crs_list = values.get("crs") or []
+        for uri in crs_list if isinstance(crs_list, list) else [crs_list]:
+            check(f"providers[{index}].crs", uri)
+        check(f"providers[{index}].storage_crs", values.get("storage_crs"))
+
+    return invalid_props
@@ -0,0 +1,52 @@
+from collections.abc import Mapping
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+import hashlib
+import json
+
+from .top_level.utils import to_iso8601
+
+
+def _canonical_json_default(obj):
+    # model objects: same content as written to file (see ConfigData.asdict_enum_safe)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: getattr(obj, f.name)
+            for f in fields(obj)
+            if getattr(obj, f.name) is not None
+        }
+    if isinstance(obj, Mapping):
+        return dict(obj.items())
+
+    # YAML types not supported by json, normalized the same way as they are saved
+    if isinstance(obj, datetime):
+        return to_iso8601(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def hash_yaml_data(data) -> str:
+    """Return a hash of the YAML data (e.g. config section), independent of the keys order.
+    Model objects (e.g. ResourceConfigTemplate) get the same hash as the YAML data they are saved as.
+    """
+    try:
+        canonical = json.dumps(
+            data,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical_json_default,
+        )
+    except TypeError:
+        # mixed types of keys cannot be sorted: keep the original order
+        canonical = json.dumps(
+            data,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical_json_default,
+        )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
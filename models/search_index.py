@@ -0,0 +1,232 @@
+"""Inverted index of the resources text (name, localized titles, descriptions and keywords, links,
+providers names, tables, hosts and data), for prefix and fuzzy search of the resources list.
+Resources not deserialized yet are indexed from their raw YAML data, without decoding them.
+"""
+
+from bisect import bisect_left, insort
+from enum import Enum
+import re
+
+from .tracing import traced
+
+# words of letters and digits ('_' separates words, e.g. in table names)
+_WORD = re.compile(r"[^\W_]+")
+
+# searched terms shorter than this are not matched fuzzily (too many matches)
+MIN_FUZZY_TERM_LENGTH = 4
+# indexed words shorter than this are not matched fuzzily: one letter less than the searched terms,
+# which can be within one edit of them (e.g. 'oak' of 'oaky')
+MIN_FUZZY_TOKEN_LENGTH = MIN_FUZZY_TERM_LENGTH - 1
+
+# provider properties indexed, also inside the 'data' mapping (e.g. PostgreSQL connection)
+_PROVIDER_KEYS = ("name", "data", "table", "host", "dbname")
+
+
+def tokenize(text: str) -> set[str]:
+    return set(_WORD.findall(text.lower()))
+
+
+def get_property(obj, key: str):
+    # same access for the dataclasses and the raw YAML data
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _add_strings(value, texts: list[str]):
+    """Add all strings of a localized value: str, list, or dict of those by language."""
+    if isinstance(value, str):
+        texts.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _add_strings(item, texts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _add_strings(item, texts)
+    elif isinstance(value, Enum):
+        _add_strings(value.value, texts)
+
+
+def resource_texts(name: str, resource) -> list[str]:
+    """Texts of the resource (ResourceConfigTemplate or raw YAML data) to index."""
+    texts = [name]
+    for key in ("title", "description", "keywords"):
+        _add_strings(get_property(resource, key), texts)
+
+    for link in get_property(resource, "links") or []:
+        _add_strings(get_property(link, "href"), texts)
+        _add_strings(get_property(link, "title"), texts)
+
+    for provider in get_property(resource, "providers") or []:
+        for key in _PROVIDER_KEYS:
+            value = get_property(provider, key)
+            if key == "data" and value is not None and not isinstance(value, str):
+                # connection parameters, not the credentials
+                _add_strings(get_property(value, "host"), texts)
+                _add_strings(get_property(value, "dbname"), texts)
+            else:
+                _add_strings(value, texts)
+    return texts
+
+
+def _resource_tokens(name: str, resource) -> set[str]:
+    return tokenize("\n".join(resource_texts(name, resource)))
+
+
+def resource_data(resources, name: str):
+    # raw YAML data of the resources not deserialized yet (LazyResourcesDict): not decoded for indexing
+    raw_data = resources.get_raw(name) if hasattr(resources, "get_raw") else None
+    return raw_data if raw_data is not None else resources[name]
+
+
+def _deletes(token: str) -> set[str]:
+    # variants with one character deleted: tokens within edit distance 1 share one of them
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Levenshtein distance (with transpositions) of a and b is at most 1."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    # first difference
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1 :]
+    return a[i + 1 :] == b[i + 1 :] or (
+        a[i + 2 :] == b[i + 2 :] and a[i : i + 2] == b[i : i + 2][::-1]
+    )
+
+
+def _is_fuzzy_token(token: str, min_length: int = MIN_FUZZY_TOKEN_LENGTH) -> bool:
+    # words only: numbers (ids, codes) within one edit are different things
+    return len(token) >= min_length and not any(char.isdigit() for char in token)
+
+
+class ResourceSearchIndex:
+    """Resource names by token. Sorted tokens give the prefix matches, and the deletes index
+    the words within one edit of the searched term.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, set[str]] = {}  # token: resource names
+        self._tokens: dict[str, set[str]] = {}  # resource name: tokens
+        self._sorted_tokens: list[str] = []
+        self._deletes: dict[str, set[str]] = {}  # deleted variant: tokens
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tokens
+
+    @traced()
+    def build(self, resources):
+        """Index all the resources of the LazyResourcesDict (or other mapping), replacing the current content."""
+        self.__init__()
+        for name in resources:
+            tokens = _resource_tokens(name, resource_data(resources, name))
+            self._tokens[name] = tokens
+            for token in tokens:
+                self._postings.setdefault(token, set()).add(name)
+
+        # sorted once, not token by token
+        self._sorted_tokens = sorted(self._postings)
+        self._deletes = {}
+        for token in self._sorted_tokens:
+            self._add_fuzzy_token(token)
+
+    def sync(self, resources, changed_names=()):
+        """Follow the added, removed and renamed resources, and index the changed_names again
+        (the other resources are not indexed again)."""
+        for name in [name for name in self._tokens if name not in resources]:
+            self.remove_resource(name)
+        changed_names = set(changed_names)
+        for name in resources:
+            if name in changed_names:
+                self.remove_resource(name)
+            elif name in self._tokens:
+                continue
+            self.add_resource(name, resource_data(resources, name))
+
+    def add_resource(self, name: str, resource):
+        tokens = _resource_tokens(name, resource)
+        self._tokens[name] = tokens
+
+        for token in tokens:
+            names = self._postings.get(token)
+            if names is None:
+                self._postings[token] = names = set()
+                self._add_token(token)
+            names.add(name)
+
+    def remove_resource(self, name: str):
+        for token in self._tokens.pop(name, ()):
+            names = self._postings[token]
+            names.discard(name)
+            if not names:
+                del self._postings[token]
+                self._remove_token(token)
+
+    def update_resource(self, name: str, resource):
+        """Index the resource again (e.g. after it is edited)."""
+        self.remove_resource(name)
+        self.add_resource(name, resource)
+
+    def _add_token(self, token: str):
+        insort(self._sorted_tokens, token)
+        self._add_fuzzy_token(token)
+
+    def _remove_token(self, token: str):
+        del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+        if _is_fuzzy_token(token):
+            for variant in _deletes(token) | {token}:
+                tokens = self._deletes[variant]
+                tokens.discard(token)
+                if not tokens:
+                    del self._deletes[variant]
+
+    def _add_fuzzy_token(self, token: str):
+        if _is_fuzzy_token(token):
+            for variant in _deletes(token) | {token}:
+                self._deletes.setdefault(variant, set()).add(token)
+
+    def _prefix_tokens(self, term: str) -> list[str]:
+        start = bisect_left(self._sorted_tokens, term)
+        end = bisect_left(self._sorted_tokens, term + "\U0010ffff", start)
+        return self._sorted_tokens[start:end]
+
+    def _fuzzy_tokens(self, term: str) -> set[str]:
+        candidates = set()
+        for variant in _deletes(term) | {term}:
+            candidates |= self._deletes.get(variant, set())
+        return {token for token in candidates if _within_one_edit(term, token)}
+
+    def search_term(self, term: str, fuzzy: bool = True) -> set[str]:
+        """Names of the resources with a token starting with the term, or (fuzzy) within one edit of it."""
+        tokens = set(self._prefix_tokens(term))
+        if fuzzy and _is_fuzzy_token(term, MIN_FUZZY_TERM_LENGTH):
+            tokens |= self._fuzzy_tokens(term)
+        names = set()
+        for token in tokens:
+            names |= self._postings[token]
+        return names
+
+    def search(self, query: str, fuzzy: bool = True) -> set[str] | None:
+        """Names of the resources matching all the words of the query, None for an empty query (no filter)."""
+        terms = _WORD.findall(query.lower())
+        if not terms:
+            return None
+        # rarest terms first: the intersection gets small quickly
+        results = sorted((self.search_term(term, fuzzy) for term in terms), key=len)
+        names = results[0]
+        for term_names in results[1:]:
+            if not names:
+                break
+            names = names & term_names
+        return names
@@ -0,0 +1,192 @@
+"""In-memory R-tree of the resources extents (extents.spatial.bbox), to find the resources
+intersecting a map extent or point. The tree is bulk loaded (Sort-Tile-Recursive); resources
+added or changed afterwards are kept aside until there are enough of them to load the tree again.
+"""
+
+from math import ceil, isfinite, sqrt
+
+from .search_index import get_property, resource_data
+from .tracing import traced
+
+# maximum number of entries of a tree node
+NODE_CAPACITY = 16
+
+# minimum number of updates kept aside before loading the tree again
+MIN_PENDING_UPDATES = 64
+
+Box = tuple[float, float, float, float]  # xmin, ymin, xmax, ymax
+
+
+def bbox_to_boxes(bbox) -> list[Box]:
+    """Boxes of the bbox [xmin, ymin, xmax, ymax] (or with zmin, zmax: 6 values).
+    A bbox crossing the antimeridian (xmin > xmax) is split in two. Invalid bbox: no boxes.
+    """
+    try:
+        values = [float(value) for value in bbox]
+    except (TypeError, ValueError):
+        return []
+    if len(values) == 6:
+        values = [values[0], values[1], values[3], values[4]]
+    if len(values) != 4 or not all(isfinite(value) for value in values):
+        return []
+
+    xmin, ymin, xmax, ymax = values
+    if ymin > ymax:
+        return []
+    if xmin > xmax:
+        return [(xmin, ymin, 180.0, ymax), (-180.0, ymin, xmax, ymax)]
+    return [(xmin, ymin, xmax, ymax)]
+
+
+def resource_bbox(resource):
+    """extents.spatial.bbox of the resource (ResourceConfigTemplate or raw YAML data)."""
+    spatial = get_property(get_property(resource, "extents"), "spatial")
+    return get_property(spatial, "bbox")
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _union(boxes) -> Box:
+    xmins, ymins, xmaxs, ymaxs = zip(*boxes)
+    return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
+
+
+class _Node:
+    __slots__ = ("box", "children", "entries")
+
+    def __init__(self, box: Box, children=None, entries=None):
+        self.box = box
+        self.children: list[_Node] | None = children
+        self.entries: list[tuple[Box, str]] | None = entries
+
+
+def _pack(items: list, get_box) -> list[list]:
+    """Sort-Tile-Recursive: group the items in NODE_CAPACITY sized groups of nearby boxes."""
+    node_count = ceil(len(items) / NODE_CAPACITY)
+    slice_count = ceil(sqrt(node_count))
+    slice_size = slice_count * NODE_CAPACITY
+
+    items = sorted(items, key=lambda item: get_box(item)[0] + get_box(item)[2])
+    groups = []
+    for start in range(0, len(items), slice_size):
+        vertical_slice = sorted(
+            items[start : start + slice_size],
+            key=lambda item: get_box(item)[1] + get_box(item)[3],
+        )
+        for group_start in range(0, len(vertical_slice), NODE_CAPACITY):
+            groups.append(vertical_slice[group_start : group_start + NODE_CAPACITY])
+    return groups
+
+
+def _build_tree(entries: list[tuple[Box, str]]) -> _Node | None:
+    if not entries:
+        return None
+    nodes = [
+        _Node(_union(box for box, _ in group), entries=group)
+        for group in _pack(entries, lambda entry: entry[0])
+    ]
+    while len(nodes) > 1:
+        nodes = [
+            _Node(_union(node.box for node in group), children=group)
+            for group in _pack(nodes, lambda node: node.box)
+        ]
+    return nodes[0]
+
+
+class ResourceExtentsIndex:
+    """Resource names by extent: intersects() and at_point() visit only the tree nodes
+    intersecting the searched box, O(log n) for small boxes."""
+
+    def __init__(self):
+        self._boxes: dict[str, list[Box]] = {}  # current boxes of each resource
+        self._tree: _Node | None = None
+        # resources changed or removed since the tree was loaded: their tree entries are ignored
+        self._stale: set[str] = set()
+        self._pending: set[str] = set()  # resources with boxes not in the tree
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def boxes(self, name: str) -> list[Box]:
+        return self._boxes.get(name, [])
+
+    @traced()
+    def build(self, resources):
+        """Index the extents of all the resources (raw YAML data is not decoded), replacing the current content."""
+        self._boxes = {}
+        for name in resources:
+            boxes = bbox_to_boxes(resource_bbox(resource_data(resources, name)))
+            if boxes:
+                self._boxes[name] = boxes
+        self._load_tree()
+
+    def _load_tree(self):
+        self._tree = _build_tree(
+            [(box, name) for name, boxes in self._boxes.items() for box in boxes]
+        )
+        self._stale = set()
+        self._pending = set()
+
+    def sync(self, resources, changed_names=()) -> set[str]:
+        """Follow the added, removed and renamed resources, and the extents of the changed_names.
+        Return the names of the resources with changed boxes."""
+        updated = set()
+        for name in [name for name in self._boxes if name not in resources]:
+            self._set_boxes(name, [])
+            updated.add(name)
+
+        changed_names = set(changed_names)
+        for name in resources:
+            if name in self._boxes and name not in changed_names:
+                continue
+            boxes = bbox_to_boxes(resource_bbox(resource_data(resources, name)))
+            if boxes != self._boxes.get(name, []):
+                self._set_boxes(name, boxes)
+                updated.add(name)
+
+        if len(self._stale) + len(self._pending) > max(
+            MIN_PENDING_UPDATES, sqrt(len(self._boxes))
+        ):
+            self._load_tree()
+        return updated
+
+    def _set_boxes(self, name: str, boxes: list[Box]):
+        self._stale.add(name)
+        if boxes:
+            self._boxes[name] = boxes
+            self._pending.add(name)
+        else:
+            self._boxes.pop(name, None)
+            self._pending.discard(name)
+
+    def intersects(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ) -> set[str]:
+        """Names of the resources with an extent intersecting the box."""
+        box = (min(xmin, xmax), min(ymin, ymax), max(xmin, xmax), max(ymin, ymax))
+        names = set()
+        if self._tree is not None and _intersects(self._tree.box, box):
+            nodes = [self._tree]
+            while nodes:
+                node = nodes.pop()
+                if node.children is not None:
+                    nodes.extend(
+                        child for child in node.children if _intersects(child.box, box)
+                    )
+                    continue
+                for entry_box, name in node.entries:
+                    if _intersects(entry_box, box) and name not in self._stale:
+                        names.add(name)
+
+        for name in self._pending:
+            if any(_intersects(entry_box, box) for entry_box in self._boxes[name]):
+                names.add(name)
+        return names
+
+    def at_point(self, x: float, y: float, tolerance: float = 0.0) -> set[str]:
+        """Names of the resources with an extent containing the point (within tolerance)."""
+        return self.intersects(
+            x - tolerance, y - tolerance, x + tolerance, y + tolerance
+        )
@@ -36,6 +36,19 @@ class ProviderTemplate(ABC):
         elif provider_type == ProviderTypes.TILE:
             return ProviderMvtProxy()
 
+    @staticmethod
+    def get_subclass_from_dict(data: dict):
+        """Return the subclass matching 'type' and 'name' of the provider data from YAML.
+        Returns None if the provider is not supported yet (it is then kept as a read-only dict).
+        Used by the deserialization to dispatch a provider straight to its class."""
+        from . import PROVIDER_CLASSES
+
+        provider_type = data.get("type")
+        provider_name = data.get("name")
+        if isinstance(provider_type, str) and isinstance(provider_name, str):
+            return PROVIDER_CLASSES.get((provider_type, provider_name))
+        return None
+
     @abstractmethod
     def assign_ui_dict_to_provider_data(self, values: dict[str, str | list | int]):
         """Takes the dictionary of values specific to provider type, and assigns them to the class instance."""
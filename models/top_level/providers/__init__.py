@@ -3,9 +3,16 @@ from .ProviderMvtProxy import ProviderMvtProxy
 from .ProviderWmsFacade import ProviderWmsFacade
 from .ProviderPostgresql import ProviderPostgresql
 
+# supported Provider classes, keyed on the 'type' and 'name' values used in the config file
+PROVIDER_CLASSES: dict[tuple[str, str], type[ProviderTemplate]] = {
+    (provider_class.type.value, provider_class.name): provider_class
+    for provider_class in (ProviderPostgresql, ProviderMvtProxy, ProviderWmsFacade)
+}
+
 __all__ = [
     "ProviderTemplate",
     "ProviderMvtProxy",
     "ProviderWmsFacade",
     "ProviderPostgresql",
+    "PROVIDER_CLASSES",
 ]
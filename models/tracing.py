@@ -0,0 +1,106 @@
+"""Lightweight timing spans of the slow operations, logged to QgsMessageLog
+and exportable as Chrome trace events (open with chrome://tracing or https://ui.perfetto.dev).
+
+Set PYGEOAPI_CONFIG_TRACE=<file.json> to export the recorded spans on exit.
+"""
+
+import atexit
+from collections import deque
+from contextlib import contextmanager
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+# make imports optional for pytests and the command line
+try:
+    from qgis.core import QgsMessageLog
+
+except ImportError:
+    pass
+
+TRACE_LOG_TAG = "pygeoapi_config timing"
+
+# keep memory bounded in long sessions: only the latest spans are kept
+MAX_SPANS = 100000
+
+_spans: deque[dict] = deque(maxlen=MAX_SPANS)
+_logger = logging.getLogger(__name__)
+
+
+def _log_span(message: str):
+    try:
+        QgsMessageLog.logMessage(message, TRACE_LOG_TAG)
+    except NameError:
+        _logger.debug(message)
+
+
+@contextmanager
+def span(name: str, **args):
+    """Measure the time of the code block, record it and log a one-line summary.
+    Keyword arguments are stored with the span (e.g. file name or URL)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        _spans.append(
+            {
+                "name": name,
+                "cat": "pygeoapi_config",
+                "ph": "X",  # complete event: start and duration
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {key: str(value) for key, value in args.items()},
+            }
+        )
+        details = "".join(f", {key}={value}" for key, value in args.items())
+        _log_span(f"{name}: {duration * 1000:.1f} ms{details}")
+
+
+def traced(name: str | None = None):
+    """Decorator recording a span for each call of the function (named after the function by default)."""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_spans() -> list[dict]:
+    """Return the recorded spans (Chrome trace events), oldest first."""
+    return list(_spans)
+
+
+def add_spans(spans: list[dict]):
+    """Add spans recorded elsewhere (e.g. in a worker process)."""
+    _spans.extend(spans)
+
+
+def clear_spans():
+    _spans.clear()
+
+
+def export_chrome_trace(file_path: str):
+    """Write the recorded spans in Chrome trace-event JSON format."""
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {"traceEvents": get_spans(), "displayTimeUnit": "ms"},
+            file,
+            indent=1,
+        )
+
+
+if os.environ.get("PYGEOAPI_CONFIG_TRACE"):
+    atexit.register(export_chrome_trace, os.environ["PYGEOAPI_CONFIG_TRACE"])
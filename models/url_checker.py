@@ -0,0 +1,256 @@
+"""Batch checking of the URLs of the config (links, CRS URIs, proxied services):
+requests run concurrently (bounded number of threads) through one pooled session, reusing connections,
+and the results are cached on disk for a limited time, so unchanged configs are checked again instantly
+(except the transient failures, e.g. timeouts).
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import json
+import os
+import tempfile
+import time
+from typing import Callable
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .crs_registry import CrsStatus, validate_crs_uri
+from .top_level.providers.ProviderMvtProxy import ProviderMvtProxy
+from .top_level.providers.ProviderWmsFacade import ProviderWmsFacade
+from .tracing import span
+
+# maximum number of simultaneous requests (and of pooled connections per host)
+MAX_CONCURRENT_REQUESTS = 8
+
+REQUEST_TIMEOUT = 5  # seconds
+
+# how long the cached results are used, before the URL is requested again
+# (transient failures, e.g. timeouts, are not cached)
+CACHE_TTL = 24 * 60 * 60  # seconds
+
+# responses of overloaded or unavailable servers (too many requests, server errors)
+_TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# names of the read-only providers (kept as dictionaries) with a service URL in 'data'
+_PROXY_PROVIDER_NAMES = ("MVT-proxy", "WMSFacade")
+
+
+@dataclass
+class UrlStatus:
+    url: str
+    ok: bool
+    message: str
+    checked_at: float  # time.time() of the request
+    cached: bool = False
+
+
+def check_url(
+    url: str, session=None, timeout: float = REQUEST_TIMEOUT
+) -> tuple[bool, str]:
+    """Request the URL, return (is valid, message for the user).
+    The response must be successful and not an OGC ExceptionReport (invalid request).
+    """
+    is_valid, message, _ = _request_url(url, session, timeout)
+    return is_valid, message
+
+
+def _request_url(url: str, session, timeout: float) -> tuple[bool, str, bool]:
+    """Same as check_url, also return whether the failure is transient
+    (connection error, timeout, server error): worth trying again later."""
+    parsed_url = urlparse(url)
+    if not all([parsed_url.scheme, parsed_url.netloc]):
+        return False, "Invalid URL", False
+
+    try:
+        # 'requests' module has the same 'get' as a Session, without connection reuse
+        response = (session or requests).get(url, allow_redirects=True, timeout=timeout)
+        if response.status_code != 200:
+            return (
+                False,
+                f"HTTP response status code: {response.status_code}",
+                response.status_code in _TRANSIENT_STATUS_CODES,
+            )
+        else:
+            text = response.text
+            if "ExceptionReport" in text or "ExceptionText" in text:
+                return False, "Invalid request (OGC exception report)", False
+            return True, "Valid URL", False
+
+    except requests.ConnectionError:
+        # No internet or server unreachable
+        return False, "No internet connection or cannot reach server.", True
+
+    except requests.Timeout:
+        return False, "Request timed out.", True
+
+    except requests.RequestException:
+        return False, "Something went wrong with the request :(", True
+
+
+class UrlStatusCache:
+    """Results of the URL checks, stored in a JSON file and used until they are older than ttl seconds."""
+
+    def __init__(self, file_path: str | None = None, ttl: float = CACHE_TTL):
+        self.file_path = file_path
+        self.ttl = ttl
+        self._entries: dict[str, list] = {}  # url: [ok, message, checked_at]
+        self._changed = False
+        if file_path is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except (OSError, ValueError):
+            # missing or corrupted cache: start over
+            return
+        if isinstance(entries, dict):
+            self._entries = entries
+
+    def get(self, url: str) -> UrlStatus | None:
+        entry = self._entries.get(url)
+        if entry is None or time.time() - entry[2] > self.ttl:
+            return None
+        return UrlStatus(url, entry[0], entry[1], entry[2], cached=True)
+
+    def put(self, status: UrlStatus):
+        self._entries[status.url] = [status.ok, status.message, status.checked_at]
+        self._changed = True
+
+    def save(self):
+        """Write the cache file (if changed), dropping the expired entries."""
+        if self.file_path is None or not self._changed:
+            return
+        now = time.time()
+        entries = {
+            url: entry
+            for url, entry in self._entries.items()
+            if now - entry[2] <= self.ttl
+        }
+        folder = os.path.dirname(os.path.abspath(self.file_path))
+        os.makedirs(folder, exist_ok=True)
+        # other instances of the dialog may read the cache meanwhile: replace it atomically
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=folder)
+        try:
+            with open(fd, "w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._entries = entries
+        self._changed = False
+
+
+def _new_session(max_workers: int) -> requests.Session:
+    session = requests.Session()
+    # one pooled connection per thread, for each host
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def check_urls(
+    urls,
+    cache: UrlStatusCache | None = None,
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    timeout: float = REQUEST_TIMEOUT,
+    progress: Callable | None = None,
+) -> dict[str, UrlStatus]:
+    """Check the URLs (duplicates are requested once): invalid CRS URIs (see crs_registry)
+    and cached results first, then the requests in max_workers threads.
+    progress(done, total, url_status) is called in the calling thread as each result arrives,
+    an exception raised from it cancels the pending requests.
+    Return the results by URL.
+    """
+    urls = list(dict.fromkeys(urls))
+    results: dict[str, UrlStatus] = {}
+
+    def add_result(status: UrlStatus):
+        results[status.url] = status
+        if progress is not None:
+            progress(len(results), len(urls), status)
+
+    requested = []
+    for url in urls:
+        # e.g. EPSG code out of range: no request needed
+        crs_status, message = validate_crs_uri(url)
+        if crs_status is CrsStatus.INVALID:
+            add_result(UrlStatus(url, False, message, time.time()))
+            continue
+        status = cache.get(url) if cache is not None else None
+        if status is None:
+            requested.append(url)
+        else:
+            add_result(status)
+
+    if not requested:
+        return results
+
+    with span("check_urls", count=len(requested)), _new_session(max_workers) as session:
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(requested)))
+        try:
+            futures = {
+                executor.submit(_request_url, url, session, timeout): url
+                for url in requested
+            }
+            for future in as_completed(futures):
+                ok, message, transient = future.result()
+                status = UrlStatus(futures[future], ok, message, time.time())
+                if cache is not None and not transient:
+                    cache.put(status)
+                add_result(status)
+        finally:
+            # on cancel, do not wait for the requests not started yet
+            executor.shutdown(wait=True, cancel_futures=True)
+            if cache is not None:
+                cache.save()
+
+    return results
+
+
+def collect_config_urls(config_data) -> dict[str, list[str]]:
+    """Find the URLs to check in the config: resources links, CRS URIs which are not
+    valid locally (see crs_registry) and the services of the proxy providers.
+    Return the properties using each URL (e.g. 'resources.lakes.links[0].href'), by URL.
+    """
+    urls: dict[str, list[str]] = {}
+
+    def add(prop: str, url, is_crs: bool = False):
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            return
+        if is_crs and validate_crs_uri(url)[0] is CrsStatus.VALID:
+            return
+        urls.setdefault(url, []).append(prop)
+
+    for name, resource in config_data.resources.items():
+        for index, link in enumerate(resource.links):
+            add(f"resources.{name}.links[{index}].href", link.href)
+        add(
+            f"resources.{name}.extents.spatial.crs",
+            resource.extents.spatial.crs,
+            is_crs=True,
+        )
+
+        for index, provider in enumerate(resource.providers):
+            # read-only providers are kept as dictionaries
+            values = provider if isinstance(provider, dict) else vars(provider)
+            crs_list = values.get("crs") or []
+            for uri in crs_list if isinstance(crs_list, list) else [crs_list]:
+                add(f"resources.{name}.providers[{index}].crs", uri, is_crs=True)
+            add(
+                f"resources.{name}.providers[{index}].storage_crs",
+                values.get("storage_crs"),
+                is_crs=True,
+            )
+            if isinstance(provider, (ProviderMvtProxy, ProviderWmsFacade)) or (
+                values.get("name") in _PROXY_PROVIDER_NAMES
+            ):
+                add(f"resources.{name}.providers[{index}].data", values.get("data"))
+
+    return urls
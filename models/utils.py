@@ -1,258 +1,465 @@
 from dataclasses import is_dataclass, fields, MISSING
 from enum import Enum
 from types import UnionType
-from typing import Any, get_origin, get_args, Union, get_type_hints
+from typing import Any, Callable, get_origin, get_args, Union, get_type_hints
 
 from .top_level.utils import InlineList, get_enum_value_from_string
 
+# Decoders and type checkers are compiled once per class/type and cached here:
+# the reflection (type hints, fields, typing arguments) doesn't need to be repeated for every instance
+_DATACLASS_DECODERS: dict[type, Callable] = {}
+_DATACLASS_CAST_CHECKERS: dict[type, Callable[[dict], bool]] = {}
+_TYPE_CHECKERS: dict[Any, Callable[[Any], bool]] = {}
+_LIST_CASTERS: dict[Any, Callable] = {}
+_ELEMENT_CASTERS: dict[Any, Callable] = {}
+
+# returned by the element casters when the value doesn't match the expected type
+_NOT_CAST = object()
+
+# value conversions applied after the type check (see 'get_dataclass_decoder')
+_CONVERT_NONE = 0
+_CONVERT_INLINE_LIST = 1
+_CONVERT_ENUM = 2
+_CONVERT_LIST = 3
+
+
+def _path_to_str(path) -> str:
+    """Error paths are passed down as nested (parent, field_name) tuples
+    and only joined into a 'server.bind.port'-like string when an error is reported."""
+    if isinstance(path, str):
+        return path
+    parent, field_name = path
+    return f"{_path_to_str(parent)}.{field_name}"
+
+
+def _enum_members_by_value(enum_type) -> dict:
+    # reversed, so that the first member wins for repeated values (same as 'get_enum_value_from_string')
+    return {member.value: member for member in reversed(list(enum_type))}
+
 
 def update_dataclass_from_dict(
     instance, new_dict, prop_name: str = ""
 ) -> tuple[list, list, list]:
-    hints = get_type_hints(type(instance))
     missing_fields = []
     wrong_types = []
     all_missing_props = []
 
-    # loop through the instance properties
-    for fld in fields(instance):
-        field_name = fld.name
+    decoder = get_dataclass_decoder(type(instance))
+    decoder(
+        instance, new_dict, prop_name, missing_fields, wrong_types, all_missing_props
+    )
+
+    return missing_fields, wrong_types, all_missing_props
 
-        # try overwrite instance property with new dictionary value
-        if field_name in new_dict:
-            new_value = new_dict[field_name]
-            current_value = getattr(instance, field_name)
-            expected_type = hints[field_name]
 
-            args = get_args(expected_type)
+def get_dataclass_decoder(cls: type) -> Callable:
+    """Return (compile on first use) a decode function specialized for the dataclass.
+    The function overwrites instance properties with new dictionary values, and appends
+    error paths to the provided 'missing_fields', 'wrong_types' and 'all_missing_props' lists.
+    """
+    decoder = _DATACLASS_DECODERS.get(cls)
+    if decoder is None:
+        decoder = _compile_dataclass_decoder(cls)
+        _DATACLASS_DECODERS[cls] = decoder
+    return decoder
 
-            # If field is a dataclass and new_value is a dict, recurse
-            # This behavior works when 'current_value' is an already instantiated dataclass
-            # with all set properties - we just need to overwrite the values
 
-            # case where default value in None, but another class might be expected
-            if current_value is None and type(expected_type) is UnionType:
+def _compile_dataclass_decoder(cls: type) -> Callable:
+    hints = get_type_hints(cls)
+    field_specs = []
 
-                valid_type = next((t for t in args if t is not type(None)), None)
-                if is_dataclass(valid_type) and isinstance(new_value, dict):
-                    current_value = valid_type()
+    for fld in fields(cls):
+        expected_type = hints[fld.name]
+        args = get_args(expected_type)
+
+        # case where default value in None, but another class might be expected
+        optional_dataclass = None
+        if type(expected_type) is UnionType:
+            valid_type = next((t for t in args if t is not type(None)), None)
+            if is_dataclass(valid_type):
+                optional_dataclass = valid_type
+
+        # remapping of the values that passed the type check, in the order of priority
+        conversion, conversion_arg = _CONVERT_NONE, None
+        if expected_type is InlineList:
+            # Exception: remap list to internally used InlineList (needed later for YAML formatting)
+            conversion = _CONVERT_INLINE_LIST
+        elif isinstance(expected_type, type) and issubclass(expected_type, Enum):
+            # Exception: remap str to Enum
+            conversion = _CONVERT_ENUM
+            conversion_arg = (_enum_members_by_value(expected_type), expected_type)
+        elif type(expected_type) is UnionType:
+            # Exception: remap str to Enum (when one of possible classes is Enum)
+            subtype = next((t for t in args if t is not type(None)), None)
+            if isinstance(subtype, type) and issubclass(subtype, Enum):
+                conversion = _CONVERT_ENUM
+                conversion_arg = (_enum_members_by_value(subtype), subtype)
+        else:
+            # Exception with 'expected_type' 'list[some dataclass]': cast every list element
+            conversion = _CONVERT_LIST
+            conversion_arg = _get_list_caster(expected_type)
+
+        # don't report optional fields as missing
+        # for optional fields, 'default' is explicitly set to 'None'
+        optional = fld.default is not MISSING and fld.default is None
+
+        field_specs.append(
+            (
+                fld.name,
+                _get_type_checker(expected_type),
+                optional_dataclass,
+                conversion,
+                conversion_arg,
+                optional,
+            )
+        )
+
+    def decode(
+        instance, new_dict, path, missing_fields, wrong_types, all_missing_props
+    ):
+        # loop through the instance properties
+        for (
+            field_name,
+            type_checker,
+            optional_dataclass,
+            conversion,
+            conversion_arg,
+            optional,
+        ) in field_specs:
+
+            # try overwrite instance property with new dictionary value
+            if field_name in new_dict:
+                new_value = new_dict[field_name]
+                current_value = getattr(instance, field_name)
+
+                if (
+                    current_value is None
+                    and optional_dataclass is not None
+                    and isinstance(new_value, dict)
+                ):
+                    current_value = optional_dataclass()
                     setattr(instance, field_name, current_value)
 
-            if is_dataclass(current_value) and isinstance(new_value, dict):
-                new_missing_fields, new_wrong_types, new_missing_props = (
-                    update_dataclass_from_dict(
-                        current_value, new_value, f"{prop_name}.{field_name}"
+                # If field is a dataclass and new_value is a dict, recurse
+                # This behavior works when 'current_value' is an already instantiated dataclass
+                # with all set properties - we just need to overwrite the values
+                if is_dataclass(current_value) and isinstance(new_value, dict):
+                    get_dataclass_decoder(type(current_value))(
+                        current_value,
+                        new_value,
+                        (path, field_name),
+                        missing_fields,
+                        wrong_types,
+                        all_missing_props,
                     )
-                )
-                missing_fields.extend(new_missing_fields)
-                wrong_types.extend(new_wrong_types)
-                all_missing_props.extend(new_missing_props)
-            else:
-                if _is_instance_of_type(new_value, expected_type):
-
-                    # Exception: remap list to internally used InlineList (needed later for YAML formatting)
-                    if expected_type is InlineList:
+
+                elif type_checker(new_value):
+                    if conversion == _CONVERT_INLINE_LIST:
                         if isinstance(new_value, str):
                             new_value = new_value.split(",")
-
                         new_value = InlineList(new_value)
 
-                    # Exception: remap str to Enum
-                    elif isinstance(expected_type, type) and issubclass(
-                        expected_type, Enum
-                    ):
-                        new_value = get_enum_value_from_string(expected_type, new_value)
-
-                    # Exception: remap str to Enum (when one of possible classes is Enum)
-                    elif type(expected_type) is UnionType:
-                        subtype = next((t for t in args if t is not type(None)), None)
-                        if isinstance(subtype, type) and issubclass(subtype, Enum):
-                            new_value = get_enum_value_from_string(subtype, new_value)
+                    elif conversion == _CONVERT_ENUM:
+                        members_by_value, enum_type = conversion_arg
+                        if new_value in members_by_value:
+                            new_value = members_by_value[new_value]
+                        else:  # e.g. None for optional Enum: raise the usual error
+                            new_value = get_enum_value_from_string(enum_type, new_value)
 
-                    # Exception with 'expected_type' 'list[some dataclass]'
                     # In this case, 'current_value' will be a 'default'=None (for optional fields) or 'default_factory'=[] (for mandatory fields)
                     # We need to cast every element in the list to the correct class before assigning
                     # if we just assign new_value as is, it will be a 'list[dict]'
-
-                    elif isinstance(new_value, list):
-                        new_value, more_wrong_types = (
-                            _cast_list_elements_to_expected_types(
-                                new_value, expected_type, f"{prop_name}.{field_name}"
-                            )
+                    elif conversion == _CONVERT_LIST and isinstance(new_value, list):
+                        new_value, more_wrong_types = conversion_arg(
+                            new_value, (path, field_name)
                         )
                         wrong_types.extend(more_wrong_types)
 
                     setattr(instance, field_name, new_value)
+
                 else:
-                    wrong_types.append(f"{prop_name}.{field_name}")
-                    all_missing_props.append(f"{prop_name}.{field_name}")
-        else:  # field is missing from the object
-
-            # don't report optional fields as missing
-            # for optional fields, 'default' is explicitly set to 'None'
-            if fld.default is not MISSING and fld.default is None:
-                pass
-                # print(f"MISSING: {prop_name}.{field_name}")
-            else:
-                missing_fields.append(f"{prop_name}.{field_name}")
-                all_missing_props.append(f"{prop_name}.{field_name}")
+                    error_path = _path_to_str((path, field_name))
+                    wrong_types.append(error_path)
+                    all_missing_props.append(error_path)
 
-    return missing_fields, wrong_types, all_missing_props
+            elif not optional:  # field is missing from the object
+                error_path = _path_to_str((path, field_name))
+                missing_fields.append(error_path)
+                all_missing_props.append(error_path)
+
+    return decode
+
+
+def _get_element_caster(expected_type) -> Callable:
+    """Return a function intended to cast non-iterable values, or dict (to dataclasses).
+    The function returns '_NOT_CAST' if the value cannot be cast."""
+    caster = _ELEMENT_CASTERS.get(expected_type)
+    if caster is None:
+        caster = _compile_element_caster(expected_type)
+        _ELEMENT_CASTERS[expected_type] = caster
+    return caster
+
+
+def _get_union_dispatcher(union_args) -> Callable | None:
+    """Dataclass members of the Union can share a base class with a static 'get_subclass_from_dict' method
+    (e.g. Providers). Then a dict is sent straight to the matching class, instead of trying every member.
+    """
+    dataclass_members = [t for t in union_args if is_dataclass(t)]
+    dispatchers = {
+        getattr(t, "get_subclass_from_dict", None) for t in dataclass_members
+    }
+    if len(dispatchers) == 1 and None not in dispatchers:
+        return dispatchers.pop()
+    return None
 
 
-def _cast_element_to_type(value: Any, expected_type, prop_name: str):
-    """Function intended to cast non-iterable values, or dict (to dataclasses)."""
+def _compile_element_caster(expected_type) -> Callable:
 
     # if there are alternative options for the expected type: recurse
     if type(expected_type) is UnionType:
-        args = get_args(expected_type)
-        for inner_type in args:
-            if _is_instance_of_type(value, inner_type):
-                return _cast_element_to_type(value, inner_type, prop_name)
-
-    elif is_dataclass(expected_type):
-        class_instance = expected_type()
-        update_dataclass_from_dict(
-            class_instance,
-            value,
-            prop_name,
-        )
-        return class_instance
+        union_args = get_args(expected_type)
+        dispatch = _get_union_dispatcher(union_args)
+        if dispatch is not None:
+            return _compile_dispatching_caster(union_args, dispatch)
+
+        options = [
+            (_get_type_checker(inner_type), inner_type) for inner_type in union_args
+        ]
+
+        def cast_union_element(value, path):
+            for type_checker, inner_type in options:
+                if type_checker(value):
+                    return _get_element_caster(inner_type)(value, path)
+            return _NOT_CAST
+
+        return cast_union_element
+
+    if is_dataclass(expected_type):
+
+        def cast_dataclass_element(value, path):
+            class_instance = expected_type()
+            # errors of the list elements are not reported
+            get_dataclass_decoder(expected_type)(
+                class_instance, value, path, [], [], []
+            )
+            return class_instance
+
+        return cast_dataclass_element
 
-    else:
-        if _is_instance_of_type(value, expected_type):
+    type_checker = _get_type_checker(expected_type)
+
+    def cast_element(value, path):
+        if type_checker(value):
             return value
+        return _NOT_CAST
 
-    raise ValueError("Element type not matched")
+    return cast_element
 
 
-def _cast_list_elements_to_expected_types(
-    new_value: list, expected_type, prop_name: str
-):
-    """Cast all elements in the list to one of the expected types."""
-    casted_values = []
-    wrong_types = []
+def _compile_dispatching_caster(union_args, dispatch: Callable) -> Callable:
+    dataclass_members = tuple(t for t in union_args if is_dataclass(t))
+    other_options = [
+        (_get_type_checker(t), t) for t in union_args if not is_dataclass(t)
+    ]
+
+    def cast_dispatched_element(value, path):
+        if isinstance(value, dict):
+            # single validation pass, only against the class matching the dictionary
+            subclass = dispatch(value)
+            if subclass in dataclass_members and can_cast_to_dataclass(value, subclass):
+                return _get_element_caster(subclass)(value, path)
+
+        elif isinstance(value, dataclass_members):
+            return value
+
+        # unsupported or invalid values: try the remaining members (e.g. read-only 'dict')
+        for type_checker, inner_type in other_options:
+            if type_checker(value):
+                return _get_element_caster(inner_type)(value, path)
+        return _NOT_CAST
+
+    return cast_dispatched_element
+
+
+def _get_list_caster(expected_type) -> Callable:
+    """Return a function to cast all elements in the list to one of the expected types.
+    The function returns a tuple: (casted values, wrong types)."""
+    caster = _LIST_CASTERS.get(expected_type)
+    if caster is None:
+        caster = _compile_list_caster(expected_type)
+        _LIST_CASTERS[expected_type] = caster
+    return caster
+
+
+def _compile_list_caster(expected_type) -> Callable:
 
     # check for the expected inner arguments types
     args = get_args(expected_type)
 
     if type(expected_type) is UnionType and args:
         # e.g. 'list | dict'
-        for possible_type in args:
-            if _is_instance_of_type(new_value, possible_type):
-                casted_values, more_wrong_types = _cast_list_elements_to_expected_types(
-                    new_value, possible_type, prop_name
-                )
-                wrong_types.extend(more_wrong_types)
-
-    elif type(expected_type) is not UnionType and args and len(new_value) > 0:
+        options = [(_get_type_checker(t), t) for t in args]
+
+        def cast_union_list(new_value: list, path):
+            casted_values = []
+            wrong_types = []
+            for type_checker, possible_type in options:
+                if type_checker(new_value):
+                    casted_values, more_wrong_types = _get_list_caster(possible_type)(
+                        new_value, path
+                    )
+                    wrong_types.extend(more_wrong_types)
+            return casted_values, wrong_types
+
+        return cast_union_list
+
+    if type(expected_type) is not UnionType and args:
         # e.g. '<ListTemplate>' or (ProviderPostgresql | ProviderMvtProxy | ProviderWmsFacade,)
+        element_casters = [_get_element_caster(inner_type) for inner_type in args]
 
-        for val in new_value:
-
-            value_casted = False
-            for inner_type in args:
-                try:
-                    casted_element = _cast_element_to_type(val, inner_type, prop_name)
-                    casted_values.append(casted_element)
-                    value_casted = True
-                    break
-                except ValueError:
-                    pass
-
-            if not value_casted:
-                if isinstance(val, dict) and len(val) > 0:
-                    wrong_types.append(f"{prop_name}.{val[0]}")
-                else:
-                    wrong_types.append(f"{prop_name}")
+        def cast_typed_list(new_value: list, path):
+            casted_values = []
+            wrong_types = []
+
+            for val in new_value:
+
+                for element_caster in element_casters:
+                    casted_element = element_caster(val, path)
+                    if casted_element is not _NOT_CAST:
+                        casted_values.append(casted_element)
+                        break
 
-    else:
-        # if there are no arguments, just assign the value as is
-        casted_values.extend(new_value)
+                else:  # no expected type matched
+                    if isinstance(val, dict) and len(val) > 0:
+                        wrong_types.append(f"{_path_to_str(path)}.{val[0]}")
+                    else:
+                        wrong_types.append(_path_to_str(path))
 
-    return casted_values, wrong_types
+            return casted_values, wrong_types
+
+        return cast_typed_list
+
+    # if there are no arguments, just assign the value as is
+    def copy_list(new_value: list, path):
+        return list(new_value), []
+
+    return copy_list
 
 
 def _is_instance_of_type(value, expected_type) -> bool:
     """Basic type checker supporting Optional (Union[..., NoneType]) and direct types."""
+    return _get_type_checker(expected_type)(value)
+
+
+def _get_type_checker(expected_type) -> Callable[[Any], bool]:
+    """Return (compile on first use) a type checking function for the expected type."""
+    type_checker = _TYPE_CHECKERS.get(expected_type)
+    if type_checker is None:
+        type_checker = _compile_type_checker(expected_type)
+        _TYPE_CHECKERS[expected_type] = type_checker
+    return type_checker
+
+
+def _compile_type_checker(expected_type) -> Callable[[Any], bool]:
     origin = get_origin(expected_type)
     args = get_args(expected_type)
 
     # Handle Union (including Optional, str | dict, etc.)
     if origin is Union or type(expected_type) is UnionType:
         # Recursively check each allowed type in the union
-        return any(_is_instance_of_type(value, arg) for arg in args)
+        # (the cheap non-dataclass checks first, the result doesn't depend on the order)
+        inner_checkers = [
+            _get_type_checker(arg)
+            for arg in sorted(args, key=lambda arg: is_dataclass(arg))
+        ]
+        return lambda value: any(checker(value) for checker in inner_checkers)
 
     # Generic containers like list[X], dict[K, V]
     if origin in (list, tuple, set):
-        if not isinstance(value, origin):
-            return False
+        if not args:
+            return lambda value: isinstance(value, origin)
 
         # check for the inner arguments types
-        if args and len(value) > 0:
-            for val in value:
-
-                value_matched = False
-                for inner_type in args:
-                    if _is_instance_of_type(val, inner_type):
-                        value_matched = True
-                        continue
-                if not value_matched:
-                    return False
+        inner_checkers = [_get_type_checker(arg) for arg in args]
 
-            # if loop successfully ended and all values matched expected types
-            return True
+        def check_container(value) -> bool:
+            if not isinstance(value, origin):
+                return False
+            return all(any(checker(val) for checker in inner_checkers) for val in value)
 
-        return True
+        return check_container
 
     if origin is dict:
-        if not isinstance(value, dict):
-            return False
-        if args and len(args) == 2:
-            key_type, val_type = args
-            return all(
-                _is_instance_of_type(k, key_type) and _is_instance_of_type(v, val_type)
-                for k, v in value.items()
-            )
-        return True
+        if not (args and len(args) == 2):
+            return lambda value: isinstance(value, dict)
+
+        key_checker = _get_type_checker(args[0])
+        val_checker = _get_type_checker(args[1])
+        return lambda value: isinstance(value, dict) and all(
+            key_checker(k) and val_checker(v) for k, v in value.items()
+        )
 
     # Exception for InlineList: just check if the value is a list
     if expected_type is InlineList:
-        if isinstance(value, list):
-            return True
-        return False
+        return lambda value: isinstance(value, list)
 
     # Exception for Records (Enums): check if value is a member of the Enum
     if issubclass(expected_type, Enum):
-        if value in [member.value for member in expected_type]:
-            return True
-        return False
+        enum_values = frozenset(member.value for member in expected_type)
+
+        def check_enum(value) -> bool:
+            try:
+                return value in enum_values
+            except TypeError:  # unhashable values (e.g. dict) can't be Enum values
+                return False
+
+        return check_enum
 
     # Exception for when 'expected_type' is a custom dataclass and 'value' is dict
-    if isinstance(value, dict) and is_dataclass(expected_type):
-        return can_cast_to_dataclass(value, expected_type)
+    if is_dataclass(expected_type):
+
+        def check_dataclass(value) -> bool:
+            if isinstance(value, dict):
+                return can_cast_to_dataclass(value, expected_type)
+            return isinstance(value, expected_type)
+
+        return check_dataclass
 
     # Fallback for normal types
-    return isinstance(value, expected_type)
+    return lambda value: isinstance(value, expected_type)
 
 
 def can_cast_to_dataclass(data: dict, cls: type) -> bool:
+    cast_checker = _DATACLASS_CAST_CHECKERS.get(cls)
+    if cast_checker is None:
+        cast_checker = _compile_cast_checker(cls)
+        _DATACLASS_CAST_CHECKERS[cls] = cast_checker
+    return cast_checker(data)
+
 
+def _compile_cast_checker(cls: type) -> Callable[[dict], bool]:
     type_hints = get_type_hints(cls)
-    for field in fields(cls):
-        field_name = field.name
-        field_type = type_hints.get(field_name)
+    field_specs = [
+        (
+            field.name,
+            field.default is not MISSING,  # field has default
+            _get_type_checker(type_hints.get(field.name)),
+        )
+        for field in fields(cls)
+    ]
 
-        if field_name not in data:
-            if field.default is not MISSING:  # field has default
-                continue  # field is ok, go to next
+    def check(data: dict) -> bool:
+        for field_name, has_default, type_checker in field_specs:
+            if field_name not in data:
+                if has_default:
+                    continue  # field is ok, go to next
 
-            return False  # field and defaults are missing
+                return False  # field and defaults are missing
 
-        value = data[field_name]
+            # Check type
+            if not type_checker(data[field_name]):
+                return False
 
-        # Check type
-        if not _is_instance_of_type(value, field_type):
-            return False
+        return True
 
-    return True
+    return check
@@ -0,0 +1,212 @@
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timezone
+from enum import Enum
+import io
+import yaml
+
+from .LazyResourcesDict import LazyResourcesDict
+from .top_level.utils import InlineList
+
+# libyaml bindings are optional: PyYAML can be built without them (e.g. some QGIS Python distributions)
+LIBYAML_AVAILABLE: bool = getattr(yaml, "__with_libyaml__", False) and hasattr(
+    yaml, "CSafeLoader"
+)
+
+_MAPPING_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+
+
+def get_yaml_loader(use_libyaml: bool = True):
+    """Return the safe Loader class: libyaml-based if available, pure-Python otherwise."""
+    if use_libyaml and LIBYAML_AVAILABLE:
+        return yaml.CSafeLoader
+    return yaml.SafeLoader
+
+
+def load_yaml(stream, use_libyaml: bool = True):
+    """Parse YAML content (string or file object), equivalent to 'yaml.safe_load'."""
+    return yaml.load(stream, Loader=get_yaml_loader(use_libyaml))
+
+
+def _represent_inline_list(dumper, data: InlineList):
+    # make sure InlineList is represented as a YAML sequence (e.g. for 'bbox')
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=True)
+
+
+def _represent_datetime_as_timestamp(dumper, data: datetime):
+    # normalize to UTC and format with Z
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=timezone.utc)
+    else:
+        data = data.astimezone(timezone.utc)
+    value = data.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # emit as YAML timestamp → plain scalar, no quotes
+    return dumper.represent_scalar("tag:yaml.org,2002:timestamp", value)
+
+
+def _create_config_dumper(base_dumper):
+    """Subclass the given Dumper, registering representers for the config-specific types."""
+
+    class ConfigDumper(base_dumper):
+        pass
+
+    ConfigDumper.add_representer(InlineList, _represent_inline_list)
+    ConfigDumper.add_representer(datetime, _represent_datetime_as_timestamp)
+    return ConfigDumper
+
+
+SafeConfigDumper = _create_config_dumper(yaml.SafeDumper)
+CSafeConfigDumper = (
+    _create_config_dumper(yaml.CSafeDumper) if LIBYAML_AVAILABLE else None
+)
+
+
+def get_yaml_dumper(use_libyaml: bool = True):
+    """Return the config Dumper class: libyaml-based if available, pure-Python otherwise."""
+    if use_libyaml and CSafeConfigDumper is not None:
+        return CSafeConfigDumper
+    return SafeConfigDumper
+
+
+def dump_yaml(data, stream=None, use_libyaml: bool = True):
+    """Serialize config data in the plugin's output format (block style, original key order, indent 4)."""
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=get_yaml_dumper(use_libyaml),
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        indent=4,
+    )
+
+
+def _represent_detached(dumper, data) -> yaml.Node:
+    """Represent a single value as a node, without keeping it for aliases (values are not shared)."""
+    node = dumper.represent_data(data)
+    dumper.represented_objects = {}
+    dumper.object_keeper = []
+    dumper.alias_key = None
+    return node
+
+
+def _emit_node(dumper, node: yaml.Node):
+    """Emit the events of a represented node (same as yaml Serializer, without anchors)."""
+    if isinstance(node, yaml.ScalarNode):
+        detected_tag = dumper.resolve(yaml.ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(yaml.ScalarNode, node.value, (False, True))
+        implicit = (node.tag == detected_tag), (node.tag == default_tag)
+        dumper.emit(
+            yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+        )
+    elif isinstance(node, yaml.SequenceNode):
+        implicit = node.tag == dumper.resolve(yaml.SequenceNode, node.value, True)
+        dumper.emit(
+            yaml.SequenceStartEvent(
+                None, node.tag, implicit, flow_style=node.flow_style
+            )
+        )
+        for item in node.value:
+            _emit_node(dumper, item)
+        dumper.emit(yaml.SequenceEndEvent())
+    elif isinstance(node, yaml.MappingNode):
+        implicit = node.tag == dumper.resolve(yaml.MappingNode, node.value, True)
+        dumper.emit(
+            yaml.MappingStartEvent(None, node.tag, implicit, flow_style=node.flow_style)
+        )
+        for key, value in node.value:
+            _emit_node(dumper, key)
+            _emit_node(dumper, value)
+        dumper.emit(yaml.MappingEndEvent())
+
+
+def _emit_data(dumper, data):
+    """Emit the YAML events of the model data, following ConfigData.asdict_enum_safe conversion:
+    dataclasses as mappings without None values, Enums as their values, InlineList in flow style.
+    """
+    if is_dataclass(data):
+        dumper.emit(yaml.MappingStartEvent(None, _MAPPING_TAG, True, flow_style=False))
+        for f in fields(data):
+            value = getattr(data, f.name)
+            if value is not None:
+                _emit_node(dumper, _represent_detached(dumper, f.name))
+                _emit_data(dumper, value)
+        dumper.emit(yaml.MappingEndEvent())
+    elif isinstance(data, Enum):
+        _emit_node(dumper, _represent_detached(dumper, data.value))
+    elif isinstance(data, InlineList):
+        _emit_node(dumper, _represent_detached(dumper, data))
+    elif isinstance(data, list):
+        dumper.emit(yaml.SequenceStartEvent(None, _SEQ_TAG, True, flow_style=False))
+        for item in data:
+            _emit_data(dumper, item)
+        dumper.emit(yaml.SequenceEndEvent())
+    elif isinstance(data, (dict, LazyResourcesDict)):
+        dumper.emit(yaml.MappingStartEvent(None, _MAPPING_TAG, True, flow_style=False))
+        # resources are decoded (if needed) and written one at a time
+        for key, value in data.items():
+            _emit_data(dumper, key)
+            _emit_data(dumper, value)
+        dumper.emit(yaml.MappingEndEvent())
+    else:
+        _emit_node(dumper, _represent_detached(dumper, data))
+
+
+def _dump_events(emit_content, stream=None, use_libyaml: bool = True):
+    """Run emit_content(dumper) in a single YAML document, written in the plugin's output format."""
+    output = None
+    if stream is None:
+        output = stream = io.StringIO()
+
+    dumper = get_yaml_dumper(use_libyaml)(
+        stream,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        indent=4,
+    )
+    try:
+        dumper.open()
+        dumper.emit(yaml.DocumentStartEvent(explicit=False))
+        emit_content(dumper)
+        dumper.emit(yaml.DocumentEndEvent(explicit=False))
+        dumper.close()
+    finally:
+        dumper.dispose()
+
+    if output is not None:
+        return output.getvalue()
+
+
+def dump_config_data(config_data, stream=None, use_libyaml: bool = True):
+    """Serialize ConfigData straight from the dataclasses, emitting YAML events to the stream.
+    Output is identical to 'dump_yaml(config_data.asdict_enum_safe(config_data))',
+    without building the intermediate dict tree.
+    """
+    return _dump_events(
+        lambda dumper: _emit_data(dumper, config_data), stream, use_libyaml
+    )
+
+
+def dump_config_entry(path: tuple, value, use_libyaml: bool = True) -> str:
+    """Serialize a single entry of the config: top level property (path ('server',))
+    or resource (path ('resources', name)). Text is the same as in the output of dump_config_data,
+    e.g. resources are indented by 4 spaces.
+    """
+
+    def emit_entry(dumper):
+        for key in path:
+            dumper.emit(
+                yaml.MappingStartEvent(None, _MAPPING_TAG, True, flow_style=False)
+            )
+            _emit_data(dumper, key)
+        _emit_data(dumper, value)
+        for _ in path:
+            dumper.emit(yaml.MappingEndEvent())
+
+    text = _dump_events(emit_entry, use_libyaml=use_libyaml)
+    # document end marker added after open ended scalars: the entry is followed by other entries
+    if text.endswith("\n...\n"):
+        text = text[: -len("...\n")]
+    # drop the lines of the parent keys
+    return text.split("\n", len(path) - 1)[-1]
@@ -0,0 +1,226 @@
+"""Read the config YAML from parser events, one top level section / resource at a time,
+so that the raw data tree of the whole file is never kept in memory."""
+
+from typing import Any, Callable, Iterator
+import yaml
+
+from .yaml_backend import get_yaml_loader
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _EventComposer:
+    """Compose YAML nodes from parser events (same as yaml Composer, but usable with the libyaml parser events)."""
+
+    def __init__(self, events: Iterator[yaml.Event], resolver):
+        self._events = events
+        self._next_event = None
+        self._resolver = resolver
+        # end of the last event read, in characters from the start of the stream
+        self.position = 0
+        # anchors are kept for the whole document: aliases can refer to previous resources
+        self._anchors: dict[str, yaml.Node] = {}
+
+    def peek_event(self) -> yaml.Event | None:
+        if self._next_event is None:
+            self._next_event = next(self._events, None)
+        return self._next_event
+
+    def get_event(self) -> yaml.Event | None:
+        event = self.peek_event()
+        self._next_event = None
+        if event is not None:
+            self.position = event.end_mark.index
+        return event
+
+    def check_event(self, *event_types) -> bool:
+        return isinstance(self.peek_event(), event_types)
+
+    def expect_event(self, event_type):
+        event = self.get_event()
+        if not isinstance(event, event_type):
+            raise yaml.composer.ComposerError(
+                None,
+                None,
+                f"expected {event_type.__name__}, but found {type(event).__name__}",
+                getattr(event, "start_mark", None),
+            )
+        return event
+
+    def compose_node(self) -> yaml.Node:
+        event = self.get_event()
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in self._anchors:
+                raise yaml.composer.ComposerError(
+                    None,
+                    None,
+                    f"found undefined alias {event.anchor}",
+                    event.start_mark,
+                )
+            return self._anchors[event.anchor]
+
+        if isinstance(event, yaml.ScalarEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self._resolver.resolve(
+                    yaml.ScalarNode, event.value, event.implicit
+                )
+            node = yaml.ScalarNode(
+                tag, event.value, event.start_mark, event.end_mark, style=event.style
+            )
+            self._register_anchor(event.anchor, node)
+            return node
+
+        if isinstance(event, yaml.SequenceStartEvent):
+            tag = event.tag
+            if tag is None or tag == "!":
+                tag = self._resolver.resolve(yaml.SequenceNode, None, event.implicit)
+            node = yaml.SequenceNode(
+                tag, [], event.start_mark, None, flow_style=event.flow_style
+            )
+            self._register_anchor(event.anchor, node)
+            while not self.check_event(yaml.SequenceEndEvent):
+                node.value.append(self.compose_node())
+            node.end_mark = self.get_event().end_mark
+            return node
+
+        if isinstance(event, yaml.MappingStartEvent):
+            node = self._new_mapping_node(event)
+            while not self.check_event(yaml.MappingEndEvent):
+                key_node = self.compose_node()
+                node.value.append((key_node, self.compose_node()))
+            node.end_mark = self.get_event().end_mark
+            return node
+
+        raise yaml.composer.ComposerError(
+            None,
+            None,
+            f"unexpected {type(event).__name__}",
+            getattr(event, "start_mark", None),
+        )
+
+    def _new_mapping_node(self, event: yaml.MappingStartEvent) -> yaml.MappingNode:
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = self._resolver.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        self._register_anchor(event.anchor, node)
+        return node
+
+    def _register_anchor(self, anchor: str | None, node: yaml.Node):
+        if anchor is not None:
+            self._anchors[anchor] = node
+
+
+def _construct(constructor, node: yaml.Node) -> Any:
+    # construct_document also resets the constructor state, so nothing is kept between entries
+    return constructor.construct_document(node)
+
+
+def _merged_entries(constructor, merge_nodes: list[yaml.Node]) -> dict:
+    """Content of the merge keys ('<<: *anchor') found directly in a streamed mapping."""
+    merged = {}
+    for merge_node in merge_nodes:
+        value = _construct(constructor, merge_node)
+        # in a list of merged mappings, the first one has the priority
+        for mapping in reversed(value if isinstance(value, list) else [value]):
+            merged.update(mapping)
+    return merged
+
+
+def _iter_mapping(composer: _EventComposer, constructor) -> Iterator[tuple[Any, Any]]:
+    """Yield (key, value) of the mapping starting at the next event, constructing one entry at a time.
+    Entries of merge keys come last (safe_load puts them first), explicit keys have the priority.
+    """
+    composer.get_event()  # MappingStartEvent
+    explicit_keys = set()
+    merge_nodes = []
+    while not composer.check_event(yaml.MappingEndEvent):
+        key_node = composer.compose_node()
+        value_node = composer.compose_node()
+        if key_node.tag == _MERGE_TAG:
+            merge_nodes.append(value_node)
+            continue
+        key = _construct(constructor, key_node)
+        explicit_keys.add(key)
+        yield key, _construct(constructor, value_node)
+    composer.get_event()  # MappingEndEvent
+
+    for key, value in _merged_entries(constructor, merge_nodes).items():
+        if key not in explicit_keys:
+            yield key, value
+
+
+def iter_yaml_config(
+    stream,
+    use_libyaml: bool = True,
+    progress: Callable[[int, int], None] | None = None,
+) -> Iterator[tuple[tuple, Any]]:
+    """Parse the config YAML (string or file object) and yield its entries one at a time:
+    (('server',), {...}) for top level properties, (('resources', name), {...}) for each resource.
+    A 'resources' value which cannot be streamed (e.g. not a mapping) is yielded as a whole: (('resources',), value).
+    progress(position, length) is called after each entry (length is 0 for file objects).
+    """
+    length = len(stream) if isinstance(stream, str) else 0
+    # pure-Python loader as resolver and constructor of the composed nodes
+    constructor = yaml.SafeLoader("")
+    try:
+        events = yaml.parse(stream, Loader=get_yaml_loader(use_libyaml))
+        composer = _EventComposer(iter(events), constructor)
+
+        composer.expect_event(yaml.StreamStartEvent)
+        composer.expect_event(yaml.DocumentStartEvent)
+        if not composer.check_event(yaml.MappingStartEvent):
+            raise TypeError("Config file content must be a mapping")
+
+        # read the root mapping entry by entry, but stream the content of 'resources'
+        composer.get_event()  # MappingStartEvent
+        explicit_keys = set()
+        merge_nodes = []
+        while not composer.check_event(yaml.MappingEndEvent):
+            key_node = composer.compose_node()
+            if key_node.tag == _MERGE_TAG:
+                merge_nodes.append(composer.compose_node())
+                continue
+
+            key = _construct(constructor, key_node)
+            explicit_keys.add(key)
+            # anchored 'resources' mapping (rare) is read as a whole, as aliases can refer to it
+            if (
+                key == "resources"
+                and composer.check_event(yaml.MappingStartEvent)
+                and composer.peek_event().anchor is None
+            ):
+                for resource_name, resource_data in _iter_mapping(
+                    composer, constructor
+                ):
+                    yield ("resources", resource_name), resource_data
+                    if progress is not None:
+                        progress(composer.position, length)
+            else:
+                yield (key,), _construct(constructor, composer.compose_node())
+                if progress is not None:
+                    progress(composer.position, length)
+        composer.get_event()  # MappingEndEvent
+
+        for key, value in _merged_entries(constructor, merge_nodes).items():
+            if key in explicit_keys:
+                continue
+            if key == "resources" and isinstance(value, dict):
+                for resource_name, resource_data in value.items():
+                    yield ("resources", resource_name), resource_data
+            else:
+                yield (key,), value
+
+        composer.expect_event(yaml.DocumentEndEvent)
+        if not composer.check_event(yaml.StreamEndEvent):
+            raise yaml.composer.ComposerError(
+                "expected a single document in the stream",
+                None,
+                "but found another document",
+                getattr(composer.peek_event(), "start_mark", None),
+            )
+    finally:
+        constructor.dispose()
@@ -0,0 +1,301 @@
+"""Save the config by splicing: entries (top level properties and resources) not modified since they
+were read are copied from the source text as they are, keeping their formatting and comments.
+Only the modified entries are serialized again, so saving is proportional to the size of the edit.
+"""
+
+from dataclasses import dataclass, field, fields
+import re
+from typing import Callable
+import yaml
+
+from .yaml_backend import dump_config_entry, get_yaml_loader
+
+# line breaks counted by the YAML parsers (marks line numbers)
+_LINE_BREAK = re.compile("\r\n|[\n\r\x85\u2028\u2029]")
+
+# indentation of the resources in the output of dump_config_entry
+_ENTRY_INDENT = 4
+
+
+@dataclass
+class EntrySpan:
+    """Position of an entry in the text: leading comments and blank lines from 'start',
+    key line from 'body_start', until the end of the last line of its value."""
+
+    start: int
+    body_start: int
+    end: int
+
+
+@dataclass
+class ConfigLayout:
+    """Position of the top level properties and resources in the config text."""
+
+    text: str
+    sections: dict[str, EntrySpan] = field(default_factory=dict)
+    # None if 'resources' is not a block mapping: then it is always serialized again
+    resources: dict[str, EntrySpan] | None = None
+    resources_header_end: int = 0  # end of the 'resources:' line
+    resources_indent: int = _ENTRY_INDENT
+    prefix_end: int = (
+        0  # file header (comments, '---'), kept in front of the first entry
+    )
+    tail_start: int = 0  # comments after the last entry
+
+
+class _NotSpliceable(Exception):
+    pass
+
+
+class _LayoutScanner:
+    """Read the entries positions from the parser events (without constructing the values)."""
+
+    def __init__(self, text: str, use_libyaml: bool):
+        self.text = text
+        self.line_starts = [0] + [m.end() for m in _LINE_BREAK.finditer(text)]
+        self.events = iter(yaml.parse(text, Loader=get_yaml_loader(use_libyaml)))
+
+    def next_event(self, *event_types) -> yaml.Event:
+        event = next(self.events)
+        # copied text of an entry must not depend on other entries
+        if isinstance(event, yaml.AliasEvent) or getattr(event, "anchor", None):
+            raise _NotSpliceable("anchors and aliases")
+        if event_types and not isinstance(event, event_types):
+            raise _NotSpliceable(f"unexpected {type(event).__name__}")
+        return event
+
+    def line_end(self, mark) -> int:
+        # end of the last line of a value (a block scalar ends at the start of the next line)
+        if mark.column == 0:
+            return mark.index
+        line = mark.line + 1
+        return (
+            self.line_starts[line] if line < len(self.line_starts) else len(self.text)
+        )
+
+    def key(self, event: yaml.Event, column: int) -> str:
+        # simple key, alone at the start of its line
+        if not (
+            isinstance(event, yaml.ScalarEvent)
+            and event.start_mark.column == column
+            and event.start_mark.line == event.end_mark.line
+        ):
+            raise _NotSpliceable("complex key")
+        return event.value
+
+    def value_end(self, event: yaml.Event) -> int:
+        """Consume the events of the value starting with 'event', return its end offset."""
+        flow_styles = []
+        end_mark = event.end_mark
+        while True:
+            if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                flow_styles.append(event.flow_style)
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                # end of a block collection is only found at the next token: use its last item
+                if flow_styles.pop():
+                    end_mark = event.end_mark
+            else:
+                end_mark = event.end_mark
+            if not flow_styles:
+                return self.line_end(end_mark)
+            event = self.next_event()
+
+    def scan(self) -> ConfigLayout:
+        layout = ConfigLayout(self.text)
+        self.next_event(yaml.StreamStartEvent)
+        self.next_event(yaml.DocumentStartEvent)
+        if self.next_event(yaml.MappingStartEvent).flow_style:
+            raise _NotSpliceable("flow style")
+
+        end = None
+        while not isinstance(event := self.next_event(), yaml.MappingEndEvent):
+            name = self.key(event, 0)
+            if name in layout.sections:
+                raise _NotSpliceable(f"duplicate key {name}")
+            body_start = self.line_starts[event.start_mark.line]
+            if end is None:
+                layout.prefix_end = end = body_start
+
+            value_event = self.next_event()
+            if (
+                name == "resources"
+                and isinstance(value_event, yaml.MappingStartEvent)
+                and not value_event.flow_style
+            ):
+                value_end = self.scan_resources(layout, event)
+            else:
+                value_end = self.value_end(value_event)
+            layout.sections[name] = EntrySpan(end, body_start, value_end)
+            end = value_end
+
+        if end is None:
+            raise _NotSpliceable("empty config")
+        layout.tail_start = end
+        self.next_event(yaml.DocumentEndEvent)
+        self.next_event(yaml.StreamEndEvent)
+        return layout
+
+    def scan_resources(self, layout: ConfigLayout, key_event: yaml.Event) -> int:
+        layout.resources = {}
+        layout.resources_header_end = end = self.line_end(key_event.end_mark)
+        indent = None
+        while not isinstance(event := self.next_event(), yaml.MappingEndEvent):
+            if indent is None:
+                indent = event.start_mark.column
+            name = self.key(event, indent)
+            if name in layout.resources:
+                raise _NotSpliceable(f"duplicate resource {name}")
+            body_start = self.line_starts[event.start_mark.line]
+            value_end = self.value_end(self.next_event())
+            layout.resources[name] = EntrySpan(end, body_start, value_end)
+            end = value_end
+        layout.resources_indent = indent
+        return end
+
+
+def scan_config_layout(text: str, use_libyaml: bool = True) -> ConfigLayout | None:
+    """Find the positions of the top level properties and resources in the config text.
+    Return None if the text cannot be spliced (e.g. flow style, anchors and aliases, invalid YAML).
+    """
+    try:
+        return _LayoutScanner(text, use_libyaml).scan()
+    except (_NotSpliceable, yaml.YAMLError):
+        return None
+
+
+class _SpliceWriter:
+    """Write the pieces of text to the stream, keeping track of the written text and its length."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.pieces = []
+        self.length = 0
+
+    def write(self, text: str):
+        if text:
+            self.stream.write(text)
+            self.pieces.append(text)
+            self.length += len(text)
+
+    def start_line(self):
+        # last copied entry may be at the end of a file without final line break
+        if self.pieces and not self.pieces[-1].endswith(("\n", "\r")):
+            self.write("\n")
+
+    def getvalue(self) -> str:
+        return "".join(self.pieces)
+
+
+def _reindent(text: str, indent: int) -> str:
+    if indent == _ENTRY_INDENT:
+        return text
+    # all lines of a resource entry are indented at least by _ENTRY_INDENT
+    return "\n".join(
+        " " * indent + line[_ENTRY_INDENT:] if line.strip() else line
+        for line in text.split("\n")
+    )
+
+
+def _write_entry(
+    writer: _SpliceWriter,
+    source_text: str,
+    span: EntrySpan | None,
+    path: tuple,
+    get_value: Callable,
+    is_modified: Callable[[tuple], bool],
+    indent: int = 0,
+) -> EntrySpan:
+    """Copy the entry from the source text if not modified, serialize it otherwise (keeping leading comments)."""
+    writer.start_line()
+    start = writer.length
+    if span is not None and not is_modified(path):
+        writer.write(source_text[span.start : span.end])
+        return EntrySpan(start, start + span.body_start - span.start, writer.length)
+
+    if span is not None:
+        writer.write(source_text[span.start : span.body_start])
+    body_start = writer.length
+    text = dump_config_entry(path, get_value())
+    writer.write(_reindent(text, indent) if len(path) > 1 else text)
+    return EntrySpan(start, body_start, writer.length)
+
+
+def splice_config_data(
+    config_data,
+    layout: ConfigLayout,
+    stream,
+    is_modified: Callable[[tuple], bool],
+    progress: Callable[[int, int], None] | None = None,
+) -> ConfigLayout:
+    """Write ConfigData to the stream, copying the entries for which is_modified(path) is False
+    (path: ('server',) or ('resources', name)) from the layout text.
+    Top level properties keep the order of the text, resources follow the order of ConfigData.
+    progress(written, count) is called after each resource.
+    Return the layout of the written text.
+    """
+    source_text = layout.text
+    writer = _SpliceWriter(stream)
+    new_layout = ConfigLayout("")
+
+    # same entries as in dump_config_data: properties without None values
+    values = {
+        f.name: getattr(config_data, f.name)
+        for f in fields(config_data)
+        if getattr(config_data, f.name) is not None
+    }
+    names = [name for name in layout.sections if name in values]
+    names += [name for name in values if name not in layout.sections]
+
+    writer.write(source_text[: layout.prefix_end])
+    new_layout.prefix_end = writer.length
+
+    for name in names:
+        span = layout.sections.get(name)
+        if name != "resources" or len(values[name]) == 0:
+            new_layout.sections[name] = _write_entry(
+                writer,
+                source_text,
+                span,
+                (name,),
+                lambda: values[name],
+                is_modified,
+            )
+            continue
+
+        # resources, one at a time
+        writer.start_line()
+        start = writer.length
+        resource_spans = layout.resources or {}
+        if span is not None and layout.resources is not None:
+            writer.write(source_text[span.start : layout.resources_header_end])
+            body_start = start + span.body_start - span.start
+            indent = layout.resources_indent
+        else:
+            if span is not None:
+                writer.write(source_text[span.start : span.body_start])
+            body_start = writer.length
+            writer.write("resources:\n")
+            indent = _ENTRY_INDENT
+
+        new_layout.resources_header_end = writer.length
+        new_layout.resources_indent = indent
+        new_layout.resources = {}
+        resource_names = list(values[name])
+        for index, resource_name in enumerate(resource_names):
+            new_layout.resources[resource_name] = _write_entry(
+                writer,
+                source_text,
+                resource_spans.get(resource_name),
+                ("resources", resource_name),
+                lambda: values[name][resource_name],
+                is_modified,
+                indent,
+            )
+            if progress is not None:
+                progress(index + 1, len(resource_names))
+        new_layout.sections[name] = EntrySpan(start, body_start, writer.length)
+
+    new_layout.tail_start = writer.length
+    writer.write(source_text[layout.tail_start :])
+    new_layout.text = writer.getvalue()
+    return new_layout
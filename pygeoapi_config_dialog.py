@@ -22,23 +22,41 @@
  ***************************************************************************/
 """
 
-from datetime import datetime, timezone
 import os
-import yaml
 
 from .ui_widgets.utils import get_url_status
+from .ui_widgets.data_from_ui_setter_utils import link_from_values
+from .ui_widgets.ui_setter_utils import (
+    link_to_text,
+    list_data_to_strings,
+    provider_to_text,
+)
+from .ui_widgets.DataListItem import DataListItem
 
 
 from .models.top_level.providers.records import ProviderTypes
 from .ui_widgets.providers.NewProviderWindow import NewProviderWindow
 from .ui_widgets.WarningDialog import ReadOnlyTextDialog
 from .ui_widgets import DataSetterFromUi, UiSetter
-from .models.ConfigData import ConfigData
-from .models.top_level.utils import (
-    InlineList,
-    get_enum_value_from_string,
+from .ui_widgets.BackgroundWorker import BackgroundWorker
+from .ui_widgets.ResourcesListModel import (
+    ResourcesFilterProxyModel,
+    ResourcesListModel,
+)
+from .models.ConfigData import ConfigData, ReloadChanges, TOP_LEVEL_SECTIONS
+from .models.config_history import ConfigHistory
+from .models.config_file import read_config_file, save_config_data
+from .models.search_index import ResourceSearchIndex
+from .models.spatial_index import ResourceExtentsIndex
+from .models.url_checker import (
+    UrlStatus,
+    UrlStatusCache,
+    check_urls,
+    collect_config_urls,
 )
-from .models.top_level.utils import STRING_SEPARATOR
+from .models.yaml_backend import load_yaml
+from .models.tracing import traced
+from .models.top_level.utils import get_enum_value_from_string
 
 from PyQt5 import QtWidgets, uic
 from PyQt5.QtWidgets import (
@@ -47,13 +65,17 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QDialogButtonBox,
     QApplication,
+    QProgressDialog,
+    QShortcut,
 )  # or PyQt6.QtWidgets
+from PyQt5.QtGui import QKeySequence
 
 from PyQt5.QtCore import (
     Qt,
     QModelIndex,
-    QStringListModel,
-    QSortFilterProxyModel,
+    QFileSystemWatcher,
+    QThreadPool,
+    QStandardPaths,
 )  # Not strictly needed, can use Python file API instead
 
 # make imports optional for pytests
@@ -81,12 +103,16 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
     ui_setter: UiSetter
     data_from_ui_setter: DataSetterFromUi
     current_res_name = ""
+    current_file_path = ""
+    # content hash of the last saved file (see models.config_file)
+    saved_content_hash = ""
 
     # these need to be class properties, otherwise, without constant reference, they are not displayed in a widget
     provider_window: QMainWindow
     bbox_map_canvas: "QgsMapCanvas"
     bbox_base_layer: "QgsRasterLayer"
     bbox_extents_layer: "QgsVectorLayer"
+    bbox_overview_layer: "QgsVectorLayer"
 
     def __init__(self, parent=None):
         """Constructor."""
@@ -101,66 +127,78 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         self.ui_setter = UiSetter(self)
         self.data_from_ui_setter = DataSetterFromUi(self)
 
-        class CustomDumper(yaml.SafeDumper):
-            pass
-
-        self.dumper = CustomDumper
-
-        # make sure InlineList is represented as a YAML sequence (e.g. for 'bbox')
-        self.dumper.add_representer(
-            InlineList,
-            lambda dumper, data: dumper.represent_sequence(
-                "tag:yaml.org,2002:seq", data, flow_style=True
-            ),
-        )
-
-        def represent_datetime_as_timestamp(dumper, data: datetime):
-            # normalize to UTC and format with Z
-            if data.tzinfo is None:
-                data = data.replace(tzinfo=timezone.utc)
-            else:
-                data = data.astimezone(timezone.utc)
-            value = data.strftime("%Y-%m-%dT%H:%M:%SZ")
-            # emit as YAML timestamp → plain scalar, no quotes
-            return dumper.represent_scalar("tag:yaml.org,2002:timestamp", value)
-
-        self.dumper.add_representer(datetime, represent_datetime_as_timestamp)
-
         # custom assignments
-        self.model = QStringListModel()
-        self.proxy = QSortFilterProxyModel()
+        # resources list: updated row by row, behind the search filter
+        self.model = ResourcesListModel(self.config_data.resources, self)
+        self.proxy = ResourcesFilterProxyModel()
+        self.search_index = ResourceSearchIndex()
+        self.extents_index = ResourceExtentsIndex()
+        self.proxy.setSourceModel(self.model)
+        self.listViewCollection.setModel(self.proxy)
+
+        # undo/redo of the data edits
+        self.history = ConfigHistory()
+        QShortcut(QKeySequence("Ctrl+Z"), self, self.undo)
+        QShortcut(QKeySequence("Ctrl+Shift+Z"), self, self.redo)
+        self.file_watcher: QFileSystemWatcher | None = None
+
+        # slow operations (reading, validating, saving) run in a single worker thread
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.background_worker: BackgroundWorker | None = None
 
         self.ui_setter.customize_ui_on_launch()
+        self.data_from_ui_setter.watch_ui_changes()
         self.ui_setter.set_ui_from_data()
         self.ui_setter.setup_map_widget()
 
+    @traced()
     def save_to_file(self, file_path):
 
         if file_path:
             QApplication.setOverrideCursor(Qt.WaitCursor)
             try:
-                with open(file_path, "w", encoding="utf-8") as file:
-                    yaml.dump(
-                        self.config_data.asdict_enum_safe(self.config_data),
-                        file,
-                        Dumper=self.dumper,
-                        default_flow_style=False,
-                        sort_keys=False,
-                        allow_unicode=True,
-                        indent=4,
-                    )
-
-                # try/except in case of running it from pytests
-                try:
-                    QgsMessageLog.logMessage(f"File saved to: {file_path}")
-                except:
-                    pass
+                # write straight from the data classes, one resource at a time;
+                # file is atomically replaced, and not touched at all if the content is the same
+                written, content_hash = save_config_data(self.config_data, file_path)
+                self._set_saved_file(file_path, written, content_hash)
 
             except Exception as e:
                 QgsMessageLog.logMessage(f"Error saving file: {e}")
             finally:
                 QApplication.restoreOverrideCursor()
 
+    def save_to_file_in_background(self, file_path):
+        """Same as save_to_file, in a worker thread, with progress and Cancel (a canceled save leaves the file untouched)."""
+
+        if file_path:
+            self._run_in_background(
+                f"Saving {os.path.basename(file_path)}...",
+                lambda progress: save_config_data(
+                    self.config_data, file_path, progress
+                ),
+                lambda result: self._set_saved_file(file_path, *result),
+                lambda error: QgsMessageLog.logMessage(f"Error saving file: {error}"),
+            )
+
+    def _set_saved_file(self, file_path: str, written: bool, content_hash: str):
+        self.saved_content_hash = content_hash
+
+        # next reload will only pick up the changes made to the saved file
+        self.config_data.rebase_hashes()
+        self.current_file_path = file_path
+        self._update_file_watcher()
+
+        # try/except in case of running it from pytests
+        try:
+            if written:
+                QgsMessageLog.logMessage(f"File saved to: {file_path}")
+            else:
+                QgsMessageLog.logMessage(f"File unchanged: {file_path}")
+        except:
+            pass
+
+    @traced()
     def open_file(self, file_name):
 
         if not file_name:
@@ -170,44 +208,183 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         self.exit_resource_edit()
 
         try:
-            # QApplication.setOverrideCursor(Qt.WaitCursor)
-            with open(file_name, "r", encoding="utf-8") as file:
-                file_content = file.read()
+            # read the file entry by entry, resources are deserialized on first access;
+            # text is kept to write the entries not modified as they are when saving
+            config_data = read_config_file(file_name)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Cannot open file:\n{str(e)}")
+            return
 
-                # reset data
-                self.config_data = ConfigData()
-                self.config_data.set_data_from_yaml(yaml.safe_load(file_content))
-                self.ui_setter.set_ui_from_data()
+        self._set_opened_file(file_name, config_data)
 
-                # log messages about missing or mistyped values during deserialization
-                # try/except in case of running it from pytests
-                try:
-                    QgsMessageLog.logMessage(
-                        f"Errors during deserialization: {self.config_data.error_message}"
-                    )
-                    QgsMessageLog.logMessage(
-                        f"Default values used for missing YAML fields: {self.config_data.defaults_message}"
-                    )
+    def open_file_in_background(self, file_name):
+        """Same as open_file, reading the file in a worker thread, with progress and Cancel."""
 
-                    # summarize all properties missing/overwitten with defaults
-                    # atm, warning with the full list of properties
-                    QgsMessageLog.logMessage(
-                        f"All missing or replaced properties: {self.config_data.all_missing_props}"
+        if not file_name:
+            return
+
+        # exit Resource view
+        self.exit_resource_edit()
+
+        self._run_in_background(
+            f"Reading {os.path.basename(file_name)}...",
+            lambda progress: read_config_file(file_name, progress=progress),
+            lambda config_data: self._set_opened_file(file_name, config_data),
+            lambda error: QMessageBox.warning(
+                self, "Error", f"Cannot open file:\n{error}"
+            ),
+        )
+
+    def _set_opened_file(self, file_name: str, config_data: ConfigData):
+
+        try:
+            # reset data
+            self.config_data = config_data
+            self.history.clear()
+            self.ui_setter.set_ui_from_data()
+            self.current_file_path = file_name
+            self._update_file_watcher()
+
+            # log messages about missing or mistyped values during deserialization
+            # resources are deserialized on demand, so only the top-level sections are reported here
+            # try/except in case of running it from pytests
+            try:
+                default_fields, wrong_types, all_missing_props = (
+                    self.config_data.get_deserialization_messages(
+                        decode_resources=False
                     )
+                )
+                QgsMessageLog.logMessage(
+                    f"Errors during deserialization: {wrong_types}"
+                )
+                QgsMessageLog.logMessage(
+                    f"Default values used for missing YAML fields: {default_fields}"
+                )
 
-                    if len(self.config_data.all_missing_props) > 0:
-                        ReadOnlyTextDialog(
-                            self,
-                            "Warning",
-                            f"All missing or replaced properties (check logs for more details): {self.config_data.all_missing_props}",
-                        ).exec_()
-                except:
-                    pass
+                # summarize all properties missing/overwitten with defaults
+                # atm, warning with the full list of properties
+                QgsMessageLog.logMessage(
+                    f"All missing or replaced properties: {all_missing_props}"
+                )
+
+                if len(all_missing_props) > 0:
+                    ReadOnlyTextDialog(
+                        self,
+                        "Warning",
+                        f"All missing or replaced properties (check logs for more details): {all_missing_props}",
+                    ).exec_()
+            except:
+                pass
 
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Cannot open file:\n{str(e)}")
-        # finally:
-        #     QApplication.restoreOverrideCursor()
+
+    def _run_in_background(
+        self, label: str, task, on_finished, on_failed, on_result=None
+    ):
+        """Run task(progress) in the worker thread, showing a progress dialog with a Cancel button
+        (the dialog cannot be edited meanwhile). on_finished(result) or on_failed(error) are called in the main thread,
+        as well as on_result(partial_result) for the partial results streamed by the task.
+        """
+        # one task at a time
+        if self.background_worker is not None:
+            return
+
+        worker = BackgroundWorker(task)
+        progress_dialog = QProgressDialog(label, "Cancel", 0, 100, self)
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setValue(0)
+        progress_dialog.canceled.connect(worker.cancel)
+
+        def set_progress(done: int, total: int):
+            # unknown total: busy indicator
+            progress_dialog.setMaximum(100 if total else 0)
+            if total:
+                progress_dialog.setValue(int(done * 100 / total))
+
+        def finish(callback, *args):
+            self.background_worker = None
+            # closing the progress dialog emits 'canceled'
+            progress_dialog.canceled.disconnect(worker.cancel)
+            progress_dialog.close()
+            progress_dialog.deleteLater()
+            if callback is not None:
+                callback(*args)
+
+        worker.signals.progress.connect(set_progress)
+        if on_result is not None:
+            worker.signals.result.connect(on_result)
+        worker.signals.finished.connect(lambda result: finish(on_finished, result))
+        worker.signals.failed.connect(lambda error: finish(on_failed, error))
+        worker.signals.canceled.connect(lambda: finish(None))
+
+        self.background_worker = worker
+        self.thread_pool.start(worker)
+
+    def reload_file(self, show_errors: bool = True) -> ReloadChanges | None:
+        """Re-read the open file, replacing only the changed sections and resources, and refreshing only their UI."""
+
+        if not self.current_file_path:
+            return None
+
+        try:
+            with open(self.current_file_path, "r", encoding="utf-8") as file:
+                file_content = file.read()
+            changes = self.config_data.reload_from_yaml(
+                load_yaml(file_content), source_text=file_content
+            )
+            # the steps recorded before would undo the file changes
+            self.history.clear()
+            self.ui_setter.set_ui_from_reload_changes(changes)
+
+            # try/except in case of running it from pytests
+            try:
+                QgsMessageLog.logMessage(f"File reloaded: {changes}")
+            except:
+                pass
+            return changes
+
+        except Exception as e:
+            if show_errors:
+                QMessageBox.warning(self, "Error", f"Cannot reload file:\n{str(e)}")
+            else:
+                try:
+                    QgsMessageLog.logMessage(f"Error reloading file: {e}")
+                except:
+                    pass
+            return None
+
+    def set_auto_reload(self, enabled: bool):
+        """Reload the open file automatically when it is modified on disk."""
+        if enabled and self.file_watcher is None:
+            self.file_watcher = QFileSystemWatcher(self)
+            self.file_watcher.fileChanged.connect(self._on_watched_file_changed)
+        elif not enabled and self.file_watcher is not None:
+            self.file_watcher.deleteLater()
+            self.file_watcher = None
+        self._update_file_watcher()
+
+    def _update_file_watcher(self):
+        """Make the file watcher (if enabled) follow the currently open file."""
+        if self.file_watcher is None:
+            return
+        watched_files = self.file_watcher.files()
+        if watched_files:
+            self.file_watcher.removePaths(watched_files)
+        if self.current_file_path and os.path.exists(self.current_file_path):
+            self.file_watcher.addPath(self.current_file_path)
+
+    def _on_watched_file_changed(self, path: str):
+        # editors often replace the file instead of writing into it, which removes it from the watcher
+        self._update_file_watcher()
+        # data must not change while a worker thread reads it (e.g. saving)
+        if self.background_worker is not None:
+            return
+        if path == self.current_file_path and os.path.exists(path):
+            self.reload_file(show_errors=False)
 
     def on_button_clicked(self, button):
 
@@ -216,40 +393,132 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
 
         # You can also check the standard button type
         if button == self.buttonBox.button(QDialogButtonBox.Save):
-            self._validate_ui_data()
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save File", "", "YAML Files (*.yml);;All Files (*)"
-            )
-            self.save_to_file(file_path)
+            self.validate_and_save_in_background()
         elif button == self.buttonBox.button(QDialogButtonBox.Open):
             file_name, _ = QFileDialog.getOpenFileName(
                 self, "Open File", "", "YAML Files (*.yml);;All Files (*)"
             )
-            self.open_file(file_name)
+            self.open_file_in_background(file_name)
         elif button == self.buttonBox.button(QDialogButtonBox.Close):
             self.reject()
-
-    def _validate_ui_data(self):
-        # Set and validate data from UI
-        try:
+        elif button == self.reloadButton:
+            self.reload_file()
+        elif button == self.autoReloadButton:
+            self.set_auto_reload(button.isChecked())
+        elif button == self.checkUrlsButton:
+            self.check_urls_in_background()
+
+    def _set_data_from_ui(self):
+        """Set the top level properties from the main UI tabs, as one undo step."""
+        with self.history.edit(
+            self.config_data,
+            [(section_name,) for section_name in TOP_LEVEL_SECTIONS],
+            "Edit settings",
+        ):
             self.data_from_ui_setter.set_data_from_ui()
-            invalid_props = self.config_data.validate_config_data()
-            if len(invalid_props) > 0:
-                QgsMessageLog.logMessage(
-                    f"Properties are missing or have invalid values: {invalid_props}"
-                )
-                ReadOnlyTextDialog(
-                    self,
-                    "Warning",
-                    f"Properties are missing or have invalid values: {invalid_props}",
-                ).exec_()
-                return
 
+    def undo(self):
+        """Restore the data before the last edit, refreshing only the affected widgets. Ctrl+Z."""
+        # data must not change while a worker thread reads it (e.g. saving)
+        if self.background_worker is not None:
+            return
+        changes = self.history.undo(self.config_data)
+        if changes is not None:
+            self.ui_setter.set_ui_from_reload_changes(changes)
+
+    def redo(self):
+        """Apply again the last undone edit. Ctrl+Shift+Z."""
+        if self.background_worker is not None:
+            return
+        changes = self.history.redo(self.config_data)
+        if changes is not None:
+            self.ui_setter.set_ui_from_reload_changes(changes)
+
+    def validate_and_save_in_background(self):
+        """Set the data from UI, then validate it and save it to the chosen file in the worker thread."""
+
+        try:
+            self._set_data_from_ui()
         except Exception as e:
             QgsMessageLog.logMessage(f"Error deserializing: {e}")
-            QMessageBox.warning(f"Error deserializing: {e}")
+            QMessageBox.warning(self, "Error", f"Error deserializing: {e}")
+            return
+
+        self._run_in_background(
+            "Validating configuration...",
+            self.config_data.validate_config_data,
+            self._ask_file_and_save,
+            lambda error: QMessageBox.warning(
+                self, "Error", f"Error validating: {error}"
+            ),
+        )
+
+    def _ask_file_and_save(self, invalid_props: list[str]):
+        if len(invalid_props) > 0:
+            QgsMessageLog.logMessage(
+                f"Properties are missing or have invalid values: {invalid_props}"
+            )
+            ReadOnlyTextDialog(
+                self,
+                "Warning",
+                f"Properties are missing or have invalid values: {invalid_props}",
+            ).exec_()
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save File", "", "YAML Files (*.yml);;All Files (*)"
+        )
+        self.save_to_file_in_background(file_path)
+
+    def check_urls_in_background(self):
+        """Request all URLs of the config (links, CRS, proxied services) in the worker thread,
+        listing the results as they arrive, and show the failed ones at the end."""
+
+        try:
+            self._set_data_from_ui()
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Error deserializing: {e}")
             return
 
+        urls = collect_config_urls(self.config_data)
+        cache = UrlStatusCache(
+            os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.CacheLocation),
+                "url_status.json",
+            )
+        )
+
+        def log_result(status: UrlStatus):
+            try:
+                QgsMessageLog.logMessage(
+                    f"{'OK' if status.ok else 'FAILED'} {status.url}: {status.message}"
+                    + (" (cached)" if status.cached else "")
+                )
+            except NameError:
+                pass
+
+        def show_results(results: dict[str, UrlStatus]):
+            failed = [
+                f"{status.url} ({', '.join(urls[url])}): {status.message}"
+                for url, status in results.items()
+                if not status.ok
+            ]
+            if failed:
+                ReadOnlyTextDialog(self, "Warning", "\n".join(failed)).exec_()
+            else:
+                QMessageBox.information(
+                    self, "Information", f"All {len(results)} URLs are valid"
+                )
+
+        self._run_in_background(
+            "Checking URLs...",
+            lambda progress: check_urls(urls, cache, progress=progress),
+            show_results,
+            lambda error: QMessageBox.warning(
+                self, "Error", f"Error checking URLs: {error}"
+            ),
+            log_result,
+        )
+
     def open_templates_path_dialog(self):
         """Defining Server.templates.path path, called from .ui file."""
 
@@ -354,18 +623,22 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
                 self.addResLinksLengthLineEdit,
             ],
             list_widget=self.listWidgetResLinks,
+            create_value=link_from_values,
+            to_text=link_to_text,
             sort=False,
         )
 
-    def try_add_res_provider(self, provider_index=None, data: list[str] | None = None):
-        """Called from .ui file, and from this class."""
+    def try_add_res_provider(
+        self, provider_item: DataListItem | None = None, data: list[str] | None = None
+    ):
+        """Called from .ui file, and from this class (to edit the provider of the provider_item)."""
         provider_type: ProviderTypes = get_enum_value_from_string(
             ProviderTypes, self.comboBoxResProviderType.currentText().lower()
         )
 
         if not data:
             self.provider_window = NewProviderWindow(provider_type)
-            provider_index = None
+            provider_item = None
 
         else:
             # if the window is triggered for editing, ignore widget provider type and read it from data instead
@@ -375,21 +648,32 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         # add or replace provider data to ConfigData when user clicks 'Add'
         self.provider_window.signal_provider_values.connect(
             lambda provider_window, values: self._validate_and_add_res_provider(
-                provider_window, values, provider_type, provider_index
+                provider_window, values, provider_type, provider_item
             )
         )
 
     def _validate_and_add_res_provider(
-        self, provider_window, values, provider_type, provider_index: int | None = None
+        self,
+        provider_window,
+        values,
+        provider_type,
+        provider_item: DataListItem | None = None,
     ):
-        """Calls the Provider validation method and displays a warning if data is invalid."""
-        invalid_fields = self.config_data.set_validate_new_provider_data(
-            values, self.current_res_name, provider_type, provider_index
-        )
+        """Calls the Provider validation method and displays a warning if data is invalid.
+        The provider of the provider_item (if any) is replaced, otherwise a new provider is added.
+        """
+        replaced_provider = provider_item.value if provider_item else None
+        with self.history.edit(
+            self.config_data,
+            [("resources", self.current_res_name)],
+            f"Edit providers of {self.current_res_name}",
+        ):
+            invalid_fields, new_provider = (
+                self.config_data.set_validate_new_provider_data(
+                    values, self.current_res_name, provider_type, replaced_provider
+                )
+            )
 
-        self.ui_setter.set_providers_ui_from_data(
-            self.config_data.resources[self.current_res_name]
-        )
         if len(invalid_fields) > 0:
             QMessageBox.warning(
                 provider_window,
@@ -397,6 +681,13 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
                 f"Invalid Provider values: {invalid_fields}",
             )
         else:
+            # only the edited row changes: other rows keep their (unsaved) order
+            if provider_item:
+                provider_item.set_value(new_provider)
+            else:
+                self.listWidgetResProvider.addItem(
+                    DataListItem(new_provider, provider_to_text)
+                )
             self.provider_window.signal_provider_close.emit()
 
     def validate_res_extents_crs(self):
@@ -441,23 +732,53 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         selected_items = self.listWidgetResProvider.selectedItems()
         if selected_items:
             item = selected_items[0]  # get the first (and only) selected item
-            data_list = item.text().split(STRING_SEPARATOR)
-            self.try_add_res_provider(self.listWidgetResProvider.row(item), data_list)
+            # provider values as shown in the provider window
+            data_list = list_data_to_strings(item.value.pack_data_to_list())
+            self.try_add_res_provider(item, data_list)
 
     def delete_res_provider(self):
         """Called from .ui file."""
+        row = self.listWidgetResProvider.currentRow()
+        if row < 0:
+            return
 
-        # first, get selected item text and delete matching provider from Resource providers
-        self.data_from_ui_setter.delete_selected_provider_type_and_name(
-            self.listWidgetResProvider
-        )
-        # then, remove the item from the list widget
-        self.ui_setter.delete_list_widget_selected_item(self.listWidgetResProvider)
+        # the selected entry holds the resource provider itself
+        provider = self.listWidgetResProvider.item(row).value
+        with self.history.edit(
+            self.config_data,
+            [("resources", self.current_res_name)],
+            f"Delete provider of {self.current_res_name}",
+        ):
+            self.config_data.delete_provider(self.current_res_name, provider)
+        self.listWidgetResProvider.takeItem(row)
 
     def filterResources(self, filter):
-        """Called from .ui."""
-        self.proxy.setDynamicSortFilter(True)
-        self.proxy.setFilterFixedString(filter)
+        """Show the resources matching all the words (or their beginning, or with a typo)
+        in their names, titles, descriptions, keywords, links and providers. Called from .ui.
+        """
+        self.proxy.set_matching_names(self.search_index.search(filter))
+
+    def select_resources_at_point(self, x: float, y: float):
+        """Show the resources whose extents contain the clicked point (within a few pixels) in the list.
+        Called from the map tool; a click outside all extents shows all resources again.
+        """
+        tolerance = 3 * self.bbox_map_canvas.mapUnitsPerPixel()
+        self._show_map_selection(self.extents_index.at_point(x, y, tolerance))
+
+    def select_resources_in_rectangle(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ):
+        """Show the resources intersecting the rectangle drawn on the map in the list. Called from the map tool."""
+        self._show_map_selection(self.extents_index.intersects(xmin, ymin, xmax, ymax))
+
+    def _show_map_selection(self, names: set[str]):
+        self.proxy.set_map_names(names or None)
+
+        # single resource: preview it
+        if len(names) == 1:
+            res_name = next(iter(names))
+            self.ui_setter.select_listcollection_item_by_text(res_name)
+            self.preview_resource(self.listViewCollection.currentIndex())
 
     def exit_resource_edit(self):
         """Switch widgets to Preview, reset selected resource. Called from .ui and from this class too."""
@@ -479,12 +800,27 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
             )
             return
 
-        self.data_from_ui_setter.set_resource_data_from_ui()
+        # renamed resource: both names are recorded
+        with self.history.edit(
+            self.config_data,
+            [
+                ("resources", self.current_res_name),
+                ("resources", self.lineEditResAlias.text()),
+            ],
+            f"Edit {self.current_res_name}",
+        ):
+            self.data_from_ui_setter.set_resource_data_from_ui()
 
         # reset the current resource name, refresh UI list
         self.current_res_name = self.lineEditResAlias.text()
+        self.ui_setter.refresh_resources_list_ui(
+            changed_resources=[self.current_res_name]
+        )
         self.exit_resource_edit()
 
+        # renamed resource keeps its row, under the new name
+        self.ui_setter.select_listcollection_item_by_text(self.current_res_name)
+
     def preview_resource(self, model_index: QModelIndex = None):
         """Display basic Resource info, called from .ui."""
         self.ui_setter.preview_resource(model_index)
@@ -492,7 +828,12 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
     def delete_resource(self):
         """Delete selected resource. Called from .ui."""
         # hide detailed collection UI, show preview
-        self.config_data.delete_resource(self)
+        with self.history.edit(
+            self.config_data,
+            [("resources", self.current_res_name)],
+            f"Delete {self.current_res_name}",
+        ):
+            self.config_data.delete_resource(self)
         self.ui_setter.preview_resource()
         self.ui_setter.refresh_resources_list_ui()
         self.current_res_name = ""
@@ -500,7 +841,10 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
     def new_resource(self):
         """Called from .ui."""
         # add resource and reload UI
-        new_name = self.config_data.add_new_resource()
+        with self.history.edit(
+            self.config_data, [("resources", "new_resource")], "New resource"
+        ):
+            new_name = self.config_data.add_new_resource()
         self.ui_setter.refresh_resources_list_ui()
 
         # visually select new resource
@@ -525,5 +869,18 @@ class PygeoapiConfigDialog(QtWidgets.QDialog, FORM_CLASS):
         res_data = self.config_data.resources[self.current_res_name]
         # self.ui_setter.setup_resouce_loaded_ui(res_data)
 
+        # log missing or mistyped values of the resource (deserialized on first access)
+        # try/except in case of running it from pytests
+        try:
+            _, wrong_types, all_missing_props = self.config_data.get_resource_messages(
+                self.current_res_name
+            )
+            if len(all_missing_props) > 0:
+                QgsMessageLog.logMessage(
+                    f"Resource '{self.current_res_name}': errors during deserialization: {wrong_types}; all missing or replaced properties: {all_missing_props}"
+                )
+        except:
+            pass
+
         # set the values to UI widgets
         self.ui_setter.set_resource_ui_from_data(res_data)
@@ -0,0 +1,195 @@
+"""Deterministic generator of synthetic pygeoapi configs, e.g. for benchmarks."""
+
+from datetime import datetime, timedelta, timezone
+import random
+
+from ..models.ConfigData import ConfigData
+from ..models.top_level.providers.records import ProviderTypes
+
+_WORDS_EN = ["lakes", "rivers", "roads", "buildings", "parcels", "soil", "forest"]
+_WORDS_PT = ["lagos", "rios", "estradas", "edifícios", "parcelas", "solo", "floresta"]
+_CRS_LIST = [
+    "http://www.opengis.net/def/crs/OGC/1.3/CRS84",
+    "http://www.opengis.net/def/crs/EPSG/0/4326",
+    "http://www.opengis.net/def/crs/EPSG/0/3857",
+]
+
+
+def _generate_top_level() -> dict:
+    return {
+        "server": {
+            "bind": {"host": "0.0.0.0", "port": 5000},
+            "url": "http://localhost:5000",
+            "mimetype": "application/json; charset=UTF-8",
+            "encoding": "utf-8",
+            "map": {
+                "url": "https://tile.openstreetmap.org/{z}/{x}/{y}.png",
+                "attribution": "OpenStreetMap contributors",
+            },
+            "gzip": False,
+            "languages": ["en-US", "pt-PT"],
+            "cors": True,
+            "pretty_print": True,
+            "limits": {
+                "default_items": 10,
+                "max_items": 1000,
+                "on_exceed": "throttle",
+            },
+            "admin": False,
+        },
+        "logging": {"level": "ERROR", "logfile": "/tmp/pygeoapi.log"},
+        "metadata": {
+            "identification": {
+                "title": {"en": "Synthetic service", "pt": "Serviço sintético"},
+                "description": {"en": "Benchmark", "pt": "Benchmark"},
+                "keywords": {"en": list(_WORDS_EN), "pt": list(_WORDS_PT)},
+                "keywords_type": "theme",
+                "terms_of_service": "https://creativecommons.org/licenses/by/4.0/",
+                "url": "https://example.org",
+            },
+            "license": {
+                "name": "CC-BY 4.0 license",
+                "url": "https://creativecommons.org/licenses/by/4.0/",
+            },
+            "provider": {"name": "Organization Name", "url": "https://pygeoapi.io"},
+            "contact": {
+                "name": "Lastname, Firstname",
+                "position": "Position Title",
+                "address": "Mailing Address",
+                "city": "City",
+                "stateorprovince": "Administrative Area",
+                "postalcode": "Zip or Postal Code",
+                "country": "Country",
+                "phone": "+xx-xxx-xxx-xxxx",
+                "fax": "+xx-xxx-xxx-xxxx",
+                "email": "you@example.org",
+                "url": "https://example.org/contact",
+                "hours": "Mo-Fr 08:00-17:00",
+                "instructions": "During hours of service. Off on weekends.",
+                "role": "pointOfContact",
+            },
+        },
+    }
+
+
+def _generate_provider(rng: random.Random, provider_type: ProviderTypes, name: str):
+    if provider_type == ProviderTypes.FEATURE:
+        return {
+            "type": "feature",
+            "name": "PostgreSQL",
+            "data": {
+                "host": "localhost",
+                "port": "5432",
+                "dbname": "geodata",
+                "user": "postgres",
+                "password": "postgres",
+                "search_path": ["public", rng.choice(["osm", "inspire"])],
+            },
+            "crs": rng.sample(_CRS_LIST, 2),
+            "storage_crs": _CRS_LIST[0],
+            "id_field": "id",
+            "table": name,
+            "geom_field": "geom",
+        }
+    if provider_type == ProviderTypes.TILE:
+        return {
+            "type": "tile",
+            "name": "MVT-proxy",
+            "data": f"http://localhost:3000/{name}/{{z}}/{{x}}/{{y}}?f=mvt",
+            "options": {
+                "zoom": {"min": 0, "max": rng.randint(10, 20)},
+                "schemes": ["WebMercatorQuad"],
+            },
+            "format": {"name": "pbf", "mimetype": "application/vnd.mapbox-vector-tile"},
+        }
+    return {
+        "type": "map",
+        "name": "WMSFacade",
+        "data": f"https://example.org/wms/{name}",
+        "options": {"layer": name, "style": "default", "version": "1.3.0"},
+        "format": {"name": "png", "mimetype": "image/png"},
+    }
+
+
+def _generate_resource(
+    rng: random.Random, index: int, name: str, providers_per_type: int
+) -> dict:
+    x_min = round(rng.uniform(-180, 170), 4)
+    y_min = round(rng.uniform(-90, 80), 4)
+    words = rng.sample(range(len(_WORDS_EN)), 3)
+
+    resource = {
+        "type": "collection",
+        "title": {"en": f"Collection {index}", "pt": f"Coleção {index}"},
+        "description": {
+            "en": f"Synthetic collection of {_WORDS_EN[words[0]]}",
+            "pt": f"Coleção sintética de {_WORDS_PT[words[0]]}",
+        },
+        "keywords": {
+            "en": [_WORDS_EN[i] for i in words],
+            "pt": [_WORDS_PT[i] for i in words],
+        },
+        "links": [
+            {
+                "type": "text/html",
+                "rel": "canonical",
+                "href": f"https://example.org/{name}",
+                "title": "information",
+                "hreflang": "en-US",
+            },
+            {
+                "type": "application/json",
+                "rel": "alternate",
+                "href": f"https://example.org/{name}.json",
+                "length": rng.randint(1, 10**6),
+            },
+        ],
+        "extents": {
+            "spatial": {
+                "bbox": [x_min, y_min, x_min + 10, y_min + 10],
+                "crs": _CRS_LIST[0],
+            }
+        },
+        "providers": [
+            _generate_provider(rng, provider_type, name)
+            for provider_type in ProviderTypes
+            for _ in range(providers_per_type)
+        ],
+    }
+
+    # temporal extents for every other resource
+    if index % 2 == 0:
+        begin = datetime(2000, 1, 1, tzinfo=timezone.utc) + timedelta(
+            days=rng.randint(0, 7000)
+        )
+        resource["extents"]["temporal"] = {
+            "begin": begin,
+            "end": begin + timedelta(days=365),
+            "trs": "http://www.opengis.net/def/uom/ISO-8601/0/Gregorian",
+        }
+    return resource
+
+
+def generate_config(
+    resources_count: int, providers_per_type: int = 1, seed: int = 0
+) -> dict:
+    """Generate config content (as read from YAML) with 'resources_count' resources,
+    each with 'providers_per_type' providers of every ProviderTypes, links and localized title/keywords.
+    The output only depends on the arguments.
+    """
+    rng = random.Random(seed)
+    config = _generate_top_level()
+    config["resources"] = {}
+    for index in range(resources_count):
+        name = f"collection_{index:05d}"
+        config["resources"][name] = _generate_resource(
+            rng, index, name, providers_per_type
+        )
+    return config
+
+
+def generate_config_data(resources_count: int) -> ConfigData:
+    """ConfigData read from the generated config (resources not deserialized yet)."""
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(generate_config(resources_count))
+    return config_data
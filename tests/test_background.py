@@ -0,0 +1,66 @@
+import os
+import pytest
+
+from PyQt5.QtCore import QThreadPool
+
+from ..models.config_file import save_config_data
+from ..models.ConfigData import ConfigData
+from ..models.yaml_backend import load_yaml
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from ..ui_widgets.BackgroundWorker import BackgroundWorker, WorkerCanceled
+from .test_config_data import SAMPLE_YAML
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_open_save_in_background(qtbot, tmp_path):
+    """Reading and saving in the worker thread give the same result as the synchronous methods."""
+
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+
+    yaml_path = os.path.join(BASE_DIR, "docker.config.yml")
+    dialog.open_file_in_background(yaml_path)
+    qtbot.waitUntil(lambda: dialog.background_worker is None, timeout=60000)
+    assert dialog.current_file_path == yaml_path
+    assert "ortos-rgb" in dialog.config_data.resources
+
+    saved_path = str(tmp_path / "saved.yml")
+    dialog.save_to_file_in_background(saved_path)
+    qtbot.waitUntil(lambda: dialog.background_worker is None, timeout=60000)
+    assert dialog.current_file_path == saved_path
+    with open(yaml_path, "r", encoding="utf-8") as source, open(
+        saved_path, "r", encoding="utf-8"
+    ) as saved:
+        assert saved.read() == source.read()
+
+
+def test_cancel_worker(qtbot):
+    """Progress callback of a canceled worker stops the task."""
+
+    def task(progress):
+        while True:
+            progress(1, 2)
+
+    worker = BackgroundWorker(task)
+    with qtbot.waitSignal(worker.signals.progress):
+        QThreadPool.globalInstance().start(worker)
+    with qtbot.waitSignal(worker.signals.canceled, timeout=10000):
+        worker.cancel()
+
+
+def test_canceled_save(tmp_path):
+    """A save canceled from the progress callback leaves the file untouched."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+    file_path = tmp_path / "config.yml"
+    file_path.write_text("original", encoding="utf-8")
+
+    def cancel(done, total):
+        raise WorkerCanceled()
+
+    with pytest.raises(WorkerCanceled):
+        save_config_data(config_data, str(file_path), cancel)
+    assert file_path.read_text(encoding="utf-8") == "original"
+    assert os.listdir(tmp_path) == ["config.yml"]
@@ -0,0 +1,272 @@
+import json
+import os
+import time
+import pytest
+
+from ..models.top_level import ResourceConfigTemplate
+from ..models.ConfigData import ConfigData
+from ..models.config_history import ConfigHistory
+from ..models.crs_registry import find_invalid_resource_crs, validate_crs_uri
+from ..models.LazyResourcesDict import LazyResourcesDict
+from ..models.search_index import ResourceSearchIndex
+from ..models.spatial_index import ResourceExtentsIndex
+from ..models.yaml_backend import (
+    LIBYAML_AVAILABLE,
+    dump_config_data,
+    dump_yaml,
+    load_yaml,
+)
+from ..ui_widgets.ResourcesListModel import ResourcesListModel
+from .synthetic_config import generate_config
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_PATH = os.path.join(BASE_DIR, "benchmark_baselines.json")
+
+# allowed slowdown compared to the baseline (baselines come from a different machine, keep it generous)
+REGRESSION_FACTOR = 3.0
+# ignore differences below this value (seconds), too noisy for small configs
+REGRESSION_MIN_DIFF = 0.005
+
+# benchmarks are slow, run them only on demand: PYGEOAPI_CONFIG_BENCHMARK=1 pytest tests/test_benchmarks.py -s
+# to store new baselines, add PYGEOAPI_CONFIG_BENCHMARK_UPDATE=1
+requires_benchmark = pytest.mark.skipif(
+    not os.environ.get("PYGEOAPI_CONFIG_BENCHMARK"),
+    reason="set PYGEOAPI_CONFIG_BENCHMARK=1 to run benchmarks",
+)
+
+
+def _best_time(func, repeats: int) -> float:
+    """Best time (seconds) out of several runs."""
+    best_time = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+
+def _read_baselines() -> dict:
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+    with open(BASELINES_PATH, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_baselines(baselines: dict):
+    with open(BASELINES_PATH, "w", encoding="utf-8") as file:
+        json.dump(baselines, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def test_synthetic_config():
+    """Generated configs are deterministic and fully valid, so benchmarks measure the regular path."""
+
+    dict_content = generate_config(6, providers_per_type=2)
+    assert dict_content == generate_config(6, providers_per_type=2)
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(dict_content)
+    assert config_data.get_deserialization_messages() == ([], [], [])
+    assert config_data.validate_config_data() == []
+    assert len(config_data.resources["collection_00005"].providers) == 6
+
+
+@requires_benchmark
+@pytest.mark.parametrize("resources_count", [10, 1000, 10000])
+def test_model_benchmark(resources_count: int):
+    """Time the model layer operations and compare them with the stored baselines."""
+
+    dict_content = generate_config(resources_count)
+    repeats = 5 if resources_count <= 1000 else 2
+
+    def read_config() -> ConfigData:
+        config_data = ConfigData()
+        config_data.set_data_from_yaml(dict_content)
+        config_data.decode_resources()
+        return config_data
+
+    config_data = read_config()
+    data_dict = config_data.asdict_enum_safe(config_data)
+
+    timings = {
+        "set_data_from_yaml": _best_time(read_config, repeats),
+        "validate_config_data": _best_time(config_data.validate_config_data, repeats),
+        "asdict_enum_safe": _best_time(
+            lambda: config_data.asdict_enum_safe(config_data), repeats
+        ),
+        "dump_yaml": _best_time(lambda: dump_yaml(data_dict), repeats),
+        "dump_config_data": _best_time(lambda: dump_config_data(config_data), repeats),
+    }
+    print(
+        f"_______Model benchmark, {resources_count} resources: "
+        + ", ".join(f"{name} {value:.4f}s" for name, value in timings.items()),
+        flush=True,
+    )
+
+    baselines = _read_baselines()
+    if os.environ.get("PYGEOAPI_CONFIG_BENCHMARK_UPDATE"):
+        baselines[str(resources_count)] = {
+            name: round(value, 5) for name, value in timings.items()
+        }
+        _write_baselines(baselines)
+        return
+
+    baseline = baselines.get(str(resources_count), {})
+    regressions = [
+        f"{name}: {value:.4f}s (baseline {baseline[name]:.4f}s)"
+        for name, value in timings.items()
+        if name in baseline
+        and value > baseline[name] * REGRESSION_FACTOR
+        and value - baseline[name] > REGRESSION_MIN_DIFF
+    ]
+    assert not regressions, f"Slower than baseline: {regressions}"
+
+
+@requires_benchmark
+def test_parallel_decoding_benchmark():
+    """Compare serial and process pool decoding of a 10k-resource config."""
+
+    dict_content = generate_config(10000)
+
+    start = time.perf_counter()
+    serial = ConfigData()
+    serial.set_data_from_yaml(dict_content)
+    serial.decode_resources()
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = ConfigData()
+    parallel.set_data_from_yaml(dict_content, parallel=True)
+    parallel_time = time.perf_counter() - start
+
+    print(
+        f"_______Decoding 10000 resources ({os.cpu_count()} CPUs): serial {serial_time:.3f}s, parallel {parallel_time:.3f}s",
+        flush=True,
+    )
+    assert isinstance(parallel.resources["collection_00000"], ResourceConfigTemplate)
+    assert list(parallel.resources) == list(serial.resources)
+    assert parallel.error_message == serial.error_message
+
+
+@requires_benchmark
+@pytest.mark.skipif(not LIBYAML_AVAILABLE, reason="PyYAML is built without libyaml")
+def test_loader_benchmark():
+    """Compare parsing time of both loaders on the docker config."""
+
+    with open(
+        os.path.join(BASE_DIR, "docker.config.yml"), "r", encoding="utf-8"
+    ) as file:
+        file_content = file.read()
+
+    python_time = _best_time(lambda: load_yaml(file_content, use_libyaml=False), 2)
+    libyaml_time = _best_time(lambda: load_yaml(file_content), 2)
+    print(
+        f"_______YAML load 'docker.config.yml': pure-Python {python_time:.3f}s, libyaml {libyaml_time:.3f}s",
+        flush=True,
+    )
+    assert libyaml_time < python_time
+
+
+@requires_benchmark
+def test_crs_validation_benchmark():
+    """Time the local validation of all CRS of a 10k-resource config."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(generate_config(10000))
+    config_data.decode_resources()
+
+    validate_crs_uri.cache_clear()
+    start = time.perf_counter()
+    invalid_props = [
+        prop
+        for name, resource in config_data.resources.items()
+        for prop in find_invalid_resource_crs(name, resource)
+    ]
+    duration = time.perf_counter() - start
+    print(f"_______CRS validation, 10000 resources: {duration:.3f}s", flush=True)
+    assert invalid_props == []
+
+
+@requires_benchmark
+def test_resources_list_benchmark():
+    """Time the refresh of a 50k-resource list after adding a resource."""
+
+    resources = LazyResourcesDict(lambda name, data: data)
+    for i in range(50000):
+        resources.set_raw(f"resource_{i}", {})
+    model = ResourcesListModel(resources)
+
+    resources.set_raw("new_resource", {})
+    start = time.perf_counter()
+    model.refresh()
+    duration = time.perf_counter() - start
+    print(
+        f"_______Resources list refresh, 50000 rows: {duration * 1000:.1f} ms",
+        flush=True,
+    )
+    assert model.row_of("new_resource") == 50000
+
+
+@requires_benchmark
+def test_search_benchmark():
+    """Time the search index of a 10k-resource config: queries must take well under a frame (16 ms)."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(generate_config(10000))
+    index = ResourceSearchIndex()
+    build_time = _best_time(lambda: index.build(config_data.resources), 1)
+
+    timings = {
+        query: _best_time(lambda: index.search(query), 5)
+        for query in ["lakes", "lak", "lkaes", "collection_01234", "localhost 0123"]
+    }
+    print(
+        f"_______Search index, 10000 resources: build {build_time:.3f}s, "
+        + ", ".join(
+            f"'{query}' {value * 1000:.2f} ms" for query, value in timings.items()
+        ),
+        flush=True,
+    )
+    assert all(value < 0.016 for value in timings.values()), timings
+
+
+@requires_benchmark
+def test_spatial_index_benchmark():
+    """Time the extents index of a 10k-resource config: point queries (map clicks) must take under 5 ms."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(generate_config(10000))
+    index = ResourceExtentsIndex()
+    build_time = _best_time(lambda: index.build(config_data.resources), 1)
+
+    def query_all():
+        for x in range(-180, 180):
+            index.at_point(x, 0)
+
+    query_time = _best_time(query_all, 3) / 360
+    print(
+        f"_______Extents index, 10000 resources: build {build_time:.3f}s, point query {query_time * 1000:.3f} ms",
+        flush=True,
+    )
+    assert query_time < 0.005
+
+
+@requires_benchmark
+def test_history_benchmark():
+    """Time recorded resource edits in a 10k-resource config: independent of the config size, under a frame (16 ms)."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(generate_config(10000))
+    history = ConfigHistory()
+    resources = config_data.resources
+
+    start = time.perf_counter()
+    for i in range(100):
+        name = f"collection_{i:05d}"
+        with history.edit(config_data, [("resources", name)], "Edit"):
+            resources[name].title = {"en": f"Edited {i}"}
+    duration = (time.perf_counter() - start) / 100
+    print(
+        f"_______Recorded edit, 10000 resources: {duration * 1000:.2f} ms", flush=True
+    )
+    assert duration < 0.016
@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+
+from ..models.cli import main
+from ..models.ConfigData import ConfigData
+from ..models.yaml_backend import dump_yaml, load_yaml
+from .test_config_data import SAMPLE_YAML
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_cli_is_qt_free():
+    """The command line entry point must not import Qt or QGIS."""
+
+    package_name = main.__module__.rsplit(".", 2)[0]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {package_name}.models.cli; "
+            "print([m for m in sys.modules if m.split('.')[0] in ('PyQt5', 'qgis')])",
+        ],
+        cwd=os.path.dirname(os.path.dirname(BASE_DIR)),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_cli_report(tmp_path):
+    """Report per file, in the order of arguments; normalized files match the plugin output."""
+
+    sample_path = tmp_path / "sample.yml"
+    sample_path.write_text(SAMPLE_YAML, encoding="utf-8")
+    broken_path = tmp_path / "broken.yml"
+    broken_path.write_text("server: [", encoding="utf-8")
+    report_path = tmp_path / "report.json"
+    output_dir = tmp_path / "normalized"
+
+    exit_code = main(
+        [
+            os.path.join(BASE_DIR, "docker.config.yml"),
+            str(sample_path),
+            str(broken_path),
+            "--jobs",
+            "1",
+            "--output-dir",
+            str(output_dir),
+            "--report",
+            str(report_path),
+        ]
+    )
+    assert exit_code == 1
+
+    reports = json.loads(report_path.read_text(encoding="utf-8"))
+    assert [os.path.basename(r["path"]) for r in reports] == [
+        "docker.config.yml",
+        "sample.yml",
+        "broken.yml",
+    ]
+    assert reports[0]["error"] is None and reports[0]["wrong_types"] == []
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+    assert reports[1]["wrong_types"] == config_data.error_message
+    assert reports[1]["missing"] == config_data.all_missing_props
+    assert reports[1]["invalid"] == config_data.validate_config_data()
+    assert (output_dir / "sample.yml").read_text(encoding="utf-8") == dump_yaml(
+        config_data.asdict_enum_safe(config_data)
+    )
+
+    assert reports[2]["error"].startswith("ParserError")
+    assert reports[2]["normalized"] is None
+
+
+def test_cli_process_pool(tmp_path):
+    """Files checked in worker processes give the same reports as in the main process.
+    Run as the command line does: the workers (spawned on Windows) import the plugin as a package.
+    """
+    sample_path = tmp_path / "sample.yml"
+    sample_path.write_text(SAMPLE_YAML, encoding="utf-8")
+    files = [os.path.join(BASE_DIR, "docker.config.yml"), str(sample_path)]
+    serial_report_path = tmp_path / "serial.json"
+    main(files + ["--jobs", "1", "--report", str(serial_report_path)])
+
+    package_name = main.__module__.rsplit(".", 2)[0]
+    report_path = tmp_path / "report.json"
+    result = subprocess.run(
+        [sys.executable, "-m", f"{package_name}.models.cli"]
+        + files
+        + ["--jobs", "2", "--report", str(report_path)],
+        cwd=os.path.dirname(os.path.dirname(BASE_DIR)),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 1, result.stderr
+    assert json.loads(report_path.read_text(encoding="utf-8")) == json.loads(
+        serial_report_path.read_text(encoding="utf-8")
+    )
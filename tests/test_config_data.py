@@ -0,0 +1,346 @@
+import io
+import os
+import subprocess
+import sys
+import pytest
+
+from ..models.top_level import ResourceConfigTemplate
+from ..models.ConfigData import ConfigData
+from ..models.top_level.providers import ProviderMvtProxy, ProviderPostgresql
+from ..models.yaml_backend import load_yaml
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLE_YAML = """
+server:
+    bind:
+        host: 0.0.0.0
+    url: 42
+    mimetype: application/json; charset=UTF-8
+    encoding: utf-8
+    map:
+        url: https://tile.openstreetmap.org/{z}/{x}/{y}.png
+        attribution: OpenStreetMap contributors
+    gzip: false
+    languages: en-US
+    cors: true
+    pretty_print: true
+    limits: none
+    admin: false
+logging:
+    level: LOUD
+metadata:
+    identification:
+        title: Sample
+        description: Sample service
+        keywords: [sample]
+        keywords_type: theme
+        terms_of_service: https://creativecommons.org/licenses/by/4.0/
+        url: https://example.org
+    provider:
+        name: Organization Name
+        url: https://pygeoapi.io
+    contact:
+        name: Lastname, Firstname
+        position: Position Title
+        address: Mailing Address
+        city: City
+        stateorprovince: Administrative Area
+        postalcode: Zip or Postal Code
+        country: Country
+        phone: +xx-xxx-xxx-xxxx
+        fax: +xx-xxx-xxx-xxxx
+        email: you@example.org
+        url: Contact URL
+        hours: Mo-Fr 08:00-17:00
+        instructions: During hours of service. Off on weekends.
+        role: boss
+resources:
+    lakes:
+        type: collection
+        title: 5
+        keywords: {en: [lakes], pt: [lagos]}
+        links:
+        -   type: text/html
+            rel: canonical
+            href: https://example.org
+            length: many
+        extents:
+            spatial:
+                bbox: [-180, -90, 180, 90, 0]
+        providers:
+        -   type: feature
+            name: PostgreSQL
+            data:
+                host: localhost
+                port: '5432'
+                dbname: db
+                user: user
+                password: secret
+                search_path: [public]
+            id_field: id
+            table: lakes
+            geom_field: geom
+        -   type: feature
+            name: CSV
+            data: lakes.csv
+        -   type: feature
+            name: Elasticsearch
+            data: http://localhost:9200/lakes
+            options:
+                zoom: {min: 0, max: 5}
+                schemes: []
+            format: {name: json, mimetype: application/json}
+    rivers:
+        type: river
+        title: Rivers
+        description: Rivers of the world
+        keywords: [rivers]
+        links: none
+        extents:
+            spatial:
+                bbox: '-10,-10,10,10'
+            temporal:
+                begin: 2000-10-30T18:24:39Z
+        providers:
+        -   type: tile
+            name: MVT-proxy
+            data: https://example.org/{z}/{x}/{y}
+            options:
+                zoom: {min: 0, max: 5}
+                schemes: [WebMercatorQuad]
+            format: {name: pbf, mimetype: application/vnd.mapbox-vector-tile}
+    empty: {}
+"""
+
+
+@pytest.fixture
+def config_data() -> ConfigData:
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+    return config_data
+
+
+def test_deserialization_reports(config_data: ConfigData):
+    """Missing, wrong-type and defaulted properties are reported with their full paths."""
+
+    assert config_data.defaults_message == [
+        "server.bind.port",
+        "metadata.license",
+        "resources.lakes.description",
+        "resources.lakes.extents.spatial.crs",
+        "resources.rivers.extents.spatial.crs",
+        "resources.empty.type",
+        "resources.empty.title",
+        "resources.empty.description",
+        "resources.empty.keywords",
+        "resources.empty.links",
+        "resources.empty.extents",
+        "resources.empty.providers",
+    ]
+    assert config_data.error_message == [
+        "server.url",
+        "server.languages",
+        "server.limits",
+        "logging.level",
+        "metadata.contact.role",
+        "resources.lakes.title",
+        "resources.lakes.links",
+        "resources.lakes.extents.spatial.bbox",
+        "resources.rivers.type",
+        "resources.rivers.links",
+        "resources.rivers.extents.spatial.bbox",
+    ]
+    assert config_data.all_missing_props == [
+        "server.bind.port",
+        "server.url",
+        "server.languages",
+        "server.limits",
+        "logging.level",
+        "metadata.license",
+        "metadata.contact.role",
+        "resources.lakes.title",
+        "resources.lakes.description",
+        "resources.lakes.links",
+        "resources.lakes.extents.spatial.crs",
+        "resources.rivers.type",
+        "resources.rivers.links",
+        "resources.rivers.extents.spatial.bbox",
+        "resources.rivers.extents.spatial.crs",
+        "resources.empty.type",
+        "resources.empty.title",
+        "resources.empty.description",
+        "resources.empty.keywords",
+        "resources.empty.links",
+        "resources.empty.extents",
+        "resources.empty.providers",
+    ]
+
+
+def test_deserialization_values(config_data: ConfigData):
+    """Valid values are cast to the model classes, invalid ones keep the defaults."""
+
+    assert config_data.server.bind.host == "0.0.0.0"
+    assert config_data.server.bind.port == 5000
+    assert config_data.server.url == "http://localhost:5000"
+
+    lakes: ResourceConfigTemplate = config_data.resources["lakes"]
+    assert lakes.keywords == {"en": ["lakes"], "pt": ["lagos"]}
+    assert lakes.extents.spatial.bbox == [-180, -90, 180, 90]
+    assert isinstance(lakes.providers[0], ProviderPostgresql)
+    assert lakes.providers[0].data.search_path == ["public"]
+    assert lakes.providers[1] == {"type": "feature", "name": "CSV", "data": "lakes.csv"}
+
+    rivers: ResourceConfigTemplate = config_data.resources["rivers"]
+    assert rivers.extents.temporal.begin.year == 2000
+    assert isinstance(rivers.providers[0], ProviderMvtProxy)
+    assert rivers.providers[0].options.zoom.max == 5
+
+
+def test_provider_dispatch(config_data: ConfigData):
+    """Providers are decoded by their type and name only, unsupported ones are kept as dict."""
+
+    lakes: ResourceConfigTemplate = config_data.resources["lakes"]
+    assert len(lakes.providers) == 3
+
+    # matches all the fields of ProviderMvtProxy, but it is not an MVT-proxy provider
+    assert isinstance(lakes.providers[2], dict)
+    assert lakes.providers[2]["name"] == "Elasticsearch"
+
+
+def test_lazy_resources(config_data: ConfigData):
+    """Resources are only deserialized when accessed, messages are still available for the whole file."""
+
+    resources = config_data.resources
+    assert list(resources) == ["lakes", "rivers", "empty"]
+    assert not any(resources.is_decoded(name) for name in resources)
+    assert config_data.get_deserialization_messages(decode_resources=False)[1] == [
+        "server.url",
+        "server.languages",
+        "server.limits",
+        "logging.level",
+        "metadata.contact.role",
+    ]
+
+    assert resources["rivers"].title == "Rivers"
+    assert resources.is_decoded("rivers") and not resources.is_decoded("lakes")
+    assert config_data.get_resource_messages("rivers")[1] == [
+        "resources.rivers.type",
+        "resources.rivers.links",
+        "resources.rivers.extents.spatial.bbox",
+    ]
+
+    # renamed resource moves to the end, same as with a plain dict
+    resources["lakes_renamed"] = resources.pop("lakes")
+    assert list(resources) == ["rivers", "empty", "lakes_renamed"]
+    assert resources.index("lakes_renamed") == 2
+    resources.rename("rivers", "rivers_renamed")
+    assert [resources.index(name) for name in resources] == [0, 1, 2]
+    assert resources.index("rivers_renamed") == 0
+
+    # report for the whole file, in the file order
+    assert config_data.error_message[5:8] == [
+        "resources.lakes.title",
+        "resources.lakes.links",
+        "resources.lakes.extents.spatial.bbox",
+    ]
+    assert all(resources.is_decoded(name) for name in resources)
+
+
+def test_parallel_decoding():
+    """Resources decoded in the process pool are identical to the serially decoded ones, in the same order.
+    Run in a new interpreter with 'spawn' workers (default on Windows): the workers re-import the plugin
+    as a package from its parent folder, which the pytest process (importlib mode) cannot provide.
+    """
+    package_name = ConfigData.__module__.rsplit(".", 2)[0]
+    script = f"""
+import multiprocessing
+import sys
+from {package_name}.models.ConfigData import ConfigData
+from {package_name}.models.yaml_backend import load_yaml
+from {package_name}.tests.test_config_data import SAMPLE_YAML
+
+multiprocessing.set_start_method("spawn")
+sys.modules[ConfigData.__module__].PARALLEL_DECODE_THRESHOLD = 2
+
+serial = ConfigData()
+serial.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+parallel = ConfigData()
+parallel.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+parallel.decode_resources(parallel=True, max_workers=2)
+
+assert all(parallel.resources.is_decoded(name) for name in parallel.resources)
+assert list(parallel.resources) == list(serial.resources)
+assert parallel.asdict_enum_safe(parallel) == serial.asdict_enum_safe(serial)
+assert parallel.get_deserialization_messages() == serial.get_deserialization_messages()
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.dirname(BASE_DIR)),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_reload_changes(config_data: ConfigData):
+    """Reload replaces only the sections and resources changed in the file."""
+
+    rivers = config_data.resources["rivers"]
+    server = config_data.server
+
+    dict_content = load_yaml(SAMPLE_YAML)
+    dict_content["logging"]["level"] = "DEBUG"
+    dict_content["resources"]["lakes"]["title"] = "Lakes"
+    del dict_content["resources"]["empty"]
+    dict_content["resources"]["new"] = {"type": "collection"}
+
+    changes = config_data.reload_from_yaml(dict_content)
+    assert changes.sections == ["logging"]
+    assert changes.changed_resources == ["lakes"]
+    assert changes.removed_resources == ["empty"]
+    assert changes.added_resources == ["new"]
+    assert changes.resources_list_changed
+
+    assert config_data.logging.level.value == "DEBUG"
+    assert config_data.server is server
+    assert config_data.resources["rivers"] is rivers
+    assert not config_data.resources.is_decoded("lakes")
+    assert config_data.resources["lakes"].title == "Lakes"
+    assert list(config_data.resources) == ["lakes", "rivers", "new"]
+    assert "resources.lakes.title" not in config_data.error_message
+
+    assert config_data.reload_from_yaml(dict_content).is_empty()
+
+
+def test_reload_after_save(config_data: ConfigData):
+    """Saved data is the new reference: reloading the saved file changes nothing."""
+
+    config_data.resources["rivers"].title = "Rivers and streams"
+    stream = io.StringIO()
+    config_data.write_yaml(stream)
+    saved_content = load_yaml(stream.getvalue())
+    config_data.rebase_hashes()
+
+    assert config_data.reload_from_yaml(saved_content).is_empty()
+
+
+def test_reload_keeps_unsaved_resources(config_data: ConfigData):
+    """Resources added or renamed in the UI and not saved yet are not removed by a reload."""
+
+    resources = config_data.resources
+    resources["added"] = ResourceConfigTemplate(instance_name="added")
+    resources.rename("rivers", "rivers_renamed")
+    assert list(resources) == ["lakes", "rivers_renamed", "empty", "added"]
+
+    dict_content = load_yaml(SAMPLE_YAML)
+    dict_content["resources"]["lakes"]["title"] = "Lakes"
+    del dict_content["resources"]["empty"]
+
+    changes = config_data.reload_from_yaml(dict_content)
+    assert changes.changed_resources == ["lakes"]
+    assert changes.removed_resources == ["empty"]
+    # renamed in the UI: not added back
+    assert changes.added_resources == []
+    assert list(resources) == ["lakes", "rivers_renamed", "added"]
+    assert resources["lakes"].title == "Lakes"
@@ -0,0 +1,89 @@
+import os
+import pytest
+
+from ..models.config_file import (
+    hash_config_data,
+    hash_config_file,
+    hash_config_text,
+    save_config_data,
+)
+from ..models.ConfigData import ConfigData
+from ..models.yaml_backend import dump_config_data, load_yaml
+from .test_config_data import SAMPLE_YAML
+
+
+def _read_config() -> ConfigData:
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+    return config_data
+
+
+def test_save_unchanged(tmp_path):
+    """Unchanged content is not written again, changed content replaces the file."""
+
+    config_data = _read_config()
+    file_path = str(tmp_path / "config.yml")
+
+    written, content_hash = save_config_data(config_data, file_path)
+    assert written
+    assert content_hash == hash_config_file(file_path) == hash_config_data(config_data)
+    with open(file_path, "r", encoding="utf-8") as file:
+        text = file.read()
+    assert text == dump_config_data(config_data)
+    assert hash_config_text(text) == content_hash
+    assert hash_config_text(text.replace("\n", "\r\n")) == content_hash
+
+    os.chmod(file_path, 0o640)
+    mtime = os.stat(file_path).st_mtime_ns
+    assert save_config_data(config_data, file_path) == (False, content_hash)
+    assert os.stat(file_path).st_mtime_ns == mtime
+
+    config_data.server.bind.port = 8080
+    written, new_hash = save_config_data(config_data, file_path)
+    assert written and new_hash != content_hash
+    assert hash_config_file(file_path) == new_hash
+    # permissions of the replaced file are kept
+    assert os.stat(file_path).st_mode & 0o777 == 0o640
+    # no temporary files left behind
+    assert os.listdir(tmp_path) == ["config.yml"]
+
+
+def test_save_error_keeps_file(tmp_path):
+    """If serialization fails, the original file is untouched and the temporary file is removed."""
+
+    file_path = tmp_path / "config.yml"
+    file_path.write_text("original", encoding="utf-8")
+
+    config_data = _read_config()
+    config_data.server.bind = object()
+    with pytest.raises(Exception):
+        save_config_data(config_data, str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == "original"
+    assert os.listdir(tmp_path) == ["config.yml"]
+    assert hash_config_file(str(tmp_path / "missing.yml")) is None
+
+
+def test_save_replaces_non_utf8_file(tmp_path):
+    """An existing file which is not UTF-8 text is replaced, not compared as text."""
+
+    file_path = tmp_path / "config.yml"
+    file_path.write_bytes(b"\xff\xfes\x00e\x00r\x00v\x00e\x00r\x00:\x00")
+    assert hash_config_file(str(file_path)) is not None
+
+    config_data = _read_config()
+    written, content_hash = save_config_data(config_data, str(file_path))
+    assert written
+    assert hash_config_file(str(file_path)) == content_hash
+
+
+def test_save_new_file_mode(tmp_path):
+    """A new file gets the same permissions as a file created with open()."""
+
+    reference_path = tmp_path / "reference.yml"
+    reference_path.write_text("", encoding="utf-8")
+    file_path = tmp_path / "config.yml"
+
+    assert save_config_data(_read_config(), str(file_path))[0]
+    assert os.stat(file_path).st_mode == os.stat(reference_path).st_mode
+    assert sorted(os.listdir(tmp_path)) == ["config.yml", "reference.yml"]
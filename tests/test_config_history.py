@@ -0,0 +1,142 @@
+from ..models.config_history import ConfigHistory
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from .synthetic_config import generate_config_data
+
+
+def test_undo_redo_edit():
+    config_data = generate_config_data(5)
+    history = ConfigHistory()
+    path = ("resources", "collection_00001")
+
+    with history.edit(config_data, [path], "Edit title"):
+        config_data.resources["collection_00001"].title = {"en": "Edited"}
+    assert history.undo_label == "Edit title"
+
+    changes = history.undo(config_data)
+    assert changes.changed_resources == ["collection_00001"]
+    assert config_data.resources["collection_00001"].title != {"en": "Edited"}
+    assert history.can_redo() and not history.can_undo()
+
+    history.redo(config_data)
+    assert config_data.resources["collection_00001"].title == {"en": "Edited"}
+    # the restored entry is a copy: editing it does not change the history
+    config_data.resources["collection_00001"].title = {"en": "Again"}
+    history.undo(config_data)
+    history.redo(config_data)
+    assert config_data.resources["collection_00001"].title == {"en": "Edited"}
+
+
+def test_undo_redo_add_delete_rename():
+    config_data = generate_config_data(5)
+    resources = config_data.resources
+    order = list(resources)
+    history = ConfigHistory()
+
+    with history.edit(config_data, [("resources", "new_resource")], "New"):
+        config_data.add_new_resource()
+    with history.edit(config_data, [("resources", "collection_00002")], "Delete"):
+        del resources["collection_00002"]
+    with history.edit(
+        config_data,
+        [("resources", "collection_00003"), ("resources", "renamed")],
+        "Rename",
+    ):
+        resources.rename("collection_00003", "renamed")
+    renamed_order = list(resources)
+    assert renamed_order.index("renamed") == order.index("collection_00003") - 1
+
+    changes = history.undo(config_data)
+    assert changes.removed_resources == ["renamed"]
+    assert changes.added_resources == ["collection_00003"]
+    changes = history.undo(config_data)
+    assert changes.added_resources == ["collection_00002"]
+    history.undo(config_data)
+    assert list(resources) == order
+
+    for _ in range(3):
+        history.redo(config_data)
+    # renamed resource back at its place
+    assert list(resources) == renamed_order
+
+
+def test_unchanged_edit_not_recorded():
+    config_data = generate_config_data(3)
+    history = ConfigHistory()
+    with history.edit(
+        config_data, [("server",), ("resources", "collection_00001")], "Nothing"
+    ):
+        pass
+    assert not history.can_undo()
+
+
+def test_shared_copies():
+    config_data = generate_config_data(3)
+    history = ConfigHistory()
+    path = ("resources", "collection_00001")
+    for title in ["first", "second"]:
+        with history.edit(config_data, [path], title):
+            config_data.resources["collection_00001"].title = {"en": title}
+
+    first, second = history._undo_steps
+    # only the edited entry is stored, and the copy after the first step is the one before the second
+    assert list(first.after) == [path]
+    assert second.before[path] is first.after[path]
+
+
+def test_edit_copies_edited_only():
+    """Recorded edits copy the edited resources only: the others are not decoded."""
+
+    config_data = generate_config_data(1000)
+    history = ConfigHistory()
+    resources = config_data.resources
+
+    for i in range(100):
+        name = f"collection_{i:05d}"
+        with history.edit(config_data, [("resources", name)], "Edit"):
+            resources[name].title = {"en": f"Edited {i}"}
+    assert not resources.is_decoded("collection_00999")
+    assert [resources.is_decoded(name) for name in resources].count(True) == 100
+    # resources positions are not enumerated again for each edit
+    positions = resources._positions
+    with history.edit(config_data, [("resources", "collection_00500")], "Edit"):
+        resources["collection_00500"].title = {"en": "Edited"}
+    history.undo(config_data)
+    assert positions is not None and resources._positions is positions
+
+
+def test_dialog_undo(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = generate_config_data(5)
+    dialog.ui_setter.refresh_resources_list_ui()
+
+    dialog.new_resource()
+    assert "new_resource" in dialog.config_data.resources
+    assert dialog.model.rowCount() == 6
+
+    dialog.undo()
+    assert "new_resource" not in dialog.config_data.resources
+    assert dialog.model.rowCount() == 5
+    dialog.redo()
+    assert dialog.model.rowCount() == 6
+
+
+def test_dialog_rename_keeps_position(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = generate_config_data(5)
+    dialog.ui_setter.set_ui_from_data()
+    order = list(dialog.config_data.resources)
+
+    dialog.current_res_name = "collection_00001"
+    dialog.load_resource()
+    dialog.lineEditResAlias.setText("renamed")
+    dialog.save_resource_edit_and_preview()
+    renamed_order = [name.replace("collection_00001", "renamed") for name in order]
+    assert list(dialog.config_data.resources) == renamed_order
+    assert dialog.model.data(dialog.model.index(1, 0)) == "renamed"
+
+    dialog.undo()
+    assert list(dialog.config_data.resources) == order
+    dialog.redo()
+    assert list(dialog.config_data.resources) == renamed_order
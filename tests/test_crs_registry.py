@@ -0,0 +1,87 @@
+import os
+import pytest
+
+from ..models.config_file import read_config_file
+from ..models.crs_registry import (
+    CrsStatus,
+    find_invalid_resource_crs,
+    parse_crs_uri,
+    validate_crs_uri,
+)
+
+
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "http://www.opengis.net/def/crs/EPSG/0/4326",
+        "http://www.opengis.net/def/crs/EPSG/0/3857",
+        "http://www.opengis.net/def/crs/EPSG/0/25832",
+        "http://www.opengis.net/def/crs/OGC/1.3/CRS84",
+        "https://www.opengis.net/def/crs/OGC/0/CRS84h",
+    ],
+)
+def test_valid_crs(uri):
+    assert validate_crs_uri(uri)[0] is CrsStatus.VALID
+
+
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "not a url",
+        "http://www.opengis.net/def/crs/EPSG/0",
+        "http://www.opengis.net/def/crs/EPSG/0/abc",
+        "http://www.opengis.net/def/crs/EPSG/0/99999999",
+    ],
+)
+def test_invalid_crs(uri):
+    assert validate_crs_uri(uri)[0] is CrsStatus.INVALID
+
+
+@pytest.mark.parametrize(
+    "uri",
+    [
+        "https://example.org/crs/4326",
+        "http://www.opengis.net/def/crs/FOO/1/2",
+        "http://www.opengis.net/def/crs/EPSG/0/9999",
+    ],
+)
+def test_unknown_crs(uri):
+    """Well-formed URIs not found locally are left to the (optional) online check."""
+    assert validate_crs_uri(uri)[0] is CrsStatus.UNKNOWN
+
+
+def test_parse_crs_uri():
+    assert parse_crs_uri("http://www.opengis.net/def/crs/EPSG/0/4326") == (
+        "EPSG",
+        "0",
+        "4326",
+    )
+    assert parse_crs_uri("http://www.opengis.net/def/crs/EPSG/0/") is None
+    assert parse_crs_uri("https://example.org/crs/4326") is None
+
+
+def test_validate_config_crs():
+    """All CRS of the docker config are validated with the config, without network requests."""
+
+    config_data = read_config_file(
+        os.path.join(os.path.dirname(__file__), "docker.config.yml"),
+        decode_resources=True,
+    )
+    validate_crs_uri.cache_clear()
+
+    assert config_data.validate_config_data() == []
+
+    name, resource = next(iter(config_data.resources.items()))
+    resource.extents.spatial.crs = "http://www.opengis.net/def/crs/EPSG/0/abc"
+    assert find_invalid_resource_crs(name, resource) == [
+        f"resources.{name}.extents.spatial.crs"
+    ]
+    assert config_data.validate_config_data() == [
+        f"resources.{name}.extents.spatial.crs"
+    ]
+
+    # missing values are reported once, as missing
+    resource.extents.spatial.crs = ""
+    assert config_data.validate_config_data() == [
+        f"resources.{name}.extents.spatial.crs"
+    ]
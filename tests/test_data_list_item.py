@@ -0,0 +1,118 @@
+from PyQt5.QtCore import QModelIndex, Qt
+from PyQt5.QtWidgets import QMessageBox
+
+from ..models.ConfigData import ConfigData
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from .synthetic_config import generate_config
+
+
+def _dialog_with_resource(qtbot, providers_per_type=1) -> PygeoapiConfigDialog:
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = ConfigData()
+    dialog.config_data.set_data_from_yaml(generate_config(3, providers_per_type))
+    dialog.ui_setter.set_ui_from_data()
+    dialog.current_res_name = "collection_00001"
+    dialog.load_resource()
+    return dialog
+
+
+def test_entries_hold_values(qtbot):
+    dialog = _dialog_with_resource(qtbot)
+    resource = dialog.config_data.resources["collection_00001"]
+
+    item = dialog.listWidgetResLinks.item(0)
+    assert item.data(Qt.UserRole) is resource.links[0]
+    assert resource.links[0].href in item.text()
+
+    item = dialog.listWidgetResProvider.item(0)
+    assert item.data(Qt.UserRole) is resource.providers[0]
+
+
+def test_values_with_separator(qtbot):
+    dialog = _dialog_with_resource(qtbot)
+    resource = dialog.config_data.resources["collection_00001"]
+
+    # ' | ' in titles and links is kept as is
+    dialog.addResTitleLineEdit.setText("Rivers | Lakes")
+    dialog.comboBoxResTitleLocale.setCurrentText("fr")
+    dialog.add_res_title()
+    dialog.addResLinksTypeLineEdit.setText("text/html")
+    dialog.addResLinksRelLineEdit.setText("canonical")
+    dialog.addResLinksHrefLineEdit.setText("https://example.org/a|b")
+    dialog.addResLinksTitleLineEdit.setText("A | B")
+    dialog.add_res_link()
+
+    dialog.data_from_ui_setter.set_resource_data_from_ui()
+    assert resource.title["fr"] == "Rivers | Lakes"
+    assert resource.links[-1].title == "A | B"
+    assert resource.links[-1].href == "https://example.org/a|b"
+
+
+def test_invalid_link_not_added(qtbot, monkeypatch):
+    dialog = _dialog_with_resource(qtbot)
+    warnings = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: warnings.append(args[-1]))
+    count = dialog.listWidgetResLinks.count()
+
+    dialog.addResLinksTypeLineEdit.setText("text/html")
+    dialog.addResLinksRelLineEdit.setText("canonical")
+    dialog.addResLinksHrefLineEdit.setText("https://example.org")
+    dialog.addResLinksLengthLineEdit.setText("many")
+    dialog.add_res_link()
+
+    assert dialog.listWidgetResLinks.count() == count
+    assert warnings
+    # the entered values are kept, to be corrected
+    assert dialog.addResLinksHrefLineEdit.text() == "https://example.org"
+
+
+def test_delete_provider(qtbot):
+    dialog = _dialog_with_resource(qtbot)
+    resource = dialog.config_data.resources["collection_00001"]
+    providers = list(resource.providers)
+
+    dialog.listWidgetResProvider.setCurrentRow(1)
+    dialog.delete_res_provider()
+    assert resource.providers == providers[:1] + providers[2:]
+    assert dialog.listWidgetResProvider.count() == len(
+        [p for p in resource.providers if not isinstance(p, dict)]
+    )
+
+
+def test_providers_with_same_name(qtbot):
+    dialog = _dialog_with_resource(qtbot, providers_per_type=2)
+    resource = dialog.config_data.resources["collection_00001"]
+    first, second = resource.providers[:2]
+    assert (first.type, first.name) == (second.type, second.name)
+
+    # edit: the provider of the selected row is replaced
+    dialog.listWidgetResProvider.setCurrentRow(1)
+    dialog.edit_res_provider()
+    dialog.provider_window.btn_add.click()
+    assert resource.providers[0] is first
+    assert resource.providers[1] is not second
+    assert resource.providers[1] == second
+    assert dialog.listWidgetResProvider.item(1).data(Qt.UserRole) is (
+        resource.providers[1]
+    )
+
+    # delete: the provider of the selected row is removed
+    edited = resource.providers[1]
+    dialog.listWidgetResProvider.setCurrentRow(0)
+    dialog.delete_res_provider()
+    assert resource.providers[0] is edited
+    assert all(p is not first for p in resource.providers)
+
+
+def test_reorder_providers(qtbot):
+    dialog = _dialog_with_resource(qtbot)
+    resource = dialog.config_data.resources["collection_00001"]
+    providers = list(resource.providers)
+
+    # moved by drag and drop
+    model = dialog.listWidgetResProvider.model()
+    model.moveRow(QModelIndex(), 0, QModelIndex(), model.rowCount())
+    dialog.data_from_ui_setter.set_resource_data_from_ui()
+    assert resource.providers[: len(providers) - 1] == providers[1:]
+    assert resource.providers[len(providers) - 1] is providers[0]
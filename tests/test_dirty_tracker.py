@@ -0,0 +1,56 @@
+from ..models.ConfigData import ConfigData
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from .synthetic_config import generate_config
+
+
+def _dialog(qtbot) -> PygeoapiConfigDialog:
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = ConfigData()
+    dialog.config_data.set_data_from_yaml(generate_config(3))
+    dialog.ui_setter.set_ui_from_data()
+    return dialog
+
+
+def test_only_edited_fields_are_set(qtbot):
+    dialog = _dialog(qtbot)
+    tracker = dialog.data_from_ui_setter.dirty_tracker
+    config_data = dialog.config_data
+    # the UI was set from the data: nothing edited
+    assert not tracker.is_dirty("server.url")
+    assert not tracker.is_dirty("metadata.contact")
+
+    title = config_data.metadata.identification.title
+    dialog.lineEditUrl.setText("http://example.org")
+    assert tracker.is_dirty("server.url")
+
+    dialog.data_from_ui_setter.set_data_from_ui()
+    assert config_data.server.url == "http://example.org"
+    # untouched fields keep their objects
+    assert config_data.metadata.identification.title is title
+    assert not tracker.is_dirty("server.url")
+
+
+def test_unchanged_links_and_providers_keep_identity(qtbot):
+    dialog = _dialog(qtbot)
+    tracker = dialog.data_from_ui_setter.dirty_tracker
+    dialog.current_res_name = "collection_00001"
+    dialog.load_resource()
+    resource = dialog.config_data.resources["collection_00001"]
+    links = list(resource.links)
+    providers = list(resource.providers)
+
+    # not edited: same lists
+    dialog.data_from_ui_setter.set_resource_data_from_ui()
+    assert resource.links == links and resource.links[0] is links[0]
+
+    # one link removed: the others keep their objects
+    dialog.listWidgetResLinks.takeItem(0)
+    dialog.listWidgetResProvider.model().sort(0)
+    assert tracker.is_dirty("resource.links")
+    dialog.data_from_ui_setter.set_resource_data_from_ui()
+    assert len(resource.links) == len(links) - 1
+    assert all(
+        new_link is old_link for new_link, old_link in zip(resource.links, links[1:])
+    )
+    assert {id(p) for p in resource.providers} == {id(p) for p in providers}
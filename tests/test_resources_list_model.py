@@ -0,0 +1,102 @@
+from PyQt5.QtCore import QPersistentModelIndex, QSortFilterProxyModel
+from PyQt5.QtTest import QAbstractItemModelTester
+
+from ..models.LazyResourcesDict import LazyResourcesDict
+from ..models.top_level.ResourceConfigTemplate import ResourceConfigTemplate
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from ..ui_widgets.ResourcesListModel import ResourcesListModel
+
+
+def _resources(names) -> LazyResourcesDict:
+    resources = LazyResourcesDict(lambda name, data: data)
+    for name in names:
+        resources.set_raw(name, {})
+    return resources
+
+
+def _names(model) -> list[str]:
+    return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+
+class _SignalCounter:
+    def __init__(self, model):
+        self.signals = []
+        model.rowsInserted.connect(
+            lambda _, first, last: self.signals.append(("inserted", first, last))
+        )
+        model.rowsRemoved.connect(
+            lambda _, first, last: self.signals.append(("removed", first, last))
+        )
+        model.layoutChanged.connect(lambda: self.signals.append(("layout",)))
+        model.modelReset.connect(lambda: self.signals.append(("reset",)))
+
+
+def test_refresh_updates_rows():
+    resources = _resources(["a", "b", "c", "d"])
+    model = ResourcesListModel(resources)
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    counter = _SignalCounter(model)
+    selected = QPersistentModelIndex(model.index(2, 0))  # "c"
+
+    # new resource at the end, resource deleted
+    resources.set_raw("e", {})
+    del resources["b"]
+    model.refresh()
+    assert _names(model) == ["a", "c", "d", "e"]
+    assert counter.signals == [("removed", 1, 1), ("inserted", 3, 3)]
+    assert selected.row() == 1
+
+    # rename: moved to the end
+    resources["f"] = resources.pop("a")
+    model.refresh()
+    assert _names(model) == ["c", "d", "e", "f"]
+    assert selected.row() == 0
+
+    # reorder (e.g. on reload) keeps the persistent indexes on their items
+    resources.reorder(["f", "e", "d", "c"])
+    counter.signals.clear()
+    model.refresh()
+    assert _names(model) == ["f", "e", "d", "c"]
+    assert counter.signals == [("layout",)]
+    assert selected.row() == 3
+
+    # another mapping: reset
+    model.set_resources(_resources(["x"]))
+    assert _names(model) == ["x"]
+    assert ("reset",) in counter.signals
+
+
+def test_refresh_large_list():
+    """Adding a resource to a large list only inserts its row."""
+
+    resources = _resources([f"resource_{i}" for i in range(50000)])
+    model = ResourcesListModel(resources)
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    counter = _SignalCounter(proxy)
+
+    resources.set_raw("new_resource", {})
+    model.refresh()
+    assert counter.signals == [("inserted", 50000, 50000)]
+    assert model.row_of("new_resource") == 50000
+
+
+def test_dialog_keeps_selection(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    for name in ["a", "b", "c"]:
+        dialog.config_data.resources[name] = ResourceConfigTemplate(instance_name=name)
+    dialog.ui_setter.refresh_resources_list_ui()
+
+    dialog.ui_setter.select_listcollection_item_by_text("c")
+    dialog.config_data.resources["d"] = ResourceConfigTemplate(instance_name="d")
+    dialog.ui_setter.refresh_resources_list_ui()
+    assert dialog.listViewCollection.currentIndex().data() == "c"
+
+    # filtered view
+    dialog.lineEditCollection.setText("b")
+    assert dialog.proxy.rowCount() == 1
+    dialog.current_res_name = "b"
+    dialog.delete_resource()
+    assert dialog.proxy.rowCount() == 0
+    assert dialog.model.rowCount() == 3
@@ -0,0 +1,112 @@
+from ..models.search_index import ResourceSearchIndex
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from .synthetic_config import generate_config_data
+
+
+def test_search():
+    config_data = generate_config_data(20)
+    index = ResourceSearchIndex()
+    index.build(config_data.resources)
+    # resources are indexed from the raw data, without deserializing them
+    assert not any(
+        config_data.resources.is_decoded(name) for name in config_data.resources
+    )
+
+    resources = config_data.resources
+    raw_data = resources.get_raw("collection_00003")
+    keyword = raw_data["keywords"]["pt"][0]
+
+    # localized keyword, prefix, typo, provider table
+    assert "collection_00003" in index.search(keyword)
+    assert "collection_00003" in index.search(keyword[:3])
+    assert "collection_00003" in index.search(keyword[:-1] + "x")
+    assert index.search("collection_00003") == {"collection_00003"}
+    assert index.search("localhost geodata 00003") == {"collection_00003"}
+    assert index.search("nothing like this") == set()
+    assert index.search("  ") is None
+
+    # all words must match
+    assert index.search(f"{keyword} 00003") == {"collection_00003"}
+
+
+def test_fuzzy_search():
+    config_data = generate_config_data(20)
+    index = ResourceSearchIndex()
+    index.build(config_data.resources)
+
+    lakes = index.search("lakes", fuzzy=False)
+    assert lakes
+    # transposition, missing and extra letters
+    for query in ["lkaes", "laks", "lakess"]:
+        assert index.search(query) >= lakes
+        assert index.search(query, fuzzy=False) == set()
+    # numbers are not matched fuzzily
+    assert index.search("00004") == {"collection_00004"}
+
+
+def test_short_query_prefix_only():
+    """Terms shorter than MIN_FUZZY_TERM_LENGTH only match prefixes, longer ones also match shorter words."""
+
+    resources = {"lakes": {"title": "Lakes"}, "oaks": {"title": "Oak trees"}}
+    index = ResourceSearchIndex()
+    index.build(resources)
+
+    # 'oak' is within one edit of 'lak'
+    assert index.search("lak") == {"lakes"}
+    assert index.search("oaky") == {"oaks"}
+
+
+def test_update():
+    config_data = generate_config_data(5)
+    resources = config_data.resources
+    index = ResourceSearchIndex()
+    index.build(resources)
+
+    # edit: old words are not found anymore
+    resource = resources["collection_00001"]
+    resource.title = {"en": "Groundwater wells"}
+    resource.keywords = {}
+    index.sync(resources, ["collection_00001"])
+    assert index.search("groundwater") == {"collection_00001"}
+    assert index.search("wels") == {"collection_00001"}
+
+    # rename and delete
+    resources["aquifers"] = resources.pop("collection_00001")
+    del resources["collection_00002"]
+    index.sync(resources)
+    assert index.search("groundwater") == {"aquifers"}
+    assert index.search("collection_00002") == set()
+    assert len(index) == 4
+
+
+def test_search_large_config():
+    """Exact, prefix, fuzzy and multi-word queries on a 10k-resource config, without decoding it."""
+
+    config_data = generate_config_data(10000)
+    index = ResourceSearchIndex()
+    index.build(config_data.resources)
+
+    for query in ["lakes", "lak", "lkaes", "collection_01234", "localhost 0123"]:
+        assert index.search(query)
+    assert index.search("collection_01234") == {"collection_01234"}
+    assert not config_data.resources.is_decoded("collection_01234")
+
+
+def test_dialog_filter(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = generate_config_data(10)
+    dialog.ui_setter.refresh_resources_list_ui()
+
+    dialog.lineEditCollection.setText("collection_00004")
+    assert dialog.proxy.rowCount() == 1
+
+    # new resources matching the search are shown
+    dialog.config_data.add_new_resource()
+    dialog.ui_setter.refresh_resources_list_ui()
+    assert dialog.proxy.rowCount() == 1
+    dialog.lineEditCollection.setText("new")
+    assert dialog.proxy.rowCount() == 1
+
+    dialog.lineEditCollection.setText("")
+    assert dialog.proxy.rowCount() == 11
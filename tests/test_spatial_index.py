@@ -0,0 +1,228 @@
+import random
+import sys
+
+from PyQt5.QtCore import QPoint, QPointF
+from PyQt5.QtWidgets import QWidget
+
+from ..models.spatial_index import ResourceExtentsIndex, bbox_to_boxes
+from ..pygeoapi_config_dialog import PygeoapiConfigDialog
+from ..ui_widgets.MapSelectionTool import MapSelectionTool
+from ..ui_widgets.UiSetter import UiSetter
+from .synthetic_config import generate_config_data
+
+
+def _brute_force(index: ResourceExtentsIndex, resources, box) -> set[str]:
+    xmin, ymin, xmax, ymax = box
+    return {
+        name
+        for name in resources
+        if any(
+            b[0] <= xmax and xmin <= b[2] and b[1] <= ymax and ymin <= b[3]
+            for b in index.boxes(name)
+        )
+    }
+
+
+def test_bbox_to_boxes():
+    assert bbox_to_boxes([-10, -5, 10, 5]) == [(-10, -5, 10, 5)]
+    # 3D bbox
+    assert bbox_to_boxes([-10, -5, 0, 10, 5, 100]) == [(-10, -5, 10, 5)]
+    # crossing the antimeridian
+    assert bbox_to_boxes([170, -5, -170, 5]) == [
+        (170, -5, 180, 5),
+        (-180, -5, -170, 5),
+    ]
+    assert bbox_to_boxes(None) == []
+    assert bbox_to_boxes(["a", 0, 1, 1]) == []
+    assert bbox_to_boxes([0, 10, 1, 5]) == []
+
+
+def test_queries_match_brute_force():
+    config_data = generate_config_data(2000)
+    resources = config_data.resources
+    index = ResourceExtentsIndex()
+    index.build(resources)
+    # raw resources are not decoded
+    assert not any(resources.is_decoded(name) for name in resources)
+    assert len(index) == 2000
+
+    rng = random.Random(0)
+    for _ in range(100):
+        x, y = rng.uniform(-180, 180), rng.uniform(-90, 90)
+        box = (x, y, x + rng.uniform(0, 30), y + rng.uniform(0, 30))
+        assert index.intersects(*box) == _brute_force(index, resources, box)
+        assert index.at_point(x, y) == _brute_force(index, resources, (x, y, x, y))
+
+
+def test_sync():
+    config_data = generate_config_data(200)
+    resources = config_data.resources
+    index = ResourceExtentsIndex()
+    index.build(resources)
+
+    # changed extent
+    resources["collection_00001"].extents.spatial.bbox = [100, 10, 101, 11]
+    assert index.sync(resources, ["collection_00001"]) == {"collection_00001"}
+    assert "collection_00001" in index.at_point(100.5, 10.5)
+
+    # unchanged extent, removed and renamed resources
+    assert index.sync(resources, ["collection_00002"]) == set()
+    del resources["collection_00001"]
+    resources["renamed"] = resources.pop("collection_00003")
+    assert index.sync(resources) == {"collection_00001", "collection_00003", "renamed"}
+    assert "collection_00001" not in index.at_point(100.5, 10.5)
+    box = index.boxes("renamed")[0]
+    assert "renamed" in index.intersects(*box)
+    assert "collection_00003" not in index.intersects(*box)
+
+    # after many updates, the tree is loaded again
+    for name in list(resources)[:150]:
+        resources[name].extents.spatial.bbox = [-50, -50, -49, -49]
+    index.sync(resources, list(resources)[:150])
+    assert len(index.at_point(-49.5, -49.5)) == 150
+    assert not index._pending
+
+
+def test_map_selection_filter(qtbot):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = generate_config_data(50)
+    dialog.ui_setter.refresh_resources_list_ui()
+
+    box = dialog.extents_index.boxes("collection_00007")[0]
+    names = dialog.extents_index.at_point((box[0] + box[2]) / 2, (box[1] + box[3]) / 2)
+    dialog.proxy.set_map_names(names)
+    assert dialog.proxy.rowCount() == len(names)
+
+    # combined with the search
+    dialog.lineEditCollection.setText("collection_00007")
+    assert dialog.proxy.rowCount() == 1
+    dialog.proxy.set_map_names(None)
+    dialog.lineEditCollection.setText("")
+    assert dialog.proxy.rowCount() == 50
+
+
+class _StubLayer:
+    def __init__(self, *args):
+        self.features = {}
+
+    def dataProvider(self):
+        return self
+
+    def truncate(self):
+        self.features = {}
+
+
+class _StubCanvas(QWidget):
+    def __init__(self):
+        super().__init__()
+        self._layers = []
+
+    def setDestinationCrs(self, crs):
+        pass
+
+    def setCanvasColor(self, color):
+        pass
+
+    def setCachingEnabled(self, enabled):
+        pass
+
+    def setLayers(self, layers):
+        self._layers = layers
+
+    def layers(self):
+        return self._layers
+
+    def zoomToFullExtent(self):
+        pass
+
+    def setMapTool(self, tool):
+        pass
+
+    def mapUnitsPerPixel(self):
+        return 0.1
+
+
+class _MouseEvent:
+    def __init__(self, x: int, y: int):
+        self._pos = QPoint(x, y)
+
+    def pos(self) -> QPoint:
+        return self._pos
+
+
+def _to_map_coordinates(pos: QPoint) -> QPointF:
+    # 10 pixels per degree, (0, 0) in the top left corner at (-180, 90)
+    return QPointF(-180 + pos.x() / 10, 90 - pos.y() / 10)
+
+
+def test_map_selection_tool(qtbot):
+    """Clicks give the clicked point (even if the mouse moved a little), drags a rectangle."""
+
+    tool = MapSelectionTool(QWidget())
+    tool.toMapCoordinates = _to_map_coordinates
+    points, rectangles = [], []
+    tool.pointClicked.connect(lambda x, y: points.append((x, y)))
+    tool.rectangleSelected.connect(lambda *box: rectangles.append(box))
+
+    tool.canvasPressEvent(_MouseEvent(1859, 400))
+    tool.canvasReleaseEvent(_MouseEvent(1860, 400))
+    assert points == [(6.0, 50.0)] and rectangles == []
+
+    # thin drag: still a rectangle
+    tool.canvasPressEvent(_MouseEvent(1900, 400))
+    tool.canvasMoveEvent(_MouseEvent(1950, 400))
+    tool.canvasReleaseEvent(_MouseEvent(1800, 400))
+    assert rectangles == [(0.0, 50.0, 10.0, 50.0)]
+    assert len(points) == 1
+
+
+def _update_stub_overview(layer, feature_ids, boxes_by_name):
+    for name, boxes in boxes_by_name.items():
+        feature_ids[name] = list(range(len(boxes)))
+        layer.features[name] = boxes
+
+
+def test_setup_map_widget(qtbot, monkeypatch):
+    dialog = PygeoapiConfigDialog()
+    qtbot.addWidget(dialog)
+    dialog.config_data = generate_config_data(20)
+    dialog.ui_setter.refresh_resources_list_ui()
+
+    # QGIS classes replaced by stubs
+    ui_setter_module = sys.modules[UiSetter.__module__]
+    for name, stub in [
+        ("QgsRasterLayer", _StubLayer),
+        ("QgsMapCanvas", _StubCanvas),
+        ("QgsCoordinateReferenceSystem", _StubLayer),
+        ("create_rect_layer_from_bbox", _StubLayer),
+        ("create_extents_overview_layer", _StubLayer),
+        ("update_extents_overview_layer", _update_stub_overview),
+    ]:
+        monkeypatch.setattr(ui_setter_module, name, stub, raising=False)
+
+    dialog.ui_setter.setup_map_widget()
+    canvas = dialog.bbox_map_canvas
+    assert canvas.layers() == [dialog.bbox_overview_layer, dialog.bbox_base_layer]
+    # the overview shows the extents of all resources
+    assert set(dialog.bbox_overview_layer.features) == set(dialog.config_data.resources)
+    assert set(dialog.bbox_overview_feature_ids) == set(dialog.config_data.resources)
+
+    # called again: the canvas and layers are reused
+    overview_layer = dialog.bbox_overview_layer
+    dialog.ui_setter.setup_map_widget()
+    assert dialog.bbox_map_canvas is canvas
+    assert dialog.bbox_overview_layer is overview_layer
+
+    # click on a resource extents: the resources at the clicked point are listed
+    box = dialog.extents_index.boxes("collection_00007")[0]
+    x, y = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+    tool = dialog.bbox_map_tool
+    tool.toMapCoordinates = _to_map_coordinates
+    pos = QPoint(round((x + 180) * 10), round((90 - y) * 10))
+    tool.canvasPressEvent(_MouseEvent(pos.x(), pos.y()))
+    tool.canvasReleaseEvent(_MouseEvent(pos.x(), pos.y()))
+    assert dialog.proxy.rowCount() == len(dialog.extents_index.at_point(x, y, 0.3))
+    proxy = dialog.proxy
+    listed = [proxy.data(proxy.index(row, 0)) for row in range(proxy.rowCount())]
+    assert "collection_00007" in listed
@@ -0,0 +1,44 @@
+import json
+
+from ..models.ConfigData import ConfigData
+from ..models.tracing import clear_spans, export_chrome_trace, get_spans, span, traced
+from ..models.yaml_backend import load_yaml
+from .test_config_data import SAMPLE_YAML
+
+
+@traced()
+def _traced_function():
+    with span("inner", value=1):
+        pass
+
+
+def test_spans():
+    """Spans are recorded as complete Chrome trace events, nested spans end first."""
+
+    clear_spans()
+    _traced_function()
+
+    inner, outer = get_spans()
+    assert outer["name"] == "_traced_function"
+    assert inner["name"] == "inner" and inner["args"] == {"value": "1"}
+    assert all(event["ph"] == "X" for event in (inner, outer))
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_chrome_trace_export(tmp_path):
+    """Model hot paths are traced and exported in the trace-event JSON format."""
+
+    clear_spans()
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+    config_data.validate_config_data()
+
+    trace_path = tmp_path / "trace.json"
+    export_chrome_trace(str(trace_path))
+
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert [event["name"] for event in trace["traceEvents"]] == [
+        "ConfigData.set_data_from_yaml",
+        "ConfigData.validate_config_data",
+    ]
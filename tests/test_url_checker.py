@@ -0,0 +1,162 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+import pytest
+
+from ..models.config_file import read_config_file
+from ..models.url_checker import (
+    UrlStatusCache,
+    check_urls,
+    collect_config_urls,
+)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SLOW_RESPONSE = 0.3  # seconds
+CONCURRENT_REQUESTS = 4
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive connections, so that the connections reuse can be counted
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.clients.add(self.client_address)
+
+        if self.path.startswith("/slow"):
+            time.sleep(SLOW_RESPONSE)
+        if self.path.startswith("/concurrent"):
+            # answer only when CONCURRENT_REQUESTS requests are in progress (fails if they are serial)
+            server.barrier.wait()
+        if self.path.startswith("/missing"):
+            status, body = 404, b"not found"
+        elif self.path.startswith("/unavailable"):
+            status, body = 503, b"service unavailable"
+        elif self.path.startswith("/exception"):
+            status, body = 200, b"<ows:ExceptionReport/>"
+        else:
+            status, body = 200, b"<crs/>"
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server standing in for the CRS registry and the services."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.clients = set()
+    server.barrier = threading.Barrier(CONCURRENT_REQUESTS, timeout=5)
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_urls(server):
+    urls = [f"{server.url}/ok", f"{server.url}/missing", f"{server.url}/exception"]
+    streamed = []
+    results = check_urls(
+        urls + urls[:1],
+        progress=lambda done, total, status: streamed.append((done, total, status)),
+    )
+
+    assert [results[url].ok for url in urls] == [True, False, False]
+    assert results[urls[1]].message == "HTTP response status code: 404"
+    # duplicates are requested once, results are streamed one by one
+    assert len(server.requests) == 3
+    assert [(done, total) for done, total, _ in streamed] == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_concurrent_pooled_requests(server):
+    """Requests run concurrently, through a bounded number of reused connections."""
+
+    # 2 rounds of 4 concurrent requests
+    urls = [f"{server.url}/concurrent/{i}" for i in range(2 * CONCURRENT_REQUESTS)]
+    results = check_urls(urls, max_workers=CONCURRENT_REQUESTS)
+
+    assert all(status.ok for status in results.values())
+    assert len(server.clients) <= CONCURRENT_REQUESTS
+
+
+def test_cache(server, tmp_path):
+    cache_path = str(tmp_path / "url_status.json")
+    urls = [f"{server.url}/ok", f"{server.url}/missing"]
+    check_urls(urls, UrlStatusCache(cache_path))
+    assert len(server.requests) == 2
+
+    # results read from the file, no requests
+    results = check_urls(urls, UrlStatusCache(cache_path))
+    assert len(server.requests) == 2
+    assert all(status.cached for status in results.values())
+    assert not results[urls[1]].ok
+
+    # expired results are requested again
+    check_urls(urls, UrlStatusCache(cache_path, ttl=0))
+    assert len(server.requests) == 4
+
+
+def test_transient_failures_not_cached(server, tmp_path):
+    """Server errors and unreachable servers are requested again on the next check."""
+
+    cache_path = str(tmp_path / "url_status.json")
+    # nothing listens on the port of a closed server
+    closed_server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    closed_server.server_close()
+    unreachable_url = f"http://127.0.0.1:{closed_server.server_address[1]}/ok"
+    urls = [f"{server.url}/ok", f"{server.url}/unavailable", unreachable_url]
+
+    results = check_urls(urls, UrlStatusCache(cache_path))
+    assert [results[url].ok for url in urls] == [True, False, False]
+
+    results = check_urls(urls, UrlStatusCache(cache_path))
+    assert [results[url].cached for url in urls] == [True, False, False]
+    assert sorted(server.requests) == ["/ok", "/unavailable", "/unavailable"]
+
+
+def test_cancel(server):
+    """Exception raised from the progress callback cancels the pending requests."""
+
+    def cancel(done, total, status):
+        raise KeyboardInterrupt()
+
+    urls = [f"{server.url}/slow/{i}" for i in range(8)]
+    with pytest.raises(KeyboardInterrupt):
+        check_urls(urls, max_workers=2, progress=cancel)
+    assert len(server.requests) < len(urls)
+
+
+def test_collect_config_urls():
+    config_data = read_config_file(
+        os.path.join(BASE_DIR, "docker.config.yml"), decode_resources=True
+    )
+    urls = collect_config_urls(config_data)
+
+    assert all(url.startswith(("http://", "https://")) for url in urls)
+    # CRS URIs validated locally are not requested
+    assert "http://www.opengis.net/def/crs/OGC/1.3/CRS84" not in urls
+    props = [prop for url_props in urls.values() for prop in url_props]
+    assert any(".links[" in prop for prop in props)
+
+    # invalid CRS URIs are reported, without requests
+    name, resource = next(iter(config_data.resources.items()))
+    invalid_crs = "http://www.opengis.net/def/crs/EPSG/0/abc"
+    resource.extents.spatial.crs = invalid_crs
+    urls = collect_config_urls(config_data)
+    assert urls[invalid_crs] == [f"resources.{name}.extents.spatial.crs"]
+    status = check_urls([invalid_crs])[invalid_crs]
+    assert not status.ok and status.message == "Invalid EPSG code: abc"
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+import io
+import os
+import pytest
+
+from ..models.ConfigData import ConfigData
+from ..models.hashing import hash_yaml_data
+from ..models.top_level.ResourceConfigTemplate import ResourceTemporalConfig
+from ..models.top_level.utils import InlineList
+from ..models.yaml_backend import (
+    LIBYAML_AVAILABLE,
+    dump_config_data,
+    dump_yaml,
+    load_yaml,
+)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+requires_libyaml = pytest.mark.skipif(
+    not LIBYAML_AVAILABLE, reason="PyYAML is built without libyaml"
+)
+
+
+def _read_sample(sample_yaml: str) -> str:
+    with open(os.path.join(BASE_DIR, sample_yaml), "r", encoding="utf-8") as file:
+        return file.read()
+
+
+@requires_libyaml
+@pytest.mark.parametrize("sample_yaml", ["docker.config.yml"])
+def test_loader_parity(sample_yaml: str):
+    """libyaml and pure-Python loaders must produce identical documents."""
+
+    file_content = _read_sample(sample_yaml)
+    assert load_yaml(file_content) == load_yaml(file_content, use_libyaml=False)
+
+
+@requires_libyaml
+@pytest.mark.parametrize("sample_yaml", ["docker.config.yml"])
+def test_dumper_parity(sample_yaml: str):
+    """libyaml and pure-Python dumpers must produce byte-identical output."""
+
+    data = load_yaml(_read_sample(sample_yaml))
+    data["resources"]["inline_types"] = {
+        "bbox": InlineList([-180, -90, 180.5, 90]),
+        "begin": datetime(2020, 1, 1, 12, 30),
+        "end": datetime(2021, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=2))),
+    }
+
+    python_output = dump_yaml(data, use_libyaml=False)
+    libyaml_output = dump_yaml(data)
+
+    assert python_output == libyaml_output
+    assert "bbox: [-180, -90, 180.5, 90]" in libyaml_output
+    assert "begin: 2020-01-01T12:30:00Z" in libyaml_output
+    assert "end: 2021-01-01T10:30:00Z" in libyaml_output
+
+
+@pytest.mark.parametrize("sample_yaml", ["docker.config.yml"])
+@pytest.mark.parametrize("use_libyaml", [True, False])
+def test_streaming_dump_parity(sample_yaml: str, use_libyaml: bool):
+    """Streaming from the dataclasses writes the same output as dumping the asdict tree."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(_read_sample(sample_yaml)))
+    config_data.resources["ortos-rgb"].extents.temporal = ResourceTemporalConfig(
+        begin=datetime(2020, 1, 1, 12, 30),
+        end=datetime(2021, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=2))),
+    )
+
+    expected = dump_yaml(
+        config_data.asdict_enum_safe(config_data), use_libyaml=use_libyaml
+    )
+    stream = io.StringIO()
+    dump_config_data(config_data, stream, use_libyaml=use_libyaml)
+
+    assert stream.getvalue() == expected
+    assert "bbox: [-10.1934, 36.7643, -5.70954, 42.2796]" in expected
+    assert "end: 2021-01-01T10:30:00Z" in expected
+
+    # model objects are hashed as the data they are saved as (used by reload)
+    saved_dict = load_yaml(expected)
+    assert hash_yaml_data(config_data.resources["ortos-rgb"]) == hash_yaml_data(
+        saved_dict["resources"]["ortos-rgb"]
+    )
+    assert hash_yaml_data(config_data.server) == hash_yaml_data(saved_dict["server"])
@@ -0,0 +1,100 @@
+import io
+import os
+import pytest
+
+from ..models.ConfigData import ConfigData
+from ..models.yaml_backend import load_yaml
+from ..models.yaml_events import iter_yaml_config
+from .test_config_data import SAMPLE_YAML
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ANCHORS_YAML = """
+server: &server
+    bind: {host: 0.0.0.0, port: 80}
+logging:
+    level: DEBUG
+resources:
+    first:
+        type: collection
+        title: First
+        providers:
+        -   &postgres
+            type: feature
+            name: PostgreSQL
+            data: {host: localhost, port: '5432', search_path: [public]}
+            table: first
+    second:
+        <<: &defaults
+            type: collection
+            title: Default title
+            description: Default description
+        title: Second
+        providers:
+        -   <<: *postgres
+            table: second
+        -   *postgres
+unknown: *server
+"""
+
+
+def _read_entries(content: str) -> dict:
+    """Rebuild the config content from the streamed entries."""
+    dict_content = {}
+    for path, value in iter_yaml_config(io.StringIO(content)):
+        if len(path) == 2:
+            dict_content.setdefault("resources", {})[path[1]] = value
+        else:
+            dict_content[path[0]] = value
+    return dict_content
+
+
+@pytest.mark.parametrize("content", [SAMPLE_YAML, ANCHORS_YAML])
+def test_entries_parity(content: str):
+    """Streamed entries (including aliases and merge keys) have the same values as safe_load."""
+    assert _read_entries(content) == load_yaml(content)
+
+
+def test_stream_deserialization():
+    """Reading from the stream produces the same data and reports as from the loaded dict."""
+
+    expected = ConfigData()
+    expected.set_data_from_yaml(load_yaml(SAMPLE_YAML))
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml_stream(io.StringIO(SAMPLE_YAML))
+
+    # resources are decoded as soon as they are read
+    assert all(config_data.resources.is_decoded(name) for name in config_data.resources)
+    assert list(config_data.resources) == list(expected.resources)
+    assert config_data.asdict_enum_safe(config_data) == expected.asdict_enum_safe(
+        expected
+    )
+    assert (
+        config_data.get_deserialization_messages()
+        == expected.get_deserialization_messages()
+    )
+
+
+def test_stream_lazy_deserialization():
+    """With decode_resources=False, the streamed resources are kept raw until accessed."""
+
+    config_data = ConfigData()
+    with open(
+        os.path.join(BASE_DIR, "docker.config.yml"), "r", encoding="utf-8"
+    ) as file:
+        config_data.set_data_from_yaml_stream(file, decode_resources=False)
+
+    assert not any(
+        config_data.resources.is_decoded(name) for name in config_data.resources
+    )
+    assert config_data.resources["ortos-rgb"].providers[0].options.layer == (
+        "ortoSat2023-CorVerdadeira"
+    )
+
+
+def test_invalid_content():
+    """Content which is not a config mapping is rejected."""
+
+    with pytest.raises(TypeError):
+        ConfigData().set_data_from_yaml_stream("- a\n- b\n")
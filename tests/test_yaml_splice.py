@@ -0,0 +1,150 @@
+import difflib
+import io
+import os
+
+from ..models.ConfigData import ConfigData
+from ..models.yaml_backend import dump_config_data, load_yaml
+from ..models.yaml_splice import scan_config_layout, splice_config_data
+from .test_config_data import SAMPLE_YAML
+from .test_yaml_events import ANCHORS_YAML
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _docker_text() -> str:
+    with open(
+        os.path.join(BASE_DIR, "docker.config.yml"), "r", encoding="utf-8"
+    ) as file:
+        return file.read()
+
+
+def _hand_written_text() -> str:
+    """Docker config with comments and resources indented by 2 spaces."""
+    header, resources = _docker_text().split("\nresources:\n")
+    resources = "\n".join(line[2:] for line in resources.split("\n"))
+    resources = resources.replace("  ortos-irg:\n", "  # false color\n  ortos-irg:\n")
+    return f"# pygeoapi config\n---\n{header}\nresources:  # collections\n{resources}# end\n"
+
+
+def _read(text: str) -> ConfigData:
+    config_data = ConfigData()
+    config_data.set_data_from_yaml_stream(text, decode_resources=False)
+    return config_data
+
+
+def _write(config_data: ConfigData) -> str:
+    stream = io.StringIO()
+    config_data.write_yaml(stream)
+    return stream.getvalue()
+
+
+def _model(text: str) -> dict:
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(text))
+    return config_data.asdict_enum_safe(config_data)
+
+
+def test_unmodified_save():
+    """Entries not modified are written exactly as they were read, even after deserialization."""
+
+    text = _hand_written_text()
+    config_data = _read(text)
+    config_data.validate_config_data()  # all resources deserialized
+    assert _write(config_data) == text
+
+
+def test_modified_save():
+    """Only the modified entries are serialized again, the rest of the text (and comments) is kept."""
+
+    text = _hand_written_text()
+    config_data = _read(text)
+    config_data.server.gzip = True
+    config_data.resources["ortos-irg"].title = "False color"
+    del config_data.resources["ortos-rgb"]
+    config_data.add_new_resource()
+
+    written = _write(config_data)
+    assert written.startswith("# pygeoapi config\n---\n")
+    assert written.endswith("# end\n")
+    assert "  # false color\n  ortos-irg:\n      type: collection\n" in written
+    assert "\n  new_resource:\n      type: collection\n" in written
+    # same content as the full serialization
+    assert _model(written) == _model(dump_config_data(config_data))
+
+    # diff limited to the edited entries
+    diff = list(difflib.unified_diff(text.split("\n"), written.split("\n"), n=0))
+    assert len(diff) < 150
+    assert written.count("\n") > 10000
+
+    # written text is the reference of the next save
+    config_data.resources["ortos-irg"].title = "False colour"
+    written_again = _write(config_data)
+    assert written_again == written.replace("False color", "False colour")
+
+
+def test_full_serialization():
+    """Splicing with all entries modified gives the same output as dump_config_data."""
+
+    config_data = ConfigData()
+    config_data.set_data_from_yaml(load_yaml(_docker_text()))
+    text = dump_config_data(config_data)
+
+    stream = io.StringIO()
+    layout = splice_config_data(
+        config_data, scan_config_layout(text), stream, lambda path: True
+    )
+    assert stream.getvalue() == layout.text == text
+
+    # without source text, the whole config is serialized
+    assert _write(config_data) == text
+
+
+def test_not_spliceable():
+    """Texts with anchors/aliases or wrong types are normalized."""
+
+    assert scan_config_layout(ANCHORS_YAML) is None
+    config_data = _read(ANCHORS_YAML)
+    assert _write(config_data) == dump_config_data(config_data)
+
+    # values of wrong types were replaced: the entries are written again
+    config_data = _read(SAMPLE_YAML)
+    assert config_data.error_message
+    written = _write(config_data)
+    assert _model(written) == _model(dump_config_data(config_data))
+    assert _read(written).error_message == []
+
+
+def test_empty_resources_save():
+    """A config without resources (in the file, or all deleted) is saved with an empty resources section."""
+
+    header = _hand_written_text().split("\nresources:")[0]
+    text = f"{header}\nresources: {{}}\n"
+    config_data = _read(text)
+    assert _write(config_data) == text
+
+    config_data = _read(_hand_written_text())
+    for resource_name in list(config_data.resources):
+        del config_data.resources[resource_name]
+    written = _write(config_data)
+    assert written.startswith(header)
+    assert load_yaml(written)["resources"] == {}
+    # written text is the reference of the next save
+    assert _write(config_data) == written
+
+
+def test_reload_after_save():
+    """Copied entries keep the hashes of their text: reloading the saved text changes nothing
+    (and does not deserialize the resources)."""
+
+    config_data = _read(_hand_written_text())
+    config_data.resources["ortos-irg"].title = "False color"
+    del config_data.resources["ortos-rgb"]
+    config_data.add_new_resource()
+    written = _write(config_data)
+    config_data.rebase_hashes()
+
+    assert config_data.reload_from_yaml(load_yaml(written), written).is_empty()
+    decoded = [
+        name for name in config_data.resources if config_data.resources.is_decoded(name)
+    ]
+    assert decoded == ["ortos-irg", "new_resource"]
@@ -0,0 +1,62 @@
+import threading
+from typing import Callable
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerCanceled(Exception):
+    """Raised from the progress callback of a canceled BackgroundWorker, to stop the task."""
+
+
+class WorkerSignals(QObject):
+    """Signals of BackgroundWorker: created in the main thread, so the connected slots run in the main thread."""
+
+    progress = pyqtSignal(int, int)  # done, total (0 if unknown)
+    result = pyqtSignal(object)  # partial results, streamed while the task runs
+    finished = pyqtSignal(object)  # result of the task
+    failed = pyqtSignal(str)
+    canceled = pyqtSignal()
+
+
+class BackgroundWorker(QRunnable):
+    """Run a slow task (reading, validating, saving the config) in a QThreadPool thread.
+    The task is called as task(progress), progress(done, total[, result]) reports the progress
+    (and a partial result) and raises WorkerCanceled once cancel() was called.
+    The task must not access any widget.
+    """
+
+    def __init__(self, task: Callable):
+        super().__init__()
+        self.task = task
+        self.signals = WorkerSignals()
+        self._cancel_requested = threading.Event()
+        self._last_percent = None
+
+        # the dialog keeps the reference to the worker (and its signals) until finished
+        self.setAutoDelete(False)
+
+    def cancel(self):
+        self._cancel_requested.set()
+
+    def _progress(self, done: int, total: int, result=None):
+        if self._cancel_requested.is_set():
+            raise WorkerCanceled()
+
+        if result is not None:
+            self.signals.result.emit(result)
+
+        # one signal per percent, not per resource
+        percent = int(done * 100 / total) if total else None
+        if percent != self._last_percent or percent is None:
+            self._last_percent = percent
+            self.signals.progress.emit(done, total)
+
+    def run(self):
+        try:
+            result = self.task(self._progress)
+        except WorkerCanceled:
+            self.signals.canceled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
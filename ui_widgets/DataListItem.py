@@ -0,0 +1,38 @@
+from typing import Any, Callable
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QListWidgetItem
+
+
+class _ItemValue:
+    # stored as is by Qt (dicts and lists would be converted to QVariant maps and lists, losing identity and order)
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class DataListItem(QListWidgetItem):
+    """QListWidget entry holding a value of ConfigData (e.g. ResourceLinkTemplate, provider, (locale, text) pair)
+    in Qt.UserRole. The displayed text is derived from the value, so it is never parsed back.
+    """
+
+    def __init__(self, value: Any, to_text: Callable[[Any], str] = str):
+        super().__init__()
+        self._to_text = to_text
+        self.set_value(value)
+
+    @property
+    def value(self) -> Any:
+        return super().data(Qt.UserRole).value
+
+    def set_value(self, value: Any):
+        super().setData(Qt.UserRole, _ItemValue(value))
+
+    def data(self, role: int) -> Any:
+        # also used by text(), sorting and keyboard search
+        if role == Qt.DisplayRole:
+            return self._to_text(self.value)
+        if role == Qt.UserRole:
+            return self.value
+        return super().data(role)
@@ -1,19 +1,18 @@
 from __future__ import annotations
-import json
 from typing import TYPE_CHECKING
 
 from datetime import datetime
 
 from .utils import get_widget_text_value
+from .DirtyTracker import DirtyTracker
 
 from .data_from_ui_setter_utils import (
+    list_widget_values,
     unpack_locales_values_list_to_dict,
-    unpack_listwidget_values_to_sublists,
 )
 from ..models.top_level.utils import bbox_from_list
 
 from ..models.top_level import (
-    ResourceLinkTemplate,
     ResourceTemporalConfig,
     ResourceTypesEnum,
     ResourceVisibilityEnum,
@@ -23,10 +22,7 @@ from ..models.top_level import (
     ServerOnExceedEnum,
     ServerTemplatesConfig,
 )
-from ..models.top_level.providers import ProviderTemplate
 from ..models.top_level.providers.records import (
-    Languages,
-    ProviderTypes,
     TrsAuthorities,
 )
 
@@ -49,301 +45,377 @@ class DataSetterFromUi:
 
     def __init__(self, dialog: PygeoapiConfigDialog):
         self.dialog = dialog
+        # fields edited in the UI: only these are copied to ConfigData
+        self.dirty_tracker = DirtyTracker()
+
+    def watch_ui_changes(self):
+        """Connect the change signals of the widgets read by set_data_from_ui and set_resource_data_from_ui
+        to the dirty tracker, grouped by the ConfigData fields they set."""
+        dialog: PygeoapiConfigDialog = self.dialog
+        watch = self.dirty_tracker.watch
+
+        # server
+        watch("server.bind", dialog.lineEditHost, dialog.spinBoxPort)
+        watch("server.gzip", dialog.checkBoxGzip)
+        watch("server.pretty_print", dialog.checkBoxPretty)
+        watch("server.admin", dialog.checkBoxAdmin)
+        watch("server.cors", dialog.checkBoxCors)
+        watch(
+            "server.templates",
+            dialog.lineEditTemplatesPath,
+            dialog.lineEditTemplatesStatic,
+        )
+        watch("server.map", dialog.lineEditMapUrl, dialog.lineEditAttribution)
+        watch("server.url", dialog.lineEditUrl)
+        watch("server.languages", dialog.listWidgetLang)
+        watch(
+            "server.limits",
+            dialog.spinBoxDefault,
+            dialog.spinBoxMax,
+            dialog.comboBoxExceed,
+        )
+
+        # logging
+        watch("logging.level", dialog.comboBoxLog)
+        watch("logging.logfile", dialog.lineEditLogfile)
+        watch("logging.logformat", dialog.lineEditLogformat)
+        watch("logging.dateformat", dialog.lineEditDateformat)
+
+        # metadata
+        watch("metadata.identification.title", dialog.listWidgetMetadataIdTitle)
+        watch(
+            "metadata.identification.description",
+            dialog.listWidgetMetadataIdDescription,
+        )
+        watch(
+            "metadata.identification.keywords",
+            dialog.listWidgetMetadataIdKeywords,
+            dialog.comboBoxMetadataIdKeywordsType,
+        )
+        watch(
+            "metadata.identification.terms_of_service", dialog.lineEditMetadataIdTerms
+        )
+        watch("metadata.identification.url", dialog.lineEditMetadataIdUrl)
+        watch(
+            "metadata.license",
+            dialog.lineEditMetadataLicenseName,
+            dialog.lineEditMetadataLicenseUrl,
+        )
+        watch(
+            "metadata.provider",
+            dialog.lineEditMetadataProviderName,
+            dialog.lineEditMetadataProviderUrl,
+        )
+        watch(
+            "metadata.contact",
+            dialog.lineEditMetadataContactName,
+            dialog.lineEditMetadataContactPosition,
+            dialog.lineEditMetadataContactAddress,
+            dialog.lineEditMetadataContactCity,
+            dialog.lineEditMetadataContactState,
+            dialog.lineEditMetadataContactPostal,
+            dialog.lineEditMetadataContactCountry,
+            dialog.lineEditMetadataContactPhone,
+            dialog.lineEditMetadataContactFax,
+            dialog.lineEditMetadataContactEmail,
+            dialog.lineEditMetadataContactUrl,
+            dialog.lineEditMetadataContactHours,
+            dialog.lineEditMetadataContactInstructions,
+            dialog.comboBoxMetadataContactRole,
+        )
+
+        # resource
+        watch("resource.type", dialog.comboBoxResType)
+        watch("resource.title", dialog.listWidgetResTitle)
+        watch("resource.description", dialog.listWidgetResDescription)
+        watch("resource.keywords", dialog.listWidgetResKeywords)
+        watch("resource.visibility", dialog.comboBoxResVisibility)
+        watch(
+            "resource.extents.spatial.bbox",
+            dialog.lineEditResExtentsSpatialXMin,
+            dialog.lineEditResExtentsSpatialYMin,
+            dialog.lineEditResExtentsSpatialXMax,
+            dialog.lineEditResExtentsSpatialYMax,
+        )
+        watch(
+            "resource.extents.spatial.crs",
+            dialog.comboBoxResExtentsSpatialCrsType,
+            dialog.lineEditResExtentsSpatialCrs,
+        )
+        watch(
+            "resource.extents.temporal",
+            dialog.lineEditResExtentsTemporalBegin,
+            dialog.lineEditResExtentsTemporalEnd,
+            dialog.comboBoxResExtentsTemporalTrs,
+        )
+        watch("resource.links", dialog.listWidgetResLinks)
+        watch(
+            "resource.providers",
+            dialog.listWidgetResProvider,
+            dialog.listWidgetResReadOnlyProviders,
+        )
 
     def set_data_from_ui(self):
-        """Collect all data from the main UI tabs and save to ConfigData."""
+        """Collect the data edited in the main UI tabs and save to ConfigData.
+        Only the fields of the widgets changed since the UI was set are copied (see DirtyTracker).
+        """
         dialog: PygeoapiConfigDialog = self.dialog
         config_data: ConfigData = dialog.config_data
+        tracker = self.dirty_tracker
 
         # bind
-        config_data.server.bind.host = dialog.lineEditHost.text()
-        config_data.server.bind.port = dialog.spinBoxPort.value()
+        if tracker.is_dirty("server.bind"):
+            config_data.server.bind.host = dialog.lineEditHost.text()
+            config_data.server.bind.port = dialog.spinBoxPort.value()
 
         # gzip
-        config_data.server.gzip = dialog.checkBoxGzip.isChecked()
+        if tracker.is_dirty("server.gzip"):
+            config_data.server.gzip = dialog.checkBoxGzip.isChecked()
 
         # pretty print
-        config_data.server.pretty_print = dialog.checkBoxPretty.isChecked()
+        if tracker.is_dirty("server.pretty_print"):
+            config_data.server.pretty_print = dialog.checkBoxPretty.isChecked()
 
         # admin
-        config_data.server.admin = dialog.checkBoxAdmin.isChecked()
+        if tracker.is_dirty("server.admin"):
+            config_data.server.admin = dialog.checkBoxAdmin.isChecked()
 
         # cors
-        config_data.server.cors = dialog.checkBoxCors.isChecked()
+        if tracker.is_dirty("server.cors"):
+            config_data.server.cors = dialog.checkBoxCors.isChecked()
 
         # templates
-        if is_valid_string(dialog.lineEditTemplatesPath.text()) or is_valid_string(
-            dialog.lineEditTemplatesStatic.text()
-        ):
-            config_data.server.templates = ServerTemplatesConfig()
-        else:
-            config_data.server.templates = None
-
-        if config_data.server.templates:
-            config_data.server.templates.path = dialog.lineEditTemplatesPath.text()
-            config_data.server.templates.static = dialog.lineEditTemplatesStatic.text()
+        if tracker.is_dirty("server.templates"):
+            if is_valid_string(dialog.lineEditTemplatesPath.text()) or is_valid_string(
+                dialog.lineEditTemplatesStatic.text()
+            ):
+                config_data.server.templates = ServerTemplatesConfig()
+            else:
+                config_data.server.templates = None
+
+            if config_data.server.templates:
+                config_data.server.templates.path = dialog.lineEditTemplatesPath.text()
+                config_data.server.templates.static = (
+                    dialog.lineEditTemplatesStatic.text()
+                )
 
         # map
-        config_data.server.map.url = dialog.lineEditMapUrl.text()
-        config_data.server.map.attribution = dialog.lineEditAttribution.text()
+        if tracker.is_dirty("server.map"):
+            config_data.server.map.url = dialog.lineEditMapUrl.text()
+            config_data.server.map.attribution = dialog.lineEditAttribution.text()
 
         # url
-        config_data.server.url = dialog.lineEditUrl.text()
+        if tracker.is_dirty("server.url"):
+            config_data.server.url = dialog.lineEditUrl.text()
 
         # language
-        config_data.server.languages = []
-        for i in range(dialog.listWidgetLang.count()):
-            item = dialog.listWidgetLang.item(i)
-            if item.isSelected():
-                config_data.server.languages.append(item.text())
+        if tracker.is_dirty("server.languages"):
+            config_data.server.languages = []
+            for i in range(dialog.listWidgetLang.count()):
+                item = dialog.listWidgetLang.item(i)
+                if item.isSelected():
+                    config_data.server.languages.append(item.text())
 
         # limits
-        config_data.server.limits.default_items = dialog.spinBoxDefault.value()
-        config_data.server.limits.max_items = dialog.spinBoxMax.value()
+        if tracker.is_dirty("server.limits"):
+            config_data.server.limits.default_items = dialog.spinBoxDefault.value()
+            config_data.server.limits.max_items = dialog.spinBoxMax.value()
 
-        config_data.server.limits.on_exceed = get_enum_value_from_string(
-            ServerOnExceedEnum, dialog.comboBoxExceed.currentText()
-        )
+            config_data.server.limits.on_exceed = get_enum_value_from_string(
+                ServerOnExceedEnum, dialog.comboBoxExceed.currentText()
+            )
 
         # logging
-        config_data.logging.level = get_enum_value_from_string(
-            LoggingLevel, dialog.comboBoxLog.currentText()
-        )
+        if tracker.is_dirty("logging.level"):
+            config_data.logging.level = get_enum_value_from_string(
+                LoggingLevel, dialog.comboBoxLog.currentText()
+            )
 
-        if is_valid_string(dialog.lineEditLogfile.text()):
-            config_data.logging.logfile = dialog.lineEditLogfile.text()
-        else:
-            config_data.logging.logfile = None
+        if tracker.is_dirty("logging.logfile"):
+            if is_valid_string(dialog.lineEditLogfile.text()):
+                config_data.logging.logfile = dialog.lineEditLogfile.text()
+            else:
+                config_data.logging.logfile = None
 
-        if is_valid_string(dialog.lineEditLogformat.text()):
-            config_data.logging.logformat = dialog.lineEditLogformat.text()
-        else:
-            config_data.logging.logformat = None
+        if tracker.is_dirty("logging.logformat"):
+            if is_valid_string(dialog.lineEditLogformat.text()):
+                config_data.logging.logformat = dialog.lineEditLogformat.text()
+            else:
+                config_data.logging.logformat = None
 
-        if is_valid_string(dialog.lineEditDateformat.text()):
-            config_data.logging.dateformat = dialog.lineEditDateformat.text()
-        else:
-            config_data.logging.dateformat = None
+        if tracker.is_dirty("logging.dateformat"):
+            if is_valid_string(dialog.lineEditDateformat.text()):
+                config_data.logging.dateformat = dialog.lineEditDateformat.text()
+            else:
+                config_data.logging.dateformat = None
 
         # metadata identification
-        config_data.metadata.identification.title = unpack_locales_values_list_to_dict(
-            dialog.listWidgetMetadataIdTitle, False
-        )
-        config_data.metadata.identification.description = (
-            unpack_locales_values_list_to_dict(
+        identification = config_data.metadata.identification
+        if tracker.is_dirty("metadata.identification.title"):
+            identification.title = unpack_locales_values_list_to_dict(
+                dialog.listWidgetMetadataIdTitle, False
+            )
+        if tracker.is_dirty("metadata.identification.description"):
+            identification.description = unpack_locales_values_list_to_dict(
                 dialog.listWidgetMetadataIdDescription, False
             )
-        )
-        config_data.metadata.identification.keywords = (
-            unpack_locales_values_list_to_dict(
+        if tracker.is_dirty("metadata.identification.keywords"):
+            identification.keywords = unpack_locales_values_list_to_dict(
                 dialog.listWidgetMetadataIdKeywords, True
             )
-        )
-
-        config_data.metadata.identification.keywords_type = get_enum_value_from_string(
-            MetadataKeywordTypeEnum, dialog.comboBoxMetadataIdKeywordsType.currentText()
-        )
-        config_data.metadata.identification.terms_of_service = (
-            dialog.lineEditMetadataIdTerms.text()
-        )
-        config_data.metadata.identification.url = dialog.lineEditMetadataIdUrl.text()
+            identification.keywords_type = get_enum_value_from_string(
+                MetadataKeywordTypeEnum,
+                dialog.comboBoxMetadataIdKeywordsType.currentText(),
+            )
+        if tracker.is_dirty("metadata.identification.terms_of_service"):
+            identification.terms_of_service = dialog.lineEditMetadataIdTerms.text()
+        if tracker.is_dirty("metadata.identification.url"):
+            identification.url = dialog.lineEditMetadataIdUrl.text()
 
         # metadata license
-        config_data.metadata.license.name = dialog.lineEditMetadataLicenseName.text()
-        config_data.metadata.license.url = dialog.lineEditMetadataLicenseUrl.text()
+        if tracker.is_dirty("metadata.license"):
+            config_data.metadata.license.name = (
+                dialog.lineEditMetadataLicenseName.text()
+            )
+            config_data.metadata.license.url = dialog.lineEditMetadataLicenseUrl.text()
 
         # metadata provider
-        config_data.metadata.provider.name = dialog.lineEditMetadataProviderName.text()
-        config_data.metadata.provider.url = dialog.lineEditMetadataProviderUrl.text()
+        if tracker.is_dirty("metadata.provider"):
+            config_data.metadata.provider.name = (
+                dialog.lineEditMetadataProviderName.text()
+            )
+            config_data.metadata.provider.url = (
+                dialog.lineEditMetadataProviderUrl.text()
+            )
 
         # metadata contact
-        config_data.metadata.contact.name = dialog.lineEditMetadataContactName.text()
-        config_data.metadata.contact.position = (
-            dialog.lineEditMetadataContactPosition.text()
-        )
-        config_data.metadata.contact.address = (
-            dialog.lineEditMetadataContactAddress.text()
-        )
-        config_data.metadata.contact.city = dialog.lineEditMetadataContactCity.text()
-        config_data.metadata.contact.stateorprovince = (
-            dialog.lineEditMetadataContactState.text()
-        )
-        config_data.metadata.contact.postalcode = (
-            dialog.lineEditMetadataContactPostal.text()
-        )
-        config_data.metadata.contact.country = (
-            dialog.lineEditMetadataContactCountry.text()
-        )
-        config_data.metadata.contact.phone = dialog.lineEditMetadataContactPhone.text()
-        config_data.metadata.contact.fax = dialog.lineEditMetadataContactFax.text()
-        config_data.metadata.contact.email = dialog.lineEditMetadataContactEmail.text()
-        config_data.metadata.contact.url = dialog.lineEditMetadataContactUrl.text()
-        config_data.metadata.contact.hours = dialog.lineEditMetadataContactHours.text()
-        config_data.metadata.contact.instructions = (
-            dialog.lineEditMetadataContactInstructions.text()
-        )
-        config_data.metadata.contact.role = get_enum_value_from_string(
-            MetadataRoleEnum,
-            dialog.comboBoxMetadataContactRole.currentText(),
-        )
+        if tracker.is_dirty("metadata.contact"):
+            contact = config_data.metadata.contact
+            contact.name = dialog.lineEditMetadataContactName.text()
+            contact.position = dialog.lineEditMetadataContactPosition.text()
+            contact.address = dialog.lineEditMetadataContactAddress.text()
+            contact.city = dialog.lineEditMetadataContactCity.text()
+            contact.stateorprovince = dialog.lineEditMetadataContactState.text()
+            contact.postalcode = dialog.lineEditMetadataContactPostal.text()
+            contact.country = dialog.lineEditMetadataContactCountry.text()
+            contact.phone = dialog.lineEditMetadataContactPhone.text()
+            contact.fax = dialog.lineEditMetadataContactFax.text()
+            contact.email = dialog.lineEditMetadataContactEmail.text()
+            contact.url = dialog.lineEditMetadataContactUrl.text()
+            contact.hours = dialog.lineEditMetadataContactHours.text()
+            contact.instructions = dialog.lineEditMetadataContactInstructions.text()
+            contact.role = get_enum_value_from_string(
+                MetadataRoleEnum,
+                dialog.comboBoxMetadataContactRole.currentText(),
+            )
+
+        # data and UI are the same again
+        tracker.mark_clean("server")
+        tracker.mark_clean("logging")
+        tracker.mark_clean("metadata")
 
     def set_resource_data_from_ui(self):
-        """Collect data from Resource UI and add to ConfigData."""
+        """Collect the data edited in Resource UI and add to ConfigData.
+        Links and providers are the values of the list entries: unchanged ones keep their objects.
+        """
         dialog: PygeoapiConfigDialog = self.dialog
         config_data: ConfigData = dialog.config_data
         res_name = dialog.current_res_name
+        resource = config_data.resources[res_name]
+        tracker = self.dirty_tracker
 
-        config_data.resources[res_name].type = get_enum_value_from_string(
-            ResourceTypesEnum, dialog.comboBoxResType.currentText()
-        )
-        config_data.resources[res_name].title = unpack_locales_values_list_to_dict(
-            dialog.listWidgetResTitle, False
-        )
-        config_data.resources[res_name].description = (
-            unpack_locales_values_list_to_dict(dialog.listWidgetResDescription, False)
-        )
-        config_data.resources[res_name].keywords = unpack_locales_values_list_to_dict(
-            dialog.listWidgetResKeywords, True
-        )
+        if tracker.is_dirty("resource.type"):
+            resource.type = get_enum_value_from_string(
+                ResourceTypesEnum, dialog.comboBoxResType.currentText()
+            )
+        if tracker.is_dirty("resource.title"):
+            resource.title = unpack_locales_values_list_to_dict(
+                dialog.listWidgetResTitle, False
+            )
+        if tracker.is_dirty("resource.description"):
+            resource.description = unpack_locales_values_list_to_dict(
+                dialog.listWidgetResDescription, False
+            )
+        if tracker.is_dirty("resource.keywords"):
+            resource.keywords = unpack_locales_values_list_to_dict(
+                dialog.listWidgetResKeywords, True
+            )
 
         # visibility: if empty, ignore
-        if is_valid_string(dialog.comboBoxResVisibility.currentText()):
-            config_data.resources[res_name].visibility = get_enum_value_from_string(
-                ResourceVisibilityEnum, dialog.comboBoxResVisibility.currentText()
-            )
-        else:
-            config_data.resources[res_name].visibility = None
+        if tracker.is_dirty("resource.visibility"):
+            if is_valid_string(dialog.comboBoxResVisibility.currentText()):
+                resource.visibility = get_enum_value_from_string(
+                    ResourceVisibilityEnum, dialog.comboBoxResVisibility.currentText()
+                )
+            else:
+                resource.visibility = None
 
         # spatial bbox
-        raw_bbox_list = [
-            get_widget_text_value(x)
-            for x in [
-                dialog.lineEditResExtentsSpatialXMin,
-                dialog.lineEditResExtentsSpatialYMin,
-                dialog.lineEditResExtentsSpatialXMax,
-                dialog.lineEditResExtentsSpatialYMax,
+        if tracker.is_dirty("resource.extents.spatial.bbox"):
+            raw_bbox_list = [
+                get_widget_text_value(x)
+                for x in [
+                    dialog.lineEditResExtentsSpatialXMin,
+                    dialog.lineEditResExtentsSpatialYMin,
+                    dialog.lineEditResExtentsSpatialXMax,
+                    dialog.lineEditResExtentsSpatialYMax,
+                ]
             ]
-        ]
-        # this loop is to not add empty decimals unnecessarily
-        config_data.resources[res_name].extents.spatial.bbox = InlineList(
-            bbox_from_list(raw_bbox_list)
-        )
+            # this loop is to not add empty decimals unnecessarily
+            resource.extents.spatial.bbox = InlineList(bbox_from_list(raw_bbox_list))
 
         # spatial crs
-        config_data.resources[res_name].extents.spatial.crs = (
-            self.get_extents_crs_from_ui(dialog)
-        )
+        if tracker.is_dirty("resource.extents.spatial.crs"):
+            resource.extents.spatial.crs = self.get_extents_crs_from_ui(dialog)
 
         # temporal: only initialize if any of the values are present, otherwise leave as default None
         # IGNORE trs if no other values are present
-        temporal_begin = None
-        temporal_end = None
-        if is_valid_string(dialog.lineEditResExtentsTemporalBegin.text()):
-            temporal_begin = datetime.strptime(
-                dialog.lineEditResExtentsTemporalBegin.text(),
-                "%Y-%m-%dT%H:%M:%SZ",
-            )
-        if is_valid_string(dialog.lineEditResExtentsTemporalEnd.text()):
-            temporal_end = datetime.strptime(
-                dialog.lineEditResExtentsTemporalEnd.text(),
-                "%Y-%m-%dT%H:%M:%SZ",
-            )
+        if tracker.is_dirty("resource.extents.temporal"):
+            temporal_begin = None
+            temporal_end = None
+            if is_valid_string(dialog.lineEditResExtentsTemporalBegin.text()):
+                temporal_begin = datetime.strptime(
+                    dialog.lineEditResExtentsTemporalBegin.text(),
+                    "%Y-%m-%dT%H:%M:%SZ",
+                )
+            if is_valid_string(dialog.lineEditResExtentsTemporalEnd.text()):
+                temporal_end = datetime.strptime(
+                    dialog.lineEditResExtentsTemporalEnd.text(),
+                    "%Y-%m-%dT%H:%M:%SZ",
+                )
 
-        if temporal_begin or temporal_end:
-            config_data.resources[res_name].extents.temporal = ResourceTemporalConfig()
+            if temporal_begin or temporal_end:
+                resource.extents.temporal = ResourceTemporalConfig()
 
-            config_data.resources[res_name].extents.temporal.begin = temporal_begin
-            config_data.resources[res_name].extents.temporal.end = temporal_end
-            config_data.resources[res_name].extents.temporal.trs = (
-                get_enum_value_from_string(
+                resource.extents.temporal.begin = temporal_begin
+                resource.extents.temporal.end = temporal_end
+                resource.extents.temporal.trs = get_enum_value_from_string(
                     TrsAuthorities,
                     get_widget_text_value(dialog.comboBoxResExtentsTemporalTrs),
                 )
-            )
 
         # links
-        config_data.resources[res_name].links = []
-        links_data_lists = unpack_listwidget_values_to_sublists(
-            dialog.listWidgetResLinks, 6
-        )
-        for link in links_data_lists:
-            new_link = ResourceLinkTemplate()
-            new_link.type = link[0]
-            new_link.rel = link[1]
-            new_link.href = link[2]
-
-            if is_valid_string(link[3]):
-                new_link.title = link[3]
-            if is_valid_string(link[4]):
-                new_link.hreflang = get_enum_value_from_string(
-                    Languages,
-                    link[4],
-                )
-            if is_valid_string(link[5]):
-                new_link.length = int(link[5])
-
-            config_data.resources[res_name].links.append(new_link)
+        if tracker.is_dirty("resource.links"):
+            resource.links = list_widget_values(dialog.listWidgetResLinks)
 
         # providers
-        config_data.resources[res_name].providers = []
-
-        # add editable providers from a widget
-        providers_data_lists: list[list] = unpack_listwidget_values_to_sublists(
-            dialog.listWidgetResProvider
-        )
-
-        for pr in providers_data_lists:
-            provider_type = get_enum_value_from_string(ProviderTypes, pr[0])
-            new_pr = ProviderTemplate.init_provider_from_type(provider_type)
-            new_pr.assign_value_list_to_provider_data(pr)
-
-            config_data.resources[res_name].providers.append(new_pr)
+        if tracker.is_dirty("resource.providers"):
+            resource.providers = self._get_providers_from_ui()
 
-        # add read-only providers from another widget
-        read_only_providers_data_lists: list[list] = (
-            unpack_listwidget_values_to_sublists(
-                dialog.listWidgetResReadOnlyProviders, 1
-            )
-        )
-        for read_pr in read_only_providers_data_lists:
-            new_read_pr = read_pr[0]
-            config_data.resources[res_name].providers.append(json.loads(new_read_pr))
-
-        # change resource key to a new alias
+        # change resource key to a new alias, keeping its place in the file
         new_alias = dialog.lineEditResAlias.text()
         if res_name in config_data.resources:
-            config_data.resources[new_alias] = config_data.resources.pop(res_name)
+            config_data.resources.rename(res_name, new_alias)
 
-    def delete_selected_provider_type_and_name(self, list_widget):
-        """Find and remove first matching resource provider with specified type and name."""
-        dialog: PygeoapiConfigDialog = self.dialog
-        config_data: ConfigData = dialog.config_data
-        res_name = dialog.current_res_name
+        # data and UI are the same again
+        tracker.mark_clean("resource")
 
-        # get selected provider data from a widget (by selection index)
-        providers_data_lists: list[list] = unpack_listwidget_values_to_sublists(
-            list_widget
-        )
-        selected_index = list_widget.currentRow()
-        if selected_index < 0:
-            return
-        selected_pr_data = providers_data_lists[selected_index]
-        selected_pr_type = get_enum_value_from_string(
-            ProviderTypes, selected_pr_data[0]
+    def _get_providers_from_ui(self) -> list:
+        """Providers of the Resource UI lists: editable ones first, then read-only ones."""
+        dialog: PygeoapiConfigDialog = self.dialog
+        return list_widget_values(dialog.listWidgetResProvider) + list_widget_values(
+            dialog.listWidgetResReadOnlyProviders
         )
-        selected_pr_name = selected_pr_data[1]
-
-        # iterate through resource providers and delete the first matching one
-        for res_provider in config_data.resources[res_name].providers:
-            if isinstance(res_provider, dict):
-                continue  # ignore read-only providers
-
-            if (
-                res_provider.name == selected_pr_name
-                and res_provider.type == selected_pr_type
-            ):
-                config_data.resources[res_name].providers.remove(res_provider)
-                break
 
     def get_extents_crs_from_ui(self, dialog):
         return (
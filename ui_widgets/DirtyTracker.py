@@ -0,0 +1,63 @@
+from PyQt5.QtWidgets import (
+    QAbstractButton,
+    QComboBox,
+    QDoubleSpinBox,
+    QLineEdit,
+    QListWidget,
+    QSpinBox,
+)
+
+
+class DirtyTracker:
+    """Keys of the ConfigData fields edited in the UI since they were set from (or saved to) ConfigData.
+    Keys are dotted paths (e.g. 'server.bind', 'resource.links'): mark_clean('server') cleans all 'server.*' keys.
+    """
+
+    def __init__(self):
+        self._keys: set[str] = set()
+        self._dirty: set[str] = set()
+
+    def watch(self, key: str, *widgets):
+        """Mark the key dirty when any of the widgets changes."""
+        self._keys.add(key)
+        for widget in widgets:
+            for signal in _change_signals(widget):
+                signal.connect(lambda *args, key=key: self._dirty.add(key))
+
+    def is_dirty(self, key: str) -> bool:
+        return key in self._dirty
+
+    def mark_clean(self, prefix: str = ""):
+        """Clean the keys equal to the prefix or below it (all keys for an empty prefix)."""
+        if not prefix:
+            self._dirty.clear()
+            return
+        self._dirty = {
+            key
+            for key in self._dirty
+            if key != prefix and not key.startswith(prefix + ".")
+        }
+
+
+def _change_signals(widget) -> list:
+    if isinstance(widget, QLineEdit):
+        return [widget.textChanged]
+    if isinstance(widget, QComboBox):
+        return [widget.currentTextChanged]
+    if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
+        return [widget.valueChanged]
+    if isinstance(widget, QAbstractButton):
+        return [widget.toggled]
+    if isinstance(widget, QListWidget):
+        # items added, removed, edited or sorted, and selection (e.g. server languages)
+        model = widget.model()
+        return [
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.dataChanged,
+            model.layoutChanged,
+            model.modelReset,
+            widget.itemSelectionChanged,
+        ]
+    raise TypeError(f"No change signal for widget: {widget}")
@@ -0,0 +1,82 @@
+from PyQt5.QtCore import QObject, QPoint, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+# make imports optional for pytests
+try:
+    from qgis.gui import QgsMapTool, QgsRubberBand
+    from qgis.core import QgsGeometry, QgsRectangle, QgsWkbTypes
+except ImportError:
+    # same signals and mouse events handling, without the canvas drawing
+    QgsMapTool = QObject
+
+
+def is_click(press_pos: QPoint, release_pos: QPoint) -> bool:
+    """Mouse released (almost) where it was pressed: a click, not a drag."""
+    return (
+        release_pos - press_pos
+    ).manhattanLength() < QApplication.startDragDistance()
+
+
+class MapSelectionTool(QgsMapTool):
+    """Click (point) or drag (rectangle) on the map canvas to select the resources.
+    QgsMapToolExtent is not used: it gives an empty rectangle for a click, not the clicked point.
+    """
+
+    pointClicked = pyqtSignal(float, float)  # x, y
+    rectangleSelected = pyqtSignal(float, float, float, float)  # xmin, ymin, xmax, ymax
+
+    def __init__(self, canvas):
+        super().__init__(canvas)
+        self._canvas = canvas
+        self._press_pos: QPoint | None = None
+        self._rubber_band = None
+
+    def canvasPressEvent(self, e):
+        self._press_pos = e.pos()
+
+    def canvasMoveEvent(self, e):
+        if self._press_pos is None or is_click(self._press_pos, e.pos()):
+            return
+        try:
+            if self._rubber_band is None:
+                self._rubber_band = QgsRubberBand(
+                    self._canvas, QgsWkbTypes.PolygonGeometry
+                )
+            xmin, ymin, xmax, ymax = self._map_box(self._press_pos, e.pos())
+            self._rubber_band.setToGeometry(
+                QgsGeometry.fromRect(QgsRectangle(xmin, ymin, xmax, ymax)), None
+            )
+        except NameError:
+            # no QGIS (pytests)
+            pass
+
+    def canvasReleaseEvent(self, e):
+        press_pos, self._press_pos = self._press_pos, None
+        self._reset_rubber_band()
+        if press_pos is None:
+            return
+
+        if is_click(press_pos, e.pos()):
+            point = self.toMapCoordinates(e.pos())
+            self.pointClicked.emit(point.x(), point.y())
+        else:
+            self.rectangleSelected.emit(*self._map_box(press_pos, e.pos()))
+
+    def deactivate(self):
+        self._press_pos = None
+        self._reset_rubber_band()
+        super().deactivate()
+
+    def _map_box(self, pos: QPoint, other_pos: QPoint) -> tuple[float, ...]:
+        point = self.toMapCoordinates(pos)
+        other_point = self.toMapCoordinates(other_pos)
+        return (
+            min(point.x(), other_point.x()),
+            min(point.y(), other_point.y()),
+            max(point.x(), other_point.x()),
+            max(point.y(), other_point.y()),
+        )
+
+    def _reset_rubber_band(self):
+        if self._rubber_band is not None:
+            self._rubber_band.reset(QgsWkbTypes.PolygonGeometry)
@@ -0,0 +1,141 @@
+from typing import Any
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+
+class ResourcesListModel(QAbstractListModel):
+    """List model of the resource names of ConfigData.resources.
+    refresh() compares the names shown with the current resources and emits only the rows
+    inserted, removed or moved, so the views keep their selection and scroll position.
+    """
+
+    def __init__(self, resources=None, parent=None):
+        super().__init__(parent)
+        self._resources = resources
+        self._names: list[str] = list(resources) if resources is not None else []
+
+    # QAbstractListModel interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._names):
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._names[index.row()]
+        return None
+
+    # updates from ConfigData
+
+    @property
+    def resources(self):
+        return self._resources
+
+    def set_resources(self, resources):
+        """Show another resources mapping (e.g. of a newly opened file): the views are reset."""
+        self.beginResetModel()
+        self._resources = resources
+        self._names = list(resources)
+        self.endResetModel()
+
+    def resource_name(self, row: int) -> str:
+        return self._names[row]
+
+    def row_of(self, name: str) -> int:
+        """Row of the resource, -1 if it is not in the list."""
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
+
+    def resource_changed(self, name: str):
+        """Notify the views that the resource data changed (without being added, removed or renamed)."""
+        row = self.row_of(name)
+        if row >= 0:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    def refresh(self):
+        """Update the list to the current resources: remove, move and insert only the affected rows."""
+        new_names = list(self._resources)
+        if new_names == self._names:
+            return
+
+        new_set = set(new_names)
+        self._remove_rows(
+            [row for row, n in enumerate(self._names) if n not in new_set]
+        )
+
+        # kept names in a different order: move the persistent indexes to their new rows
+        old_set = set(self._names)
+        kept_names = [name for name in new_names if name in old_set]
+        if kept_names != self._names:
+            self._reorder_rows(kept_names)
+
+        self._insert_rows(new_names)
+
+    def _remove_rows(self, rows: list[int]):
+        # contiguous ranges, from the end so that the rows before do not move
+        while rows:
+            last = first = rows.pop()
+            while rows and rows[-1] == first - 1:
+                first = rows.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._names[first : last + 1]
+            self.endRemoveRows()
+
+    def _reorder_rows(self, names: list[str]):
+        self.layoutAboutToBeChanged.emit()
+        new_rows = {name: row for row, name in enumerate(names)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [
+                self.index(new_rows[self._names[index.row()]], 0)
+                for index in old_indexes
+            ],
+        )
+        self._names = names
+        self.layoutChanged.emit()
+
+    def _insert_rows(self, new_names: list[str]):
+        # the current names are in the same order as in new_names: insert the missing ones in between
+        old_set = set(self._names)
+        row = 0
+        while row < len(new_names):
+            if new_names[row] in old_set:
+                row += 1
+                continue
+            first = row
+            while row < len(new_names) and new_names[row] not in old_set:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._names[first:first] = new_names[first:row]
+            self.endInsertRows()
+
+
+class ResourcesFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the resources found by the search (see ResourceSearchIndex) and selected on the map
+    (see ResourceExtentsIndex), all if no search and no map selection."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._matching_names: set[str] | None = None
+        self._map_names: set[str] | None = None
+
+    def set_matching_names(self, names: set[str] | None):
+        self._matching_names = names
+        self.invalidateFilter()
+
+    def set_map_names(self, names: set[str] | None):
+        self._map_names = names
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        name = self.sourceModel().resource_name(source_row)
+        if self._matching_names is not None and name not in self._matching_names:
+            return False
+        return self._map_names is None or name in self._map_names
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import json
 from typing import TYPE_CHECKING
 
 from ..models.top_level import ResourceConfigTemplate
@@ -14,21 +13,27 @@ from ..models.top_level.providers.records import (
     TrsAuthorities,
 )
 
-from ..models.top_level.utils import (
-    STRING_SEPARATOR,
-)
-
 from .utils import set_combo_box_value_from_data
+from .MapSelectionTool import MapSelectionTool
+from ..models.tracing import traced
 
 from .ui_setter_utils import (
     clear_layout,
+    create_extents_overview_layer,
     create_rect_layer_from_bbox,
+    update_extents_overview_layer,
+    update_rect_layer_from_bbox,
     fill_combo_box,
+    link_to_text,
+    list_data_to_text,
+    locale_value_to_text,
     pack_locales_data_into_list,
-    pack_list_data_into_list_widget,
+    pack_values_into_list_widget,
+    provider_to_text,
     select_list_widget_items_by_texts,
 )
 from .utils import get_widget_text_value, reset_widget
+from .DataListItem import DataListItem
 
 
 from PyQt5.QtGui import QIntValidator
@@ -36,7 +41,7 @@ from PyQt5.QtCore import (
     QRegularExpression,
     Qt,
 )
-from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtWidgets import QAbstractItemView, QDialogButtonBox, QMessageBox
 
 # make imports optional for pytests
 try:
@@ -51,7 +56,7 @@ except:
 if TYPE_CHECKING:
     # preserve type checking, but don't import in runtime to avoid circular import
     from ..pygeoapi_config_dialog import PygeoapiConfigDialog
-    from ..models.ConfigData import ConfigData
+    from ..models.ConfigData import ConfigData, ReloadChanges
 
 
 class UiSetter:
@@ -61,8 +66,18 @@ class UiSetter:
     def __init__(self, dialog: PygeoapiConfigDialog):
         self.dialog = dialog
 
+    @traced()
     def set_ui_from_data(self):
         """Set values for all main UI tabs from ConfigData."""
+        self.set_server_ui_from_data()
+        self.set_logging_ui_from_data()
+        self.set_metadata_ui_from_data()
+
+        # collections
+        self.refresh_resources_list_ui()
+
+    def set_server_ui_from_data(self):
+        """Set values of 'server' widgets from ConfigData."""
         config_data: ConfigData = self.dialog.config_data
 
         # bind
@@ -124,6 +139,13 @@ class UiSetter:
             value=config_data.server.limits.on_exceed,
         )
 
+        # widgets show the data: not edited
+        self.dialog.data_from_ui_setter.dirty_tracker.mark_clean("server")
+
+    def set_logging_ui_from_data(self):
+        """Set values of 'logging' widgets from ConfigData."""
+        config_data: ConfigData = self.dialog.config_data
+
         # logging
         set_combo_box_value_from_data(
             combo_box=self.dialog.comboBoxLog,
@@ -145,6 +167,12 @@ class UiSetter:
         else:
             self.dialog.lineEditDateformat.setText("")
 
+        self.dialog.data_from_ui_setter.dirty_tracker.mark_clean("logging")
+
+    def set_metadata_ui_from_data(self):
+        """Set values of 'metadata' widgets from ConfigData."""
+        config_data: ConfigData = self.dialog.config_data
+
         # metadata identification
 
         # DATA WITH LOCALES
@@ -234,17 +262,84 @@ class UiSetter:
             value=config_data.metadata.contact.role,
         )
 
-        # collections
-        self.refresh_resources_list_ui()
+        self.dialog.data_from_ui_setter.dirty_tracker.mark_clean("metadata")
+
+    def set_ui_from_reload_changes(self, changes: ReloadChanges):
+        """Refresh only the widgets affected by the data changed on reload."""
+        dialog = self.dialog
+        section_ui_setters = {
+            "server": self.set_server_ui_from_data,
+            "logging": self.set_logging_ui_from_data,
+            "metadata": self.set_metadata_ui_from_data,
+        }
+        for section_name in changes.sections:
+            section_ui_setters[section_name]()
+
+        if changes.resources_list_changed or changes.changed_resources:
+            self.refresh_resources_list_ui(changed_resources=changes.changed_resources)
+
+        current_res_name = dialog.current_res_name
+        if current_res_name == "":
+            return
+
+        if current_res_name in changes.removed_resources:
+            # resource is gone: back to the generic preview
+            dialog.current_res_name = ""
+            self.preview_resource()
+        elif current_res_name in changes.changed_resources:
+            if not dialog.groupBoxCollectionLoaded.isHidden():
+                self.set_resource_ui_from_data(
+                    dialog.config_data.resources[current_res_name]
+                )
+            else:
+                self.select_listcollection_item_by_text(current_res_name)
+                self.preview_resource(dialog.listViewCollection.currentIndex())
+        elif changes.resources_list_changed:
+            # keep the selection in the refreshed list
+            self.select_listcollection_item_by_text(current_res_name)
+
+    def refresh_resources_list_ui(self, changed_resources: list[str] = ()):
+        """Refresh ListView and search index with resources from ConfigData: only the added, removed or moved rows
+        are updated, and only the added and changed_resources are indexed again."""
+        dialog = self.dialog
+        resources = dialog.config_data.resources
+        if dialog.model.resources is not resources:
+            # another ConfigData (e.g. opened file)
+            dialog.model.set_resources(resources)
+            dialog.search_index.build(resources)
+            dialog.extents_index.build(resources)
+            self.refresh_extents_overview()
+            dialog.proxy.set_map_names(None)
+        else:
+            dialog.model.refresh()
+            dialog.search_index.sync(resources, changed_resources)
+            self.refresh_extents_overview(
+                dialog.extents_index.sync(resources, changed_resources)
+            )
+            for res_name in changed_resources:
+                dialog.model.resource_changed(res_name)
+
+        # filter the new and changed rows too
+        dialog.filterResources(dialog.lineEditCollection.text())
 
-    def refresh_resources_list_ui(self):
-        """Refresh ListWidget with resources from ConfigData."""
-        self.dialog.model.setStringList(
-            [k for k, _ in self.dialog.config_data.resources.items()]
+    def refresh_extents_overview(self, res_names: set[str] | None = None):
+        """Update the features of res_names in the extents overview layer (all if None)."""
+        dialog = self.dialog
+        if getattr(dialog, "bbox_overview_layer", None) is None:
+            # no QGIS (pytests)
+            return
+
+        if res_names is None:
+            dialog.bbox_overview_layer.dataProvider().truncate()
+            dialog.bbox_overview_feature_ids = {}
+            res_names = dialog.config_data.resources
+        update_extents_overview_layer(
+            dialog.bbox_overview_layer,
+            dialog.bbox_overview_feature_ids,
+            {name: dialog.extents_index.boxes(name) for name in res_names},
         )
-        self.dialog.proxy.setSourceModel(self.dialog.model)
-        self.dialog.listViewCollection.setModel(self.dialog.proxy)
 
+    @traced()
     def set_resource_ui_from_data(self, res_data: ResourceConfigTemplate):
         """Set values for Resource UI from resource data."""
         dialog = self.dialog
@@ -345,43 +440,35 @@ class UiSetter:
             )
 
         # links
-        pack_list_data_into_list_widget(
-            [
-                [l.type, l.rel, l.href, l.title, l.hreflang, l.length]
-                for l in res_data.links
-            ],
-            dialog.listWidgetResLinks,
+        pack_values_into_list_widget(
+            res_data.links, dialog.listWidgetResLinks, link_to_text
         )
 
         # providers
         self.set_providers_ui_from_data(res_data)
 
+        dialog.data_from_ui_setter.dirty_tracker.mark_clean("resource")
+
     def set_providers_ui_from_data(self, res_data: ResourceConfigTemplate):
         """Setting provider data separately, to not refresh entire UI when adding a provider.
         Resreshing all when adding a provider can lead to loosing other unsaved data from the Resource UI.
         """
         dialog = self.dialog
 
-        data_lists = []
-        read_only_data_lists = []
-        for p in res_data.providers:
-
-            if isinstance(p, dict):  # provider type not supported yet
-                read_only_data_lists.append(str(json.dumps(p)))
-            else:
-
-                data_chunk: list = p.pack_data_to_list()
-                data_lists.append(data_chunk)
-
-        pack_list_data_into_list_widget(
-            data_lists,
+        pack_values_into_list_widget(
+            [p for p in res_data.providers if not isinstance(p, dict)],
             dialog.listWidgetResProvider,
+            provider_to_text,
         )
-        pack_list_data_into_list_widget(
-            read_only_data_lists,
+        # provider type not supported yet
+        pack_values_into_list_widget(
+            [p for p in res_data.providers if isinstance(p, dict)],
             dialog.listWidgetResReadOnlyProviders,
+            provider_to_text,
         )
 
+        dialog.data_from_ui_setter.dirty_tracker.mark_clean("resource.providers")
+
     def customize_ui_on_launch(self):
         """Pre-fill ComboBoxes, assign validators to LineEdits where needed."""
         dialog = self.dialog
@@ -399,6 +486,9 @@ class UiSetter:
             config_data.metadata.contact.role,
         )
 
+        # providers can be reordered by drag and drop (the entries hold the providers)
+        dialog.listWidgetResProvider.setDragDropMode(QAbstractItemView.InternalMove)
+
         # add default values to the Resource UI
         fill_combo_box(
             dialog.comboBoxResType,
@@ -440,10 +530,40 @@ class UiSetter:
         # resource content size
         self.dialog.addResLinksLengthLineEdit.setValidator(QIntValidator())
 
+        # reload buttons next to Open/Save
+        dialog.reloadButton = dialog.buttonBox.addButton(
+            "Reload", QDialogButtonBox.ActionRole
+        )
+        dialog.reloadButton.setToolTip(
+            "Re-read the open file, updating only the changed sections and collections"
+        )
+        dialog.autoReloadButton = dialog.buttonBox.addButton(
+            "Auto-reload", QDialogButtonBox.ActionRole
+        )
+        dialog.autoReloadButton.setCheckable(True)
+        dialog.autoReloadButton.setToolTip(
+            "Reload the open file automatically when it is modified on disk"
+        )
+        dialog.checkUrlsButton = dialog.buttonBox.addButton(
+            "Check URLs", QDialogButtonBox.ActionRole
+        )
+        dialog.checkUrlsButton.setToolTip(
+            "Request the links, CRS and service URLs of all collections"
+        )
+
     def setup_map_widget(self):
+        """Show the whole base map. The canvas and its layers are created once, and kept for the dialog's lifetime."""
         try:  # using qgis imports, so we should ignore for pytests
             dialog = self.dialog
 
+            if getattr(dialog, "bbox_map_canvas", None) is not None:
+                # generic preview: extents of all resources
+                dialog.bbox_map_canvas.setLayers(
+                    [dialog.bbox_overview_layer, dialog.bbox_base_layer]
+                )
+                dialog.bbox_map_canvas.zoomToFullExtent()
+                return
+
             # Define base tile layer (OSM)
             urlWithParams = (
                 "type=xyz&url=https://tile.openstreetmap.org/{z}/{x}/{y}.png"
@@ -452,22 +572,64 @@ class UiSetter:
                 urlWithParams, "OpenStreetMap", "wms"
             )
 
+            # persistent layer of the resource extents, its rectangle is moved on selection
+            dialog.bbox_extents_layer = create_rect_layer_from_bbox(
+                [-180, -90, 180, 90]
+            )
+
+            # persistent layer of the extents of all resources (features by resource name)
+            dialog.bbox_overview_layer = create_extents_overview_layer()
+            dialog.bbox_overview_feature_ids = {}
+
             # Create QgsMapCanvas with OSM layer
             dialog.bbox_map_canvas = QgsMapCanvas()
             crs = QgsCoordinateReferenceSystem("EPSG:4326")
             dialog.bbox_map_canvas.setDestinationCrs(crs)
             dialog.bbox_map_canvas.setCanvasColor(Qt.white)
-            dialog.bbox_map_canvas.setLayers([dialog.bbox_base_layer])
+            # base map is not rendered again when only the extents layer changes
+            dialog.bbox_map_canvas.setCachingEnabled(True)
+            dialog.bbox_map_canvas.setLayers(
+                [dialog.bbox_overview_layer, dialog.bbox_base_layer]
+            )
             dialog.bbox_map_canvas.zoomToFullExtent()
             # self.canvas.setExtent(layer.extent(), True)
             # self.canvas.refreshAllLayers()
 
+            # click or drag a rectangle to select the resources
+            dialog.bbox_map_tool = MapSelectionTool(dialog.bbox_map_canvas)
+            dialog.bbox_map_tool.pointClicked.connect(dialog.select_resources_at_point)
+            dialog.bbox_map_tool.rectangleSelected.connect(
+                dialog.select_resources_in_rectangle
+            )
+            dialog.bbox_map_canvas.setMapTool(dialog.bbox_map_tool)
+            self.refresh_extents_overview()
+
             # Add QgsMapCanvas as a widget to the Resource Tab
             clear_layout(dialog.bboxMapPlaceholder)
             dialog.bboxMapPlaceholder.addWidget(dialog.bbox_map_canvas)
         except NameError:
             pass
 
+    def show_bbox_on_map(self, bbox: list[float]):
+        """Move the extents rectangle to the bbox and zoom to it, reusing the canvas and layers."""
+        dialog = self.dialog
+        if getattr(dialog, "bbox_map_canvas", None) is None:
+            # no QGIS (pytests)
+            return
+
+        update_rect_layer_from_bbox(dialog.bbox_extents_layer, bbox)
+        layers = [
+            dialog.bbox_extents_layer,
+            dialog.bbox_overview_layer,
+            dialog.bbox_base_layer,
+        ]
+        if dialog.bbox_map_canvas.layers() != layers:
+            dialog.bbox_map_canvas.setLayers(layers)
+        # self.bbox_map_canvas.zoomToFullExtent()
+        dialog.bbox_map_canvas.setExtent(dialog.bbox_extents_layer.extent(), True)
+        # self.canvas.refreshAllLayers()
+
+    @traced()
     def preview_resource(self, model_index: "QModelIndex" = None):
         dialog = self.dialog
 
@@ -506,27 +668,21 @@ class UiSetter:
             dialog.current_res_name
         ].extents.spatial.bbox
 
-        dialog.bbox_extents_layer = create_rect_layer_from_bbox(bbox)
-        dialog.bbox_map_canvas.setLayers(
-            [dialog.bbox_extents_layer, dialog.bbox_base_layer]
-        )
-        # self.bbox_map_canvas.zoomToFullExtent()
-        dialog.bbox_map_canvas.setExtent(dialog.bbox_extents_layer.extent(), True)
-        # self.canvas.refreshAllLayers()
+        self.show_bbox_on_map(bbox)
 
     def select_listcollection_item_by_text(self, target_text: str):
         dialog = self.dialog
 
-        model = dialog.listViewCollection.model()
-        for row in range(model.rowCount()):
-            index = model.index(row, 0)
-            if model.data(index) == target_text:
+        row = dialog.model.row_of(target_text)
+        if row >= 0:
+            index = dialog.proxy.mapFromSource(dialog.model.index(row, 0))
+            # filtered out: nothing to select
+            if index.isValid():
                 dialog.listViewCollection.setCurrentIndex(index)
-                break
 
     def _lang_entry_exists_in_list_widget(self, list_widget, locale) -> bool:
         for i in range(list_widget.count()):
-            if list_widget.item(i).text().startswith(f"{locale}: "):
+            if list_widget.item(i).data(Qt.UserRole)[0] == locale:
                 QMessageBox.warning(
                     self.dialog,
                     "Message",
@@ -550,21 +706,21 @@ class UiSetter:
         text = line_edit_widget.text().strip()
         if text:
 
-            text_to_print = text
             if locale_combobox:
-                # get text with locale
+                # (locale, text) entry
                 locale = locale_combobox.currentText()
-                text_to_print = f"{locale}: {text}"
 
                 # check if repeated language entries are allowed
                 if allow_repeated_locale or not self._lang_entry_exists_in_list_widget(
                     list_widget, locale
                 ):
-                    list_widget.addItem(text_to_print)
+                    list_widget.addItem(
+                        DataListItem((locale, text), locale_value_to_text)
+                    )
                     line_edit_widget.clear()
 
             else:
-                list_widget.addItem(text_to_print)
+                list_widget.addItem(DataListItem(text))
                 line_edit_widget.clear()
 
             # sort the content
@@ -577,12 +733,14 @@ class UiSetter:
         line_widgets_mandatory: list,
         line_widgets_optional: list,
         list_widget,
+        create_value,
+        to_text=list_data_to_text,
         sort=False,
     ):
-        """Add new QListWidget entry from combined data from several widgets (e.g. Providers, Links)."""
+        """Add new QListWidget entry with the value created from the texts of several widgets (e.g. Links)."""
         dialog = self.dialog
 
-        final_text = ""
+        texts = []
         mandatory_fields_count = len(line_widgets_mandatory)
         for i, widget in enumerate(line_widgets_mandatory + line_widgets_optional):
             text = get_widget_text_value(widget)
@@ -591,14 +749,17 @@ class UiSetter:
             if i < mandatory_fields_count and not text:
                 QMessageBox.warning(dialog, "Warning", "Mandatory field is empty")
                 return
+            texts.append(text)
 
-            # add separator if not the first value
-            if len(final_text) > 0:
-                final_text += STRING_SEPARATOR
-            final_text += text
-            reset_widget(widget)
+        try:
+            value = create_value(texts)
+        except ValueError as e:
+            QMessageBox.warning(dialog, "Warning", f"Invalid value: {e}")
+            return
 
-        list_widget.addItem(final_text)
+        for widget in line_widgets_mandatory + line_widgets_optional:
+            reset_widget(widget)
+        list_widget.addItem(DataListItem(value, to_text))
 
         # sort the content
         if sort:
@@ -1,15 +1,15 @@
-from ..models.top_level.utils import STRING_SEPARATOR
+from PyQt5.QtCore import Qt
+
+from ..models.top_level import ResourceLinkTemplate
+from ..models.top_level.providers.records import Languages
+from ..models.top_level.utils import get_enum_value_from_string, is_valid_string
 
 
 def unpack_locales_values_list_to_dict(list_widget, allow_list_per_locale: bool):
-    # unpack string values with locales
+    # unpack (locale, text) values
 
     all_locales_dict = {}
-    for i in range(list_widget.count()):
-        full_line_text = list_widget.item(i).text()
-        locale = full_line_text.split(": ", 1)[0]
-        value = full_line_text.split(": ", 1)[1]
-
+    for locale, value in list_widget_values(list_widget):
         if allow_list_per_locale:  # for multiple entries per language
             if locale not in all_locales_dict:
                 all_locales_dict[locale] = []
@@ -20,21 +20,25 @@ def unpack_locales_values_list_to_dict(list_widget, allow_list_per_locale: bool)
     return all_locales_dict
 
 
-def unpack_listwidget_values_to_sublists(
-    list_widget, expected_members: int | None = None
-) -> list[list]:
-
-    all_sublists = []
-    for i in range(list_widget.count()):
-
-        # using count to access data entries of 'list_widget' via .item(i)
-        full_line_text = list_widget.item(i).text()
-        values = full_line_text.split(STRING_SEPARATOR)
-
-        if expected_members and len(values) != expected_members:
-            raise ValueError(
-                f"Not enough values to unpack in {list_widget}: {len(all_sublists)}. Expected: {expected_members}"
-            )
-        all_sublists.append(values)
-
-    return all_sublists
+def list_widget_values(list_widget) -> list:
+    """Values of all the entries of the QListWidget (see DataListItem), in the displayed order."""
+    return [list_widget.item(i).data(Qt.UserRole) for i in range(list_widget.count())]
+
+
+def link_from_values(values: list[str]) -> ResourceLinkTemplate:
+    """New link from the values of the Link widgets: type, rel, href, title, hreflang, length."""
+    new_link = ResourceLinkTemplate()
+    new_link.type = values[0]
+    new_link.rel = values[1]
+    new_link.href = values[2]
+
+    if is_valid_string(values[3]):
+        new_link.title = values[3]
+    if is_valid_string(values[4]):
+        new_link.hreflang = get_enum_value_from_string(
+            Languages,
+            values[4],
+        )
+    if is_valid_string(values[5]):
+        new_link.length = int(values[5])
+    return new_link
@@ -67,6 +67,7 @@ def add_widgets_to_grid_by_specs(
                 )
                 group_layout.addWidget(new_widgets["label"], i, 0)
                 group_layout.addWidget(new_widgets["line_edit"], i, 1)
+                data_widget = new_widgets["line_edit"]
 
                 if data_type is int:
                     new_widgets["line_edit"].setValidator(QIntValidator())
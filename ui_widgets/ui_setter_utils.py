@@ -1,4 +1,9 @@
 from enum import Enum
+import json
+
+from .DataListItem import DataListItem
+from ..models.top_level import ResourceLinkTemplate
+from ..models.top_level.providers import ProviderTemplate
 from ..models.top_level.utils import STRING_SEPARATOR, is_valid_string
 
 # make imports optional for pytests
@@ -37,30 +42,92 @@ def clear_layout(layout):
 
 def create_rect_layer_from_bbox(bbox: list[float], layer_name="Rectangle"):
 
-    xmin, ymin, xmax, ymax = bbox
     # Create memory vector layer with polygon geometry
     layer = QgsVectorLayer("Polygon?crs=EPSG:4326", layer_name, "memory")
-    provider = layer.dataProvider()
     crs = QgsCoordinateReferenceSystem("EPSG:4326")
     layer.setCrs(crs)
+    _apply_red_transparent_style(layer)
+
+    update_rect_layer_from_bbox(layer, bbox)
+
+    # QgsProject.instance().addMapLayer(layer)
+    return layer
+
+
+def update_rect_layer_from_bbox(layer, bbox: list[float]):
+    """Move the rectangle of the layer (created by create_rect_layer_from_bbox) to the bbox, in place."""
+
+    xmin, ymin, xmax, ymax = bbox
+    provider = layer.dataProvider()
 
     # Create rectangular geometry from bbox
     rect = QgsRectangle(xmin, ymin, xmax, ymax)
     geom = QgsGeometry.fromRect(rect)
 
-    # Create feature and assign geometry
-    feature = QgsFeature()
-    feature.setGeometry(geom)
-    provider.addFeatures([feature])
+    # Replace the geometry of the existing feature, or create it
+    feature_ids = [feature.id() for feature in provider.getFeatures()]
+    if feature_ids:
+        provider.changeGeometryValues({feature_ids[0]: geom})
+    else:
+        feature = QgsFeature()
+        feature.setGeometry(geom)
+        provider.addFeatures([feature])
 
     # Update layer
     layer.updateExtents()
-    _apply_red_transparent_style(layer)
+    layer.triggerRepaint()
 
-    # QgsProject.instance().addMapLayer(layer)
+
+def create_extents_overview_layer(layer_name="Extents"):
+    """Memory layer of all the resources extents, with the resource name of each feature."""
+
+    layer = QgsVectorLayer(
+        "Polygon?crs=EPSG:4326&field=name:string", layer_name, "memory"
+    )
+    # outlines only, the map stays readable with thousands of extents
+    symbol = QgsFillSymbol.createSimple(
+        {
+            "style": "no",
+            "outline_color": "0,0,255,128",
+            "outline_width": "0.2",
+        }
+    )
+    layer.renderer().setSymbol(symbol)
     return layer
 
 
+def update_extents_overview_layer(
+    layer, feature_ids: dict[str, list[int]], boxes_by_name: dict[str, list]
+):
+    """Replace the features of the given resources by their boxes (no boxes: removed),
+    keeping the features of the others. feature_ids (resource name: feature ids) is updated.
+    """
+
+    provider = layer.dataProvider()
+    old_ids = [fid for name in boxes_by_name for fid in feature_ids.pop(name, [])]
+    if old_ids:
+        provider.deleteFeatures(old_ids)
+
+    features = []
+    names = []
+    for name, boxes in boxes_by_name.items():
+        for xmin, ymin, xmax, ymax in boxes:
+            feature = QgsFeature(layer.fields())
+            feature.setGeometry(
+                QgsGeometry.fromRect(QgsRectangle(xmin, ymin, xmax, ymax))
+            )
+            feature.setAttributes([name])
+            features.append(feature)
+            names.append(name)
+    if features:
+        _, added_features = provider.addFeatures(features)
+        for name, feature in zip(names, added_features):
+            feature_ids.setdefault(name, []).append(feature.id())
+
+    layer.updateExtents()
+    layer.triggerRepaint()
+
+
 def _apply_red_transparent_style(layer):
     # Create a fill symbol with red color and 50% transparency
     symbol = QgsFillSymbol.createSimple(
@@ -77,14 +144,14 @@ def _apply_red_transparent_style(layer):
 
 
 def pack_locales_data_into_list(data, list_widget):
-    """Use ConfigData (list of strings, dict with strings, or a single string) to fill the UI widget list."""
+    """Use ConfigData (list of strings, dict with strings, or a single string) to fill the UI widget list
+    with (locale, text) entries."""
     list_widget.clear()
 
     # data can be string, list or dict (for properties like title, description, keywords)
     if isinstance(data, str):
         if is_valid_string(data):
-            value = f"en: {data}"
-            list_widget.addItem(value)
+            list_widget.addItem(DataListItem(("en", data), locale_value_to_text))
             return
 
     for key in data:
@@ -92,44 +159,64 @@ def pack_locales_data_into_list(data, list_widget):
             local_key_content = data[key]
             if isinstance(local_key_content, str):
                 if is_valid_string(local_key_content):
-                    value = f"{key}: {local_key_content}"
-                    list_widget.addItem(value)
+                    list_widget.addItem(
+                        DataListItem((key, local_key_content), locale_value_to_text)
+                    )
             else:  # list
                 for local_key in local_key_content:
                     if is_valid_string(local_key):
-                        value = f"{key}: {local_key}"
-                        list_widget.addItem(value)
+                        list_widget.addItem(
+                            DataListItem((key, local_key), locale_value_to_text)
+                        )
         elif isinstance(data, list):  # list of strings
             if is_valid_string(key):
-                value = f"en: {key}"
-                list_widget.addItem(value)
+                list_widget.addItem(DataListItem(("en", key), locale_value_to_text))
 
 
-def pack_list_data_into_list_widget(data: list[list | str], list_widget):
+def pack_values_into_list_widget(values: list, list_widget, to_text=str):
+    """Fill the UI widget list with the values (e.g. Links, Providers), displayed with to_text."""
     list_widget.clear()
 
-    for line_data in data:
-        all_elements = []
+    for value in values:
+        list_widget.addItem(DataListItem(value, to_text))
+
 
-        if isinstance(line_data, str):  # if Provider type not supported yet
-            all_elements.append(line_data)
+def locale_value_to_text(locale_value: tuple[str, str]) -> str:
+    return f"{locale_value[0]}: {locale_value[1]}"
 
+
+def link_to_text(link: ResourceLinkTemplate) -> str:
+    return list_data_to_text(
+        [link.type, link.rel, link.href, link.title, link.hreflang, link.length]
+    )
+
+
+def provider_to_text(provider: ProviderTemplate | dict) -> str:
+    if isinstance(provider, dict):  # provider type not supported yet
+        return str(json.dumps(provider))
+    return list_data_to_text(provider.pack_data_to_list())
+
+
+def list_data_to_strings(line_data: list) -> list[str]:
+    """Values of a QListWidget entry (e.g. Provider, Link) as strings, as shown and edited in the UI."""
+    all_elements = []
+    for d in line_data:
+        if d is not None:
+            if isinstance(d, list):
+                # convert list to a string without brackets (e.g. for bbox)
+                all_elements.append(",".join(d))
+            elif isinstance(d, Enum):  # e.g. Languages Enum
+                all_elements.append(str(d.value))
+            else:
+                all_elements.append(str(d))
         else:
-            for d in line_data:
-                # convert all values to strings and joint with SEPARATOR symbol
-                if d is not None:
-                    if isinstance(d, list):
-                        # convert list to a string without brackets (e.g. for bbox)
-                        all_elements.append(",".join(d))
-                    elif isinstance(d, Enum):  # e.g. Languages Enum
-                        all_elements.append(str(d.value))
-                    else:
-                        all_elements.append(str(d))
-                else:
-                    all_elements.append("")
-
-        text_entry = STRING_SEPARATOR.join(all_elements)
-        list_widget.addItem(text_entry)
+            all_elements.append("")
+    return all_elements
+
+
+def list_data_to_text(line_data: list) -> str:
+    """Displayed text of a QListWidget entry (e.g. Provider, Link) from the list of its values."""
+    return STRING_SEPARATOR.join(list_data_to_strings(line_data))
 
 
 def select_list_widget_items_by_texts(*, list_widget, texts_to_select):
@@ -1,9 +1,11 @@
 from enum import Enum
-import requests
-from urllib.parse import urlparse
 
 from PyQt5.QtWidgets import QComboBox, QLineEdit, QMessageBox
 
+from ..models.crs_registry import CrsStatus, validate_crs_uri
+from ..models.tracing import span
+from ..models.url_checker import check_url
+
 
 def get_widget_text_value(widget):
     if isinstance(widget, QLineEdit):
@@ -44,46 +46,29 @@ def set_combo_box_value_from_data(*, combo_box, value):
         combo_box.clear()
 
 
-def _is_url_responsive(url: str) -> bool:
-
-    parsed_url = urlparse(url)
-    if not all([parsed_url.scheme, parsed_url.netloc]):
-        return False, "Invalid URL"
-
-    try:
-        # Detect OGC ExceptionReport (invalid request)
-        response = requests.get(url, allow_redirects=True, timeout=5)
-        if response.status_code != 200:
-            return False, f"HTTP response status code: {response.status_code}"
-        else:
-            text = response.text
-            if "ExceptionReport" in text or "ExceptionText" in text:
-                return False, "Invalid CRS URL"
-            return True, "Valid CRS URL"
-
-    except requests.ConnectionError:
-        # No internet or server unreachable
-        return False, "No internet connection or cannot reach server."
-
-    except requests.Timeout:
-        return False, "Request timed out."
-
-    except requests.RequestException:
-        return False, "Something went wrong with the request :("
+def get_url_status(url, parent=None, check_online: bool = True):
+    """Validate the CRS URI and show the result. URIs are validated locally (QGIS CRS database
+    or bundled code table); only the ones not found locally are requested online, if check_online.
+    """
 
+    with span("validate_crs_uri", url=url):
+        status, message = validate_crs_uri(url)
 
-def get_url_status(url, parent=None):
+    if status is CrsStatus.UNKNOWN and check_online:
+        # measure the network request only, not the message box
+        with span("get_url_status", url=url):
+            is_valid, message = check_url(url)
+        status = CrsStatus.VALID if is_valid else CrsStatus.INVALID
 
-    response = _is_url_responsive(url)
-    if response[0]:
+    if status is CrsStatus.VALID:
         QMessageBox.information(
             parent,
             "Information",
-            f"{response[1]}",
+            f"{message}",
         )
     else:
         QMessageBox.warning(
             parent,
             "Warning",
-            f"{response[1]}",
+            f"{message}",
         )